@@ -11,3 +11,5 @@ PARAMETER_ACTION_PREFIX = "__parameter_action"
 ACCORDION_DEFAULT_TITLE = "Select Page"
 VIZRO_ASSETS_PATH = Path(__file__).with_name("static")
 GAP_DEFAULT = "24px"
+# Number of points above which scatter traces are drawn with WebGL, which is the same as plotly express uses.
+WEBGL_THRESHOLD_DEFAULT = 1000
@@ -4,6 +4,9 @@ from collections import defaultdict
 from collections.abc import Mapping
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
 
 def _set_defaults_nested(supplied: Mapping[str, Any], defaults: Mapping[str, Any]) -> dict[str, Any]:
     supplied = defaultdict(dict, supplied)
@@ -13,3 +16,43 @@ def _set_defaults_nested(supplied: Mapping[str, Any], defaults: Mapping[str, Any
         else:
             supplied.setdefault(default_key, default_value)
     return dict(supplied)
+
+
+def _get_column_values(series: pd.Series) -> list[Any]:
+    """Returns the values of `series` as Python objects that are serialized to JSON as `series.tolist()` would be.
+
+    Missing values become `None`. Timezone-naive datetimes become the strings given by `Timestamp.isoformat`, which is
+    how they would be serialized anyway.
+    """
+    if not isinstance(series.dtype, np.dtype):
+        # Extension data types such as nullable integers, categoricals and timezone-aware datetimes.
+        return series.astype(object).where(series.notna(), None).tolist()
+    values = series.to_numpy()
+    if values.dtype.kind in "iub":
+        return values.tolist()
+    if values.dtype.kind == "f":
+        result = values.astype(object)
+        result[~np.isfinite(values)] = None
+        return result.tolist()
+    if values.dtype.kind == "M":
+        missing = np.isnat(values)
+        seconds = values.astype("datetime64[s]")
+        fraction = np.where(missing, np.timedelta64(0), values - seconds)
+        # Timestamp.isoformat gives microseconds only when they're not zero, and nanoseconds aren't handled here.
+        if not (fraction % np.timedelta64(1, "us")).any():
+            has_fraction = fraction.astype(bool)
+            result = np.datetime_as_string(seconds, unit="s").astype(object)
+            result[has_fraction] = np.datetime_as_string(values[has_fraction], unit="us")
+            result[missing] = None
+            return result.tolist()
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _to_records(data_frame: pd.DataFrame) -> list[dict[str, Any]]:
+    """Returns the rows of `data_frame` as a list of records like `data_frame.to_dict(orient="records")`.
+
+    The values are converted column by column to JSON types, so that Dash serializes the records without
+    converting each value on its own. This is much faster than serializing the records given by `to_dict`.
+    """
+    columns = [_get_column_values(data_frame.iloc[:, i]) for i in range(data_frame.shape[1])]
+    return [dict(zip(data_frame.columns, row)) for row in zip(*columns)]
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections import defaultdict
+from collections.abc import Collection, Hashable, Iterable
 from copy import deepcopy
-from typing import Any, Literal, TypedDict, cast
+from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
+import narwhals.stable.v1 as nw
+import numpy as np
 import pandas as pd
 
 from vizro._constants import NONE_OPTION
 from vizro.managers import data_manager, model_manager
-from vizro.managers._data_manager import DataSourceName
+from vizro.managers._data_manager import (
+    DataSourceName,
+    _copy_on_write_enabled,
+    _DynamicData,
+    _FilterPredicate,
+    _to_pandas,
+)
 from vizro.managers._model_manager import FIGURE_MODELS
 from vizro.models.types import (
     FigureType,
@@ -21,8 +30,16 @@ from vizro.models.types import (
     SingleValueType,
 )
 
+if TYPE_CHECKING:
+    from vizro.models import Filter
+
 ValidatedNoneValueType = SingleValueType | MultiValueType | None | list[None] | list[SingleValueType]
 
+# Filtered data for a single callback, keyed by the id of the unfiltered data and the ids of the selectors of the
+# filters applied to it. This lives only as long as the callback, during which the unfiltered data stays in memory and
+# each selector has a single value, so together these identify the filtered data. See _apply_filter_controls.
+FilteredDataCache = dict[tuple[int, tuple[ModelID, ...]], pd.DataFrame]
+
 
 # TODO-AV2 A 2: go through and finish tidying bits that weren't already. Potentially there won't be much code left here
 #  at all. Think about where it should live so it might become public in future. Is it just apply_controls and helper
@@ -50,31 +67,119 @@ class CallbackTriggerDict(TypedDict):
 
 # Utility functions for helper functions used in pre-defined actions ----
 def _apply_filter_controls(
-    data_frame: pd.DataFrame, ctds_filter: list[CallbackTriggerDict], target: ModelID
+    data_frame: pd.DataFrame,
+    ctds_filter: list[CallbackTriggerDict],
+    target: ModelID,
+    filtered_data_cache: FilteredDataCache | None = None,
+    pushed_down_selector_ids: Collection[ModelID] = (),
 ) -> pd.DataFrame:
     """Applies filters from a vm.Filter model in the controls.
 
     Args:
-        data_frame: unfiltered DataFrame.
+        data_frame: unfiltered DataFrame. This can also be data in another format such as a Polars DataFrame, which is
+            converted to pandas. See _apply_native_filter_controls.
         ctds_filter: list of CallbackTriggerDict for filters.
         target: id of targeted Figure.
+        filtered_data_cache: cache of filtered data shared between targets in the same callback. Targets that use the
+            same unfiltered data and are targeted by the same filters reuse the data that was filtered for the first
+            one rather than filtering it again.
+        pushed_down_selector_ids: ids of the selectors of filters that were already applied when the data was loaded.
+            See _get_pushed_down_filters.
 
     Returns: filtered DataFrame.
     """
     from vizro.models import Filter
     from vizro.models._controls._controls_utils import get_selector_parent_control
 
+    target_ctds_filter = []
     for ctd in ctds_filter:
-        selector_id = ctd["id"]
-        parent_filter = cast(Filter, get_selector_parent_control(selector=model_manager[selector_id]))
-        if target not in parent_filter.targets:
+        if ctd["id"] in pushed_down_selector_ids:
             continue
+        parent_filter = cast(Filter, get_selector_parent_control(selector=model_manager[ctd["id"]]))
+        if target in parent_filter.targets:
+            target_ctds_filter.append((ctd, parent_filter))
+
+    # Data that no filter applies to is returned as it is, like the data of targets that aren't filtered at all.
+    filtered = bool(target_ctds_filter)
+    cache_key = (id(data_frame), tuple(ctd["id"] for ctd, _ in target_ctds_filter))
+    if filtered_data_cache is not None and cache_key in filtered_data_cache:
+        return _copy_filtered_data(filtered_data_cache[cache_key]) if filtered else data_frame
+
+    if not isinstance(data_frame, pd.DataFrame):
+        data_frame, target_ctds_filter = _apply_native_filter_controls(data_frame, target_ctds_filter)
+
+    # Rather than indexing the whole DataFrame with each filter's mask in turn, which would copy it for every filter,
+    # we track the positions of the rows that pass the filters applied so far and index the DataFrame just once at the
+    # end. Each filter only needs to evaluate its own column for the rows that are still left. The exception is data
+    # that has a version, for which filters use indexes of the whole column that are built once per data version. See
+    # DataManager._get_data_version.
+    data_version = data_manager._get_data_version(data_frame)
+    positions: np.ndarray | None = None
+    for ctd, parent_filter in target_ctds_filter:
+        column = data_frame[parent_filter._filter_column]
+        if data_version is not None:
+            mask = np.asarray(parent_filter._filter_function(column, ctd["value"], data_version), dtype=bool)
+            if positions is not None:
+                mask = mask[positions]
+        else:
+            if positions is not None:
+                column = column.take(positions)
+            mask = np.asarray(parent_filter._filter_function(column, ctd["value"]), dtype=bool)
+        positions = np.flatnonzero(mask) if positions is None else positions[mask]
 
-        selector_value = ctd["value"]
-        mask = parent_filter._filter_function(data_frame[parent_filter._filter_column], selector_value)
-        data_frame = data_frame[mask]
+    # If no rows were filtered out then there's no need to copy the data at all.
+    filtered_data = data_frame if positions is None or len(positions) == len(data_frame) else data_frame.take(positions)
+
+    if filtered_data_cache is not None:
+        filtered_data_cache[cache_key] = filtered_data
+    return _copy_filtered_data(filtered_data) if filtered else filtered_data
+
+
+def _copy_filtered_data(data_frame: pd.DataFrame) -> pd.DataFrame:
+    """Returns a copy of filtered data for a single target.
+
+    Filtered data is shared between targets through the filtered data cache and is the unfiltered data itself if no
+    rows are filtered out, so each target gets its own copy in case it modifies its data. With Copy-on-Write, a shallow
+    copy is enough.
+    """
+    return data_frame.copy(deep=not _copy_on_write_enabled())
+
+
+def _get_filter_expression(predicate: _FilterPredicate) -> nw.Expr:
+    column, operator, value = predicate
+    if operator == "in":
+        return nw.col(column).is_in(value)
+    if operator == "==":
+        return nw.col(column) == value
+    if operator == ">=":
+        return nw.col(column) >= value
+    return nw.col(column) <= value
 
-    return data_frame
+
+def _apply_native_filter_controls(
+    data_frame: Any, target_ctds_filter: list[tuple[CallbackTriggerDict, Filter]]
+) -> tuple[pd.DataFrame, list[tuple[CallbackTriggerDict, Filter]]]:
+    """Applies filters to data that is not a pandas DataFrame, such as a Polars DataFrame or PyArrow Table.
+
+    The filters that can be given as predicates (see Filter._get_filter_predicates) are applied by the data's own
+    engine, which is often multithreaded, before the data is converted to pandas. This means that only the rows that are
+    left are converted.
+
+    Returns: filtered data converted to pandas, and the filters that are still to be applied to it.
+    """
+    expressions: list[nw.Expr] = []
+    remaining_ctds_filter = []
+    for ctd, parent_filter in target_ctds_filter:
+        predicates = parent_filter._get_filter_predicates(ctd["value"])
+        if predicates is None:
+            remaining_ctds_filter.append((ctd, parent_filter))
+        else:
+            expressions.extend(_get_filter_expression(predicate) for predicate in predicates)
+
+    native_data_frame = nw.from_native(data_frame, eager_only=True)
+    if expressions:
+        native_data_frame = native_data_frame.filter(*expressions)
+    return native_data_frame.to_pandas(), remaining_ctds_filter
 
 
 def _get_triggered_model(input_component_id: str) -> FigureType:
@@ -206,34 +311,162 @@ def _apply_filters(
     ctds_filter: list[CallbackTriggerDict],
     ctds_filter_interaction: list[dict[str, CallbackTriggerDict]],
     target: ModelID,
+    filtered_data_cache: FilteredDataCache | None = None,
+    pushed_down_selector_ids: Collection[ModelID] = (),
 ):
-    # Takes in just one target, so dataframe is filtered repeatedly for every target that uses it.
-    # Potentially this could be de-duplicated but it's not so important since filtering is a relatively fast
-    # operation (compared to data loading).
-    filtered_data = _apply_filter_controls(data_frame=data, ctds_filter=ctds_filter, target=target)
+    # Takes in just one target. To avoid filtering the same data repeatedly for every target that uses it, pass the
+    # same filtered_data_cache for all targets in a callback. Only filter controls are de-duplicated like this since
+    # filter interactions depend on the target. Filters that were pushed down into loading the data are skipped.
+    filtered_data = _apply_filter_controls(
+        data_frame=data,
+        ctds_filter=ctds_filter,
+        target=target,
+        filtered_data_cache=filtered_data_cache,
+        pushed_down_selector_ids=pushed_down_selector_ids,
+    )
     filtered_data = _apply_filter_interaction(
         data_frame=filtered_data, ctds_filter_interaction=ctds_filter_interaction, target=target
     )
     return filtered_data
 
 
+def _get_target_columns(
+    figure_config: dict[str, Any], ctds_filter_interaction: list[dict[str, CallbackTriggerDict]], target: ModelID
+) -> set[str] | None:
+    """Finds the columns of the unfiltered data that are needed to filter and draw a target.
+
+    Args:
+        figure_config: keyword-argument dictionary that the targeted figure is called with.
+        ctds_filter_interaction: structure containing CallbackTriggerDict for filter interactions.
+        target: id of targeted Figure.
+
+    Returns: columns used by the figure, by the filters that target it and by filter interactions, or None if any
+        column might be used.
+    """
+    from vizro.models import Filter, Graph
+    from vizro.models._components._components_utils import _get_column_names
+
+    columns = cast(FigureType, model_manager[target])._get_referenced_columns(figure_config)
+    if columns is None:
+        return None
+
+    for filter_model in cast(Iterable[Filter], model_manager._get_models(Filter)):
+        if target in filter_model.targets:
+            columns |= _get_column_names(filter_model.column)
+
+    # A filter interaction from a graph filters by its custom_data columns. Other figures filter by the column of the
+    # clicked cell, which could be any column.
+    for ctd_filter_interaction in ctds_filter_interaction:
+        source_model = model_manager[ctd_filter_interaction["modelID"]["id"]]
+        if not isinstance(source_model, Graph):
+            return None
+        columns |= _get_column_names(source_model.figure._arguments.get("custom_data"))
+
+    return columns
+
+
+def _get_filter_predicates(
+    ctds_filter: list[CallbackTriggerDict], target: ModelID
+) -> dict[ModelID, list[_FilterPredicate]]:
+    """Finds the filters that target a target and can be given as predicates. See Filter._get_filter_predicates.
+
+    Returns: predicates of each filter keyed by the id of its selector.
+    """
+    from vizro.models import Filter
+    from vizro.models._controls._controls_utils import get_selector_parent_control
+
+    selector_id_to_predicates = {}
+    for ctd in ctds_filter:
+        parent_filter = cast(Filter, get_selector_parent_control(selector=model_manager[ctd["id"]]))
+        if target in parent_filter.targets:
+            predicates = parent_filter._get_filter_predicates(ctd["value"])
+            if predicates is not None:
+                selector_id_to_predicates[ctd["id"]] = predicates
+    return selector_id_to_predicates
+
+
+def _get_pushed_down_filters(
+    ctds_parameter: list[CallbackTriggerDict],
+    ctds_filter: list[CallbackTriggerDict],
+    targets: list[ModelID],
+    unfiltered_targets: Collection[ModelID] = (),
+) -> dict[ModelID, dict[ModelID, list[_FilterPredicate]]]:
+    """Finds the filters that can be pushed down into the dynamic data loading function of each target.
+
+    A filter is pushed down when the data loading function has a `filters` argument that's not set by a parameter and
+    the filter can be given as predicates. Targets that load the same data push down only the filters that they all
+    share, so that the data is still loaded just once. No filters are pushed down for `unfiltered_targets`, whose data
+    must not be filtered (e.g. to find the options of a dynamic filter), and so nor for targets that share their data.
+
+    Args:
+        ctds_parameter: list of CallbackTriggerDicts for vm.Parameter.
+        ctds_filter: list of CallbackTriggerDict for filters.
+        targets: ids of targeted Figures.
+        unfiltered_targets: ids of targeted Figures whose data must not be filtered.
+
+    Returns: for each target, the predicates of each pushed-down filter keyed by the id of its selector.
+    """
+    load_key_to_targets: dict[Hashable, list[ModelID]] = defaultdict(list)
+    target_to_pushed_down_filters: dict[ModelID, dict[ModelID, list[_FilterPredicate]]] = {}
+    for target in targets:
+        data_source_name = cast(FigureType, model_manager[target])["data_frame"]
+        load_kwargs = _get_parametrized_config(ctds_parameter=ctds_parameter, target=target, data_frame=True)
+        load_key_to_targets[data_manager._get_load_key(data_source_name, load_kwargs["data_frame"])].append(target)
+        data = data_manager[data_source_name]
+        can_push_down = (
+            target not in unfiltered_targets
+            and isinstance(data, _DynamicData)
+            and data._accepts_argument("filters")
+            and "filters" not in load_kwargs["data_frame"]
+        )
+        target_to_pushed_down_filters[target] = _get_filter_predicates(ctds_filter, target) if can_push_down else {}
+
+    for load_key_targets in load_key_to_targets.values():
+        shared_selector_ids = set.intersection(
+            *(set(target_to_pushed_down_filters[target]) for target in load_key_targets)
+        )
+        for target in load_key_targets:
+            target_to_pushed_down_filters[target] = {
+                selector_id: predicates
+                for selector_id, predicates in target_to_pushed_down_filters[target].items()
+                if selector_id in shared_selector_ids
+            }
+    return target_to_pushed_down_filters
+
+
 def _get_unfiltered_data(
-    ctds_parameter: list[CallbackTriggerDict], targets: list[ModelID]
+    ctds_parameter: list[CallbackTriggerDict],
+    targets: list[ModelID],
+    target_to_columns: dict[ModelID, set[str] | None] | None = None,
+    target_to_pushed_down_filters: dict[ModelID, dict[ModelID, list[_FilterPredicate]]] | None = None,
+    native: bool = False,
 ) -> dict[ModelID, pd.DataFrame]:
     # Takes in multiple targets to ensure that data can be loaded efficiently using _multi_load and not repeated for
     # every single target.
     # Getting unfiltered data requires data frame parameters. We pass in all ctds_parameter and then find the
     # data_frame ones by passing data_frame=True in the call to _get_paramaterized_config. Static data is also
     # handled here and will just have empty dictionary for its kwargs.
+    # If target_to_columns is given then only the columns needed by each target are loaded where possible. See
+    # DataManager._multi_load.
+    # If target_to_pushed_down_filters is given then the predicates of the filters that are pushed down for each target
+    # are passed as the filters argument of its data loading function. See _get_pushed_down_filters.
+    # If native is True then dynamic data is returned in the format given by its data loading function, e.g. a Polars
+    # DataFrame, so that _apply_filters can filter it before it's converted to pandas. See DataManager._multi_load.
     multi_data_source_name_load_kwargs: list[tuple[DataSourceName, dict[str, Any]]] = []
     for target in targets:
         dynamic_data_load_params = _get_parametrized_config(
             ctds_parameter=ctds_parameter, target=target, data_frame=True
         )
         data_source_name = cast(FigureType, model_manager[target])["data_frame"]
-        multi_data_source_name_load_kwargs.append((data_source_name, dynamic_data_load_params["data_frame"]))
+        load_kwargs = dynamic_data_load_params["data_frame"]
+        if target_to_pushed_down_filters is not None and target_to_pushed_down_filters[target]:
+            load_kwargs["filters"] = [
+                predicate for predicates in target_to_pushed_down_filters[target].values() for predicate in predicates
+            ]
+        multi_data_source_name_load_kwargs.append((data_source_name, load_kwargs))
 
-    return dict(zip(targets, data_manager._multi_load(multi_data_source_name_load_kwargs)))
+    multi_columns = [target_to_columns[target] for target in targets] if target_to_columns is not None else None
+    return dict(zip(targets, data_manager._multi_load(multi_data_source_name_load_kwargs, multi_columns, native)))
 
 
 # TODO-AV2 A 2: rename this, make sure it could become public in future but don't make public yet. Probably take in
@@ -264,21 +497,64 @@ def _get_modified_page_figures(
     # must be loaded even when those figures aren't themselves being refreshed (e.g. a Button that targets only the
     # filter). We load data for those figures but only emit them as outputs when they're figure_targets.
     data_targets = list(figure_targets)
+    control_data_targets = set()
     for control_target in control_targets:
         for filter_figure_target in cast(Filter, model_manager[control_target]).targets:
+            control_data_targets.add(filter_figure_target)
             if filter_figure_target not in data_targets:
                 data_targets.append(filter_figure_target)
 
-    target_to_data_frame = _get_unfiltered_data(ctds_parameter=ctds_parameter, targets=data_targets)
+    # Only the columns that are needed to filter and draw the targets are loaded, where these are known.
+    target_to_figure_config = {
+        target: _get_parametrized_config(ctds_parameter=ctds_parameter, target=target, data_frame=False)
+        for target in data_targets
+    }
+    target_to_columns = {
+        target: _get_target_columns(target_to_figure_config[target], ctds_filter_interaction, target)
+        for target in data_targets
+    }
+    # Filters are pushed down into loading the data where possible. The options of dynamic filters must be found from
+    # data that's not filtered, so nothing is pushed down for the data of their targets.
+    target_to_pushed_down_filters = _get_pushed_down_filters(
+        ctds_parameter=ctds_parameter,
+        ctds_filter=ctds_filter,
+        targets=data_targets,
+        unfiltered_targets=control_data_targets,
+    )
+    target_to_data_frame = _get_unfiltered_data(
+        ctds_parameter=ctds_parameter,
+        targets=data_targets,
+        target_to_columns=target_to_columns,
+        target_to_pushed_down_filters=target_to_pushed_down_filters,
+        native=True,
+    )
+    # Dynamic filters find their options from pandas data, so the data of their targets is converted straight away. Each
+    # object is converted only once so that all the targets that share it, including figures, share the converted data.
+    control_data_ids = {id(target_to_data_frame[target]) for target in control_data_targets}
+    id_to_converted_data_frame: dict[int, pd.DataFrame] = {}
+    for target, data_frame in target_to_data_frame.items():
+        if id(data_frame) in control_data_ids:
+            if id(data_frame) not in id_to_converted_data_frame:
+                id_to_converted_data_frame[id(data_frame)] = _to_pandas(data_frame)
+            target_to_data_frame[target] = id_to_converted_data_frame[id(data_frame)]
 
     # TODO: the structure here would be nicer if we could get just the ctds for a single target at one time,
     #  so you could do apply_filters on a target a pass only the ctds relevant for that target.
     #  Consider restructuring ctds to a more convenient form to make this possible.
+    # Targets that share a data source and filters are filtered only once. This relies on _multi_load returning the same
+    # DataFrame object for all targets that load the same data.
+    filtered_data_cache: FilteredDataCache = {}
     for target in figure_targets:
-        filtered_data = _apply_filters(target_to_data_frame[target], ctds_filter, ctds_filter_interaction, target)
+        filtered_data = _apply_filters(
+            target_to_data_frame[target],
+            ctds_filter,
+            ctds_filter_interaction,
+            target,
+            filtered_data_cache,
+            pushed_down_selector_ids=target_to_pushed_down_filters[target].keys(),
+        )
         outputs[target] = cast(FigureType, model_manager[target])(
-            data_frame=filtered_data,
-            **_get_parametrized_config(ctds_parameter=ctds_parameter, target=target, data_frame=False),
+            data_frame=filtered_data, **target_to_figure_config[target]
         )
 
     for target in control_targets:
@@ -6,7 +6,12 @@ from dash import Output, ctx, dcc
 from pydantic import Field
 
 from vizro.actions._abstract_action import _AbstractAction
-from vizro.actions._actions_utils import _apply_filters, _get_unfiltered_data
+from vizro.actions._actions_utils import (
+    FilteredDataCache,
+    _apply_filters,
+    _get_pushed_down_filters,
+    _get_unfiltered_data,
+)
 from vizro.managers import model_manager
 from vizro.managers._model_manager import FIGURE_MODELS
 from vizro.models._models_utils import _log_call
@@ -76,9 +81,21 @@ class export_data(_AbstractAction):
         ctds = ctx.args_grouping["external"]["_controls"]
         writers = {"csv": "to_csv", "xlsx": "to_excel"}
         outputs = {}
+        filtered_data_cache: FilteredDataCache = {}
 
-        for target, unfiltered_data in _get_unfiltered_data(ctds["parameters"], self.targets).items():
-            filtered_data = _apply_filters(unfiltered_data, ctds["filters"], ctds["filter_interaction"], target)
+        target_to_pushed_down_filters = _get_pushed_down_filters(ctds["parameters"], ctds["filters"], self.targets)
+        target_to_data_frame = _get_unfiltered_data(
+            ctds["parameters"], self.targets, target_to_pushed_down_filters=target_to_pushed_down_filters, native=True
+        )
+        for target, unfiltered_data in target_to_data_frame.items():
+            filtered_data = _apply_filters(
+                unfiltered_data,
+                ctds["filters"],
+                ctds["filter_interaction"],
+                target,
+                filtered_data_cache,
+                pushed_down_selector_ids=target_to_pushed_down_filters[target].keys(),
+            )
             writer = getattr(filtered_data, writers[self.file_format])
             outputs[f"download_dataframe_{target}"] = dcc.send_data_frame(
                 writer=writer, filename=f"{target}.{self.file_format}", index=False
@@ -2,5 +2,6 @@
 
 from ._data_manager import data_manager
 from ._model_manager import model_manager
+from ._parquet_source import ParquetSource
 
-__all__ = ["data_manager", "model_manager"]
+__all__ = ["ParquetSource", "data_manager", "model_manager"]
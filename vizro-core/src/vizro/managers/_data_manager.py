@@ -2,20 +2,37 @@
 
 from __future__ import annotations
 
+import atexit
+import contextvars
+import datetime
 import functools
-import json
+import importlib.util
+import inspect
 import logging
 import os
+import sys
+import threading
+import time
+import uuid
 import warnings
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from functools import partial
-from typing import Any
+from typing import Any, Literal, TypeVar, cast
 
+import narwhals.stable.v1 as nw
+import numpy as np
 import pandas as pd
 import wrapt
 from flask_caching import Cache
+from flask_caching.backends.nullcache import NullCache
+from packaging.version import parse
 
 from vizro.managers._managers_utils import _state_modifier
+from vizro.managers._parquet_source import ParquetSource
+from vizro.managers._shared_data import _share_data
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +41,98 @@ logger = logging.getLogger(__name__)
 # correctly they would need to cast all strings to these types.
 DataSourceName = str
 pd_DataFrameCallable = Callable[..., pd.DataFrame]
+# Identifies a load of a dynamic data source with particular arguments. See _DynamicData._load_key.
+_LoadKey = Hashable
+# Condition (column, operator, value) on the rows of data, in the same form as the filters argument of
+# pandas.read_parquet. The operator is one of "==", "in", ">=" and "<=".
+_FilterPredicate = tuple[str, str, Any]
+
+T = TypeVar("T")
+
+# Key in DataFrame.attrs under which the version of loaded data is stored. See DataManager._get_data_version.
+_DATA_VERSION_ATTR = "_vizro_data_version"
+
+# Types of load argument that are used directly as their own key by _canonical_key.
+_SELF_KEYED_TYPES = (str, int)
+
+# How often a worker that is waiting for another worker to finish loading data checks whether the data is in the cache.
+_LOAD_LOCK_POLL_INTERVAL = 0.1
+
+# Bounds of DataManager._derived_data. Values such as the indexes of a large column can each take hundreds of MB, so the
+# total size of the values is bounded as well as their number.
+_DERIVED_DATA_MAXSIZE = 128
+_DERIVED_DATA_MAXBYTES = 256 * 2**20
+
+# Set in the thread that refreshes stale data in the background so that the memoized function bypasses the cache.
+_forced_update = threading.local()
+# Shared by all dynamic data sources that refresh in the background. Created on first use.
+_refresh_executor: ThreadPoolExecutor | None = None
+_refresh_executor_lock = threading.Lock()
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    global _refresh_executor  # noqa: PLW0603
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(thread_name_prefix="vizro_data_refresh")
+        return _refresh_executor
+
+
+def _shutdown_executors():
+    """Shuts down the executors of the data manager so that loads that have not started yet don't delay exit."""
+    with _refresh_executor_lock:
+        if _refresh_executor is not None:
+            _refresh_executor.shutdown(wait=False, cancel_futures=True)
+    data_manager._shutdown_load_executor()
+
+
+def _copy_on_write_enabled() -> bool:
+    """Whether pandas Copy-on-Write is active, in which case a shallow copy of a DataFrame is safe to hand out.
+
+    Copy-on-Write is always enabled from pandas 3. In pandas 2 it is opt-in through `pd.options.mode.copy_on_write`,
+    which can also be set to "warn" (which does not enable it).
+    """
+    if parse(pd.__version__) >= parse("3"):
+        return True
+    return pd.options.mode.copy_on_write is True
+
+
+def _canonical_key(value: Any) -> Any:
+    """Converts a load argument into a hashable value that identifies it and has the same repr in every process.
+
+    This is used to key a load both when deduplicating loads in DataManager._multi_load and in the cache. Dictionaries
+    and sets are sorted, and values of different types that compare equal (such as 1, 1.0 and True) get different
+    keys. Dates and times are keyed by their ISO format, and numpy scalars and arrays by their Python equivalents.
+    Lists, tuples and numpy arrays with the same items have the same key. Anything else is keyed by its repr, which is
+    how flask-caching keys arguments.
+    """
+    if isinstance(value, np.datetime64):
+        # Done before the other numpy scalars since np.datetime64.item() gives an int for nanosecond precision.
+        value = pd.Timestamp(value)
+    elif isinstance(value, np.generic | np.ndarray):
+        value = value.tolist()
+
+    # Strings and ints (but not subclasses of int such as bool) are their own key. This means a list of them is also
+    # its own key, which is much quicker for the long lists that can come from multi-select parameters.
+    # datetime must be checked before date since it's a subclass of date.
+    if value is None or type(value) in _SELF_KEYED_TYPES:
+        key = value
+    elif isinstance(value, list | tuple):
+        is_self_keyed = all(type(item) in _SELF_KEYED_TYPES for item in value)
+        key = ("list", tuple(value) if is_self_keyed else tuple(_canonical_key(item) for item in value))
+    elif isinstance(value, bool | int | float):
+        key = (type(value).__name__, value)
+    elif isinstance(value, datetime.datetime):
+        key = ("datetime", value.isoformat())
+    elif isinstance(value, datetime.date | datetime.time):
+        key = (type(value).__name__, value.isoformat())
+    elif isinstance(value, dict):
+        key = ("dict", tuple(sorted(((_canonical_key(k), _canonical_key(v)) for k, v in value.items()), key=repr)))
+    elif isinstance(value, set | frozenset):
+        key = ("set", tuple(sorted((_canonical_key(item) for item in value), key=repr)))
+    else:
+        key = ("repr", repr(value))
+    return key
 
 
 # TODO: consider merging with model_utils _log_call. Using wrapt.decorator is probably better than functools here.
@@ -41,6 +150,115 @@ def _log_call(message: str):
     return wrapper
 
 
+def _to_pandas(data: Any) -> pd.DataFrame:
+    """Converts data returned by a data loading function, such as a Polars DataFrame or PyArrow Table, to pandas."""
+    if isinstance(data, pd.DataFrame):
+        return data
+    return nw.from_native(data, eager_only=True).to_pandas()
+
+
+def _set_data_version(data: pd.DataFrame, data_version: str | None) -> pd.DataFrame:
+    """Returns a shallow copy of `data` with its version set, or removed if `data_version` is None.
+
+    A copy is used so that the DataFrame returned by the data loading function is not modified, since it might be
+    one that the user still holds elsewhere.
+
+    Data that is not a pandas DataFrame, such as a Polars DataFrame, is returned unchanged and so has no version.
+    """
+    if not isinstance(data, pd.DataFrame):
+        return data
+    data = data.copy(deep=False)
+    if data_version is None:
+        data.attrs.pop(_DATA_VERSION_ATTR, None)
+    else:
+        data.attrs[_DATA_VERSION_ATTR] = data_version
+    return data
+
+
+def _get_nbytes(value: Any) -> int:
+    """Returns the approximate number of bytes of memory that `value` takes, counting its arrays in full."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage().sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return value.memory_usage()
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_get_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_get_nbytes(key) + _get_nbytes(item) for key, item in value.items())
+    return sys.getsizeof(value)
+
+
+class _DerivedDataCache:
+    """Bounded cache of values that are derived from a particular version of data, such as indexes used to filter it.
+
+    Entries are evicted least recently used first once there are more than `maxsize` of them or their total size is
+    more than `maxbytes`. A value that is larger than `maxbytes` by itself is not cached. Since the data version changes
+    whenever the data does, entries for old versions of data are never used again and so are evicted soon.
+    """
+
+    def __init__(self, maxsize: int, maxbytes: int):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.__entries: OrderedDict[tuple[str, Hashable], tuple[Any, int]] = OrderedDict()
+        self.__nbytes = 0
+        self.__lock = threading.Lock()
+
+    def get(self, data_version: str, key: Hashable, compute: Callable[[], T]) -> T:
+        """Returns the value for `key` derived from data with `data_version`, calling `compute` if it's not cached."""
+        entry_key = (data_version, key)
+        with self.__lock:
+            if entry_key in self.__entries:
+                self.__entries.move_to_end(entry_key)
+                return self.__entries[entry_key][0]
+
+        # Computed outside the lock so that other threads aren't blocked. Two threads could compute the same value at
+        # the same time, but that only wastes some work.
+        value = compute()
+        nbytes = _get_nbytes(value)
+        if nbytes > self.maxbytes:
+            return value
+        with self.__lock:
+            if entry_key in self.__entries:
+                self.__nbytes -= self.__entries.pop(entry_key)[1]
+            self.__entries[entry_key] = (value, nbytes)
+            self.__nbytes += nbytes
+            while len(self.__entries) > self.maxsize or self.__nbytes > self.maxbytes:
+                self.__nbytes -= self.__entries.popitem(last=False)[1][1]
+        return value
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate total number of bytes of the cached values."""
+        return self.__nbytes
+
+
+@dataclass
+class _LoadStats:
+    """Counters for the loads of a single dynamic data source in the current process.
+
+    Args:
+        loads: Number of calls to load().
+        misses: Number of those calls that ran the data loading function, i.e. were not served from the cache. This
+            includes all loads made while the cache is not operational.
+        load_time: Total time in seconds spent inside load(), including cache lookups.
+
+    """
+
+    loads: int = 0
+    misses: int = 0
+    load_time: float = 0.0
+
+    @property
+    def hits(self) -> int:
+        """Number of loads served from the cache."""
+        return self.loads - self.misses
+
+
 class _DynamicData:
     """Wrapper for a pd_DataFrameCallable, that is, a function that produces a pandas DataFrame.
 
@@ -52,6 +270,7 @@ class _DynamicData:
         >>>     return pd.read_csv("dynamic_data.csv")
         >>> data_manager["dynamic_data"] = dynamic_data
         >>> data_manager["dynamic_data"].timeout = 5  # if you want to change the cache timeout to 5 seconds
+        >>> data_manager["dynamic_data"].refresh = "background"  # if you want to serve stale data while reloading
 
     Possibly in future, this will become a public class so you could directly do:
         >>> data_manager["dynamic_data"] = DynamicData(dynamic_data, timeout=5)
@@ -60,33 +279,268 @@ class _DynamicData:
     object rather than doing an implicit conversion to _DynamicData.
     """
 
-    def __init__(self, load_data: pd_DataFrameCallable):
+    def __init__(self, load_data: pd_DataFrameCallable, load_version: Callable[[], Hashable] | None = None):
         self.__load_data: pd_DataFrameCallable = load_data
+        # Version of the underlying data, such as a file's modification time, that is included in the load key so that
+        # a change to the data is a cache miss even before timeout has passed.
+        self.__load_version = load_version
+        try:
+            self.__signature: inspect.Signature | None = inspect.signature(load_data)
+        except (TypeError, ValueError):
+            self.__signature = None
+        # The memoized loading function is built once for the cache it's used with and then reused for every load.
+        # It's built lazily on the first load rather than here since data_manager.cache can be set (and attached to an
+        # app) after the data source is added.
+        self.__memoized_load_data: Callable[..., pd.DataFrame] | None = None
+        self.__memoized_cache: Cache | None = None
+        self.__stats_lock = threading.Lock()
+        self._stats = _LoadStats()
+        # Loads that are currently running in this process, keyed by _load_key. Concurrent loads with the same
+        # arguments wait for the one that's already running rather than all running the data loading function.
+        self.__in_flight: dict[_LoadKey, Future[pd.DataFrame]] = {}
+        self.__in_flight_lock = threading.Lock()
+        # Cache keys of stale data that is currently being refreshed in the background by this process.
+        self.__refreshing: set[str] = set()
+        self.__refreshing_lock = threading.Lock()
         self.timeout: int | None = None
+        # Maximum time in seconds to wait for another process to finish loading data for the same arguments after a
+        # cache miss. None means processes do not coordinate loading. See __load_with_lock.
+        self.lock_timeout: int | None = None
+        # Whether DataManager._multi_load can run this data loading function at the same time as other ones, in a
+        # different thread. Set to False for a data loading function that is not thread-safe.
+        self.parallel_load: bool = True
+        # With refresh="blocking", the first load after the cache has expired runs the data loading function. With
+        # refresh="background", data that is older than timeout is still returned from the cache and is reloaded in a
+        # background thread. Stale data is served for at most max_staleness seconds after it has expired; None means
+        # stale data does not expire from the cache.
+        self.refresh: Literal["blocking", "background"] = "blocking"
+        self.max_staleness: int | None = None
         # We might also want a self.cache_arguments dictionary in future that enables the user to customize more than
         # just timeout, but no rush to do this since other arguments are unlikely to be useful.
 
+    def __setattr__(self, name, value):
+        if name == "refresh" and value not in {"blocking", "background"}:
+            raise ValueError(f"refresh must be 'blocking' or 'background', not {value!r}.")
+        super().__setattr__(name, value)
+
+    @property
+    def _refresh_in_background(self) -> bool:
+        # timeout=0 means the data never expires and so never needs refreshing.
+        return self.refresh == "background" and self.timeout != 0
+
+    def __memoize_timeout(self) -> int | None:
+        """Time for which data stays in the cache, which with refresh="background" includes the time it's stale."""
+        if not self._refresh_in_background:
+            return self.timeout
+        if self.max_staleness is None:
+            return 0
+        timeout = self.timeout if self.timeout is not None else data_manager.cache.cache.default_timeout
+        return timeout + self.max_staleness
+
     def load(self, *args, **kwargs) -> pd.DataFrame:
-        """Loads data."""
+        """Loads data.
+
+        Concurrent calls with the same arguments in the same process are coalesced so that the data is only loaded
+        once. The calls that wait receive a copy of the data loaded by the first call.
+        """
+        return _to_pandas(self._load_native(*args, **kwargs))
+
+    def _load_native(self, *args, **kwargs) -> Any:
+        """Loads data in the format returned by the data loading function, e.g. a Polars DataFrame. See load."""
         # Data source name can be extracted from the function's name since it was added there in DataManager.__setitem__
         logger.debug(
             "Looking in cache for data source %s on process %s",
             self.__load_data.__name__.rpartition(".")[-1],
             os.getpid(),
         )
+        start = time.perf_counter()
+        try:
+            return self.__load_single_flight(self._load_key(*args, **kwargs), *args, **kwargs)
+        finally:
+            with self.__stats_lock:
+                self._stats.loads += 1
+                self._stats.load_time += time.perf_counter() - start
+
+    def _accepts_argument(self, name: str) -> bool:
+        """Whether the data loading function has an argument called `name`, e.g. `columns` to load only some columns."""
+        return self.__signature is not None and name in self.__signature.parameters
+
+    def _load_key(self, *args, **kwargs) -> _LoadKey:
+        """Returns a hashable key for a load with the given arguments that has the same repr in every process.
+
+        Arguments are matched to the parameters of the data loading function first, so that loads with the same
+        argument values given positionally, by keyword or left as the default have the same key.
+        """
+        load_key = self.__arguments_key(*args, **kwargs)
+        if self.__load_version is not None:
+            return (load_key, self.__load_version())
+        return load_key
+
+    def __arguments_key(self, *args, **kwargs) -> _LoadKey:
+        if self.__signature is not None:
+            try:
+                bound_arguments = self.__signature.bind(*args, **kwargs)
+            except TypeError:
+                # Leave the data loading function to raise the error when it's called.
+                pass
+            else:
+                bound_arguments.apply_defaults()
+                return _canonical_key(bound_arguments.arguments)
+        return _canonical_key([args, kwargs])
+
+    def __load_single_flight(self, load_key: _LoadKey, *args, **kwargs) -> pd.DataFrame:
+        with self.__in_flight_lock:
+            in_flight = self.__in_flight.get(load_key)
+            if in_flight is None:
+                future: Future[pd.DataFrame] = Future()
+                self.__in_flight[load_key] = future
+
+        if in_flight is not None:
+            logger.debug("Waiting for load already in progress")
+            # Each caller gets its own copy, the same as if it had loaded the data itself. This is shallow when pandas
+            # Copy-on-Write is enabled, as for _StaticData.load. Data in other formats, such as a Polars DataFrame, is
+            # not modified in place by Vizro and so is shared.
+            data = in_flight.result()
+            return data.copy(deep=not _copy_on_write_enabled()) if isinstance(data, pd.DataFrame) else data
+
+        try:
+            data = self.__get_load_data()(load_key, args, kwargs)
+            if self._refresh_in_background and data_manager._cache_has_app:
+                self.__refresh_if_stale(load_key, args, kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            with self.__in_flight_lock:
+                del self.__in_flight[load_key]
+
+    def __get_load_data(self) -> Callable[[_LoadKey, tuple[Any, ...], dict[str, Any]], pd.DataFrame]:
+        """Returns a function that loads data given (load key, positional arguments, keyword arguments).
+
+        When the cache is active, this is memoized so that the cache key depends only on the load key and not on the
+        positional and keyword arguments themselves. This means the cache key is the same whenever the load key is the
+        same, and so in every process for equivalent arguments, even when the arguments' own repr (which is what
+        flask-caching would otherwise use) is not deterministic, e.g. for sets.
+        """
         # We don't memoize the load method itself as this is tricky to get working fully when load is called with
         # arguments, since we need the signature of the memoized function to match that of load_data. See
         # https://github.com/GrahamDumpleton/wrapt/issues/263.
         # It's also difficult to get memoize working correctly with bound methods anyway - see comment in
         # DataManager.__setitem__. It's much easier to ensure that self.__load_data is always just a function.
-        if data_manager._cache_has_app:
-            # This includes the case of NullCache.
-            load_data = _log_call("Cache miss; reloading data")(self.__load_data)
-            load_data = data_manager.cache.memoize(timeout=self.timeout)(load_data)
-        else:
+        if not data_manager._cache_has_app:
             logger.debug("Cache not active; reloading data")
-            load_data = self.__load_data
-        return load_data(*args, **kwargs)
+            return self.__load_on_cache_miss
+
+        # This includes the case of NullCache. The memoized function is rebuilt only if data_manager.cache has been
+        # replaced since it was last built. The cache key is unchanged from building it on every call since
+        # flask-caching derives it from the function's __module__ and __qualname__ (set in DataManager.__setitem__ to
+        # be the same across all workers) and the arguments rather than from the memoized function object itself.
+        if self.__memoized_load_data is None or self.__memoized_cache is not data_manager.cache:
+
+            def keyed_load_data(
+                load_key: _LoadKey, load_args: tuple[Any, ...], load_kwargs: dict[str, Any]
+            ) -> pd.DataFrame:
+                return self.__load_on_cache_miss(load_key, load_args, load_kwargs)
+
+            # We don't use functools.wraps since flask-caching would then follow __wrapped__ and read the signature of
+            # self.__load_data rather than that of keyed_load_data.
+            keyed_load_data.__module__ = self.__load_data.__module__
+            keyed_load_data.__qualname__ = self.__load_data.__qualname__
+            self.__memoized_load_data = data_manager.cache.memoize(
+                forced_update=lambda: getattr(_forced_update, "active", False),
+                args_to_ignore=["load_args", "load_kwargs"],
+            )(keyed_load_data)
+            self.__memoized_cache = data_manager.cache
+        # flask-caching reads cache_timeout from the memoized function on every call, so there's no need to rebuild it
+        # when the timeout changes.
+        self.__memoized_load_data.cache_timeout = self.__memoize_timeout()  # type: ignore[union-attr]
+        return self.__memoized_load_data
+
+    def __cache_key(self, load_key: _LoadKey) -> str:
+        memoized_load_data = cast(Any, self.__memoized_load_data)
+        return memoized_load_data.make_cache_key(memoized_load_data.uncached, load_key, (), {})
+
+    def __refresh_if_stale(self, load_key: _LoadKey, args: tuple[Any, ...], kwargs: dict[str, Any]):
+        """Starts reloading data in the background if it's older than timeout.
+
+        Whether data is fresh is tracked with a separate cache entry that expires after timeout, while the data itself
+        stays in the cache for longer so that it can still be served while it's being refreshed.
+        """
+        cache_key = self.__cache_key(load_key)
+        if data_manager.cache.get(f"{cache_key}_fresh") is not None:
+            return
+        with self.__refreshing_lock:
+            if cache_key in self.__refreshing:
+                return
+            self.__refreshing.add(cache_key)
+        logger.debug("Serving stale data; refreshing data in background")
+        # The refresh runs in a copy of the current context so that, like a load on a cache miss, the data loading
+        # function can still access context variables such as the Flask request and Dash callback context.
+        _get_refresh_executor().submit(
+            contextvars.copy_context().run, self.__refresh, cache_key, load_key, args, kwargs
+        )
+
+    def __refresh(self, cache_key: str, load_key: _LoadKey, args: tuple[Any, ...], kwargs: dict[str, Any]):
+        _forced_update.active = True
+        try:
+            self.__get_load_data()(load_key, args, kwargs)
+        except Exception:
+            # Keep serving the stale data. The refresh is retried on the next load.
+            logger.exception("Failed to refresh data in background")
+        finally:
+            _forced_update.active = False
+            with self.__refreshing_lock:
+                self.__refreshing.discard(cache_key)
+
+    def __load_on_cache_miss(self, load_key: _LoadKey, args: tuple[Any, ...], kwargs: dict[str, Any]) -> pd.DataFrame:
+        if self.__memoized_load_data is None:
+            # Cache not active.
+            with self.__stats_lock:
+                self._stats.misses += 1
+            # Data that is not cached is different every time it's loaded, so it has no version.
+            return _set_data_version(self.__load_data(*args, **kwargs), None)
+
+        cache_key = self.__cache_key(load_key)
+        load_data = _log_call("Cache miss; reloading data")(self.__load_data)
+        data = self.__load_with_lock(load_data, cache_key, *args, **kwargs)
+        if self._refresh_in_background:
+            data_manager.cache.set(f"{cache_key}_fresh", True, timeout=self.timeout)
+        return data
+
+    def __load_with_lock(self, load_data: pd_DataFrameCallable, cache_key: str, *args, **kwargs) -> pd.DataFrame:
+        """Loads data after a cache miss, holding a lock in the cache so that other processes don't also load it.
+
+        The lock is only taken if lock_timeout is set. This is only useful for a cache that is shared between
+        processes, such as FileSystemCache or RedisCache. If another process already holds the lock then we wait for
+        it to put the data in the cache, for at most lock_timeout seconds, after which we give up waiting and load the
+        data anyway. The lock also expires after lock_timeout seconds in case the process holding it dies.
+        """
+        cache = data_manager.cache
+        lock_key = f"{cache_key}_lock"
+        has_lock = self.lock_timeout is not None and cache.add(lock_key, os.getpid(), timeout=self.lock_timeout)
+
+        if self.lock_timeout is not None and not has_lock:
+            logger.debug("Waiting for another process to load data")
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(_LOAD_LOCK_POLL_INTERVAL)
+                if (data := cache.get(cache_key)) is not None:
+                    return data
+            logger.debug("Timed out waiting for another process to load data; reloading data")
+
+        with self.__stats_lock:
+            self._stats.misses += 1
+        # The version is stored with the data in the cache so that it's the same in every process that uses the data.
+        # NullCache does not store the data, so it is different every time it's loaded and has no version.
+        data_version = None if isinstance(cache.cache, NullCache) else uuid.uuid4().hex
+        try:
+            return _set_data_version(load_data(*args, **kwargs), data_version)
+        finally:
+            if has_lock:
+                cache.delete(lock_key)
 
 
 class _StaticData:
@@ -104,20 +558,57 @@ class _StaticData:
 
     def __init__(self, data: pd.DataFrame):
         self.__data = data
+        self.__data_version = uuid.uuid4().hex
+        # Whether data_manager.share_static_data has been applied to the data. See __get_data.
+        self.__shared = False
+        self.__share_lock = threading.Lock()
 
-    def load(self) -> pd.DataFrame:
+    def load(self, columns: Collection[str] | None = None) -> pd.DataFrame:
         """Loads data.
 
+        If `columns` is given then only those columns are returned, in the same order as in the stored data. Selecting
+        the columns is done before copying so that the columns that are not needed are never copied.
+
         Returns a copy of the data. This is not necessary if we are careful to not do any inplace=True operations,
         but safest to leave it here, e.g. in case a user-defined action mutates the data. To be even safer we could
         additionally (but not instead) copy data when setting it in __init__ but this consumes more memory and is not
         necessary so long as data is only ever accessed through the intended API of data_manager["static_data"].load().
+
+        When pandas Copy-on-Write is enabled, the copy is shallow: it shares memory with the stored data and pandas
+        only copies the parts that are subsequently modified. This means loading static data costs no memory per call
+        but still protects the stored data from mutation. Without Copy-on-Write we must fall back to a deep copy.
+        """
+        stored_data = self.__get_data()
+        if columns is not None:
+            # Selecting columns already gives a copy (a lazy one under Copy-on-Write), so there's no need to copy again.
+            # The version is the same as for the whole data since the columns themselves are unchanged.
+            columns = set(columns)
+            data = stored_data[[column for column in stored_data.columns if column in columns]]
+        else:
+            data = stored_data.copy(deep=not _copy_on_write_enabled())
+        data.attrs[_DATA_VERSION_ATTR] = self.__data_version
+        return data
+
+    def __get_data(self) -> pd.DataFrame:
+        """Returns the stored data, first moving it to memory shared between processes if share_static_data is set.
+
+        This is done on the first load rather than in __init__ since share_static_data can be set after the data is
+        added. With gunicorn --preload, the first load is when the dashboard is built, before the workers are forked.
         """
-        return self.__data.copy()
+        if data_manager.share_static_data and not self.__shared:
+            with self.__share_lock:
+                if not self.__shared:
+                    try:
+                        self.__data = _share_data(self.__data)
+                    except (TypeError, ValueError, NotImplementedError, OSError):
+                        # For example, a column of mixed types cannot be converted to Arrow.
+                        logger.warning("Could not share static data between processes", exc_info=True)
+                    self.__shared = True
+        return self.__data
 
     def __setattr__(self, name, value):
         # Any attributes that are only relevant for _DynamicData should go here to raise a clear error message.
-        if name == "timeout":
+        if name in {"timeout", "lock_timeout", "refresh", "max_staleness", "parallel_load"}:
             raise AttributeError(
                 f"Static data that is a pandas.DataFrame itself does not support {name}; you should instead use a "
                 "dynamic data source that is a function that returns a pandas.DataFrame."
@@ -136,6 +627,10 @@ class DataManager:
         >>>     return pd.read_csv("dynamic_data.csv")
         >>> data_manager["dynamic_data"] = dynamic_data
         >>> data_manager["dynamic_data"].timeout = 5  # if you want to change the cache timeout to 5 seconds
+        >>> # Load at most 4 dynamic data sources at the same time
+        >>> data_manager.max_parallel_loads = 4
+        >>> # Share static data between processes, e.g. gunicorn workers, rather than keeping a copy in each one
+        >>> data_manager.share_static_data = True
 
     """
 
@@ -143,6 +638,15 @@ class DataManager:
         self.__data: dict[DataSourceName, _DynamicData | _StaticData] = {}
         self._frozen_state = False
         self.cache = Cache(config={"CACHE_TYPE": "NullCache"})
+        # Maximum number of dynamic data loads that _multi_load runs at the same time. 1 means load one at a time.
+        self.max_parallel_loads: int = 8
+        # Whether static data is stored in memory that is shared between processes. This needs pyarrow.
+        self.share_static_data: bool = False
+        self.__load_executor: ThreadPoolExecutor | None = None
+        self.__load_executor_max_workers: int | None = None
+        self.__load_executor_lock = threading.Lock()
+        # Values derived from loaded data, such as indexes used to filter it. See _get_derived_data.
+        self._derived_data = _DerivedDataCache(maxsize=_DERIVED_DATA_MAXSIZE, maxbytes=_DERIVED_DATA_MAXBYTES)
         # In future, possibly we will accept just a config dict. Would need to work out whether to handle merging with
         # default values though. We would do this with something like this:
         # def __set_cache(self, cache_config):
@@ -151,10 +655,16 @@ class DataManager:
         #     self._cache = value
         # _cache = property(fset=__set_cache)
 
+    def __setattr__(self, name, value):
+        if name == "share_static_data" and value and importlib.util.find_spec("pyarrow") is None:
+            raise ModuleNotFoundError("You must install pyarrow to use share_static_data.")
+        super().__setattr__(name, value)
+
     @_state_modifier
     def __setitem__(self, name: DataSourceName, data: pd.DataFrame | pd_DataFrameCallable):
         """Adds `data` to the `DataManager` with key `name`."""
         if callable(data):
+            load_version = data._get_mtime if isinstance(data, ParquetSource) else None
             # __qualname__ is required by flask-caching (even if we specify our own make_name) but
             # not defined for partial functions and just '<lambda>' for lambda functions. Defining __qualname__
             # means it's possible to have non-interfering caches for lambda functions (similarly if we
@@ -185,7 +695,7 @@ class DataManager:
             data.__module__ = getattr(data, "__module__", "<nomodule>")
             data.__name__ = ".".join([getattr(data, "__name__", "<unnamed>"), name])
             data.__qualname__ = ".".join([getattr(data, "__qualname__", "<unnamed>"), name])
-            self.__data[name] = _DynamicData(data)
+            self.__data[name] = _DynamicData(data, load_version=load_version)
         elif isinstance(data, pd.DataFrame):
             self.__data[name] = _StaticData(data)
         else:
@@ -200,46 +710,158 @@ class DataManager:
         except KeyError as exc:
             raise KeyError(f"Data source {name} does not exist.") from exc
 
-    def _multi_load(self, multi_name_load_kwargs: list[tuple[DataSourceName, dict[str, Any]]]) -> list[pd.DataFrame]:
+    def _multi_load(
+        self,
+        multi_name_load_kwargs: list[tuple[DataSourceName, dict[str, Any]]],
+        multi_columns: list[set[str] | None] | None = None,
+        native: bool = False,
+    ) -> list[pd.DataFrame]:
         """Loads multiple data sources as efficiently as possible.
 
         Deduplicates a list of (data source name, load keyword argument dictionary) tuples so that each one corresponds
         to only a single load() call. In the worst case scenario where there are no repeated tuples then performance of
         this function is identical to doing a load call for each tuple.
 
+        Distinct dynamic data loads run at the same time in a pool of at most `max_parallel_loads` threads, other than
+        those for data sources with `parallel_load=False`, which run in the calling thread like static data loads.
+
         If a data source is static then load keyword argument dictionary must be {}.
 
+        If `multi_columns` is given then each load needs only the columns in the corresponding set, or all columns if it
+        is None. Loads that are de-duplicated need the union of their columns. Static data is then sliced to just those
+        columns, and they are passed as `columns` to the data loading function of dynamic data that has a `columns`
+        argument that's not already set by the load keyword arguments.
+
+        If `native` is True then dynamic data is returned in the format that the data loading function gave it, such as
+        a Polars DataFrame or PyArrow Table, rather than converted to pandas. This means it can first be filtered with
+        its own engine. Use _to_pandas to convert it.
+
         Args:
             multi_name_load_kwargs: List of (data source name, load keyword argument dictionary).
+            multi_columns: Optional list of columns needed by each load, in the same order as `multi_name_load_kwargs`.
+            native: Whether to return dynamic data in the format given by the data loading function.
 
         Returns:
             Loaded data in the same order as `multi_name_load_kwargs` was supplied.
         """
+        # Each (data source name, load keyword argument dictionary) tuple is de-duplicated using its load key.
+        load_keys = [self._get_load_key(name, load_kwargs) for name, load_kwargs in multi_name_load_kwargs]
+        # De-duplicate, keeping the load keyword arguments of the first occurrence of each load key.
+        load_key_to_load_kwargs: dict[tuple[DataSourceName, _LoadKey], dict[str, Any]] = {}
+        for load_key, (_, load_kwargs) in zip(load_keys, multi_name_load_kwargs):
+            load_key_to_load_kwargs.setdefault(load_key, load_kwargs)
+
+        if multi_columns is not None:
+            load_key_to_columns: dict[tuple[DataSourceName, _LoadKey], set[str] | None] = {}
+            for load_key, columns in zip(load_keys, multi_columns):
+                previous_columns = load_key_to_columns.get(load_key, set())
+                load_key_to_columns[load_key] = (
+                    None if previous_columns is None or columns is None else previous_columns | columns
+                )
+            for load_key, columns in load_key_to_columns.items():
+                data, load_kwargs = self[load_key[0]], load_key_to_load_kwargs[load_key]
+                accepts_columns = isinstance(data, _StaticData) or (
+                    data._accepts_argument("columns") and "columns" not in load_kwargs
+                )
+                if columns is not None and accepts_columns:
+                    load_key_to_load_kwargs[load_key] = {**load_kwargs, "columns": sorted(columns)}
+
+        # Load each key only once. Dynamic data loads that can run in parallel are submitted to the executor first so
+        # that they run at the same time as the remaining loads, which are done in this thread.
+        parallel_load_keys = [
+            load_key
+            for load_key in load_key_to_load_kwargs
+            if isinstance(self[load_key[0]], _DynamicData) and cast(_DynamicData, self[load_key[0]]).parallel_load
+        ]
+        if self.max_parallel_loads <= 1 or len(parallel_load_keys) <= 1:
+            parallel_load_keys = []
+
+        load_key_to_future = {}
+        for load_key in parallel_load_keys:
+            name, load_kwargs = load_key[0], load_key_to_load_kwargs[load_key]
+            # Each thread runs in a copy of the current context so that the data loading function can still access
+            # context variables such as the Flask request and Dash callback context.
+            load_key_to_future[load_key] = self.__get_load_executor().submit(
+                contextvars.copy_context().run, self.__load, name, load_kwargs, native
+            )
 
-        # Easiest way to make a key to de-duplicate each (data source name, load keyword argument dictionary) tuple.
-        def encode_load_key(name, load_kwargs):
-            return json.dumps([name, load_kwargs], sort_keys=True)
+        load_key_to_data: dict[tuple[DataSourceName, _LoadKey], pd.DataFrame] = {}
+        for load_key, load_kwargs in load_key_to_load_kwargs.items():
+            if load_key not in load_key_to_future:
+                load_key_to_data[load_key] = self.__load(load_key[0], load_kwargs, native)
 
-        def decode_load_key(key):
-            return json.loads(key)
+        for load_key, future in load_key_to_future.items():
+            load_key_to_data[load_key] = future.result()
 
-        # dict.fromkeys does the de-duplication.
-        load_key_to_data = dict.fromkeys(
-            encode_load_key(name, load_kwargs) for name, load_kwargs in multi_name_load_kwargs
-        )
+        return [load_key_to_data[load_key] for load_key in load_keys]
+
+    def __load(self, name: DataSourceName, load_kwargs: dict[str, Any], native: bool) -> pd.DataFrame:
+        data = self[name]
+        if native and isinstance(data, _DynamicData):
+            return data._load_native(**load_kwargs)
+        return data.load(**load_kwargs)
 
-        # Load each key only once.
-        for load_key in load_key_to_data.keys():
-            name, load_kwargs = decode_load_key(load_key)
-            load_key_to_data[load_key] = self[name].load(**load_kwargs)
+    def _get_load_key(self, name: DataSourceName, load_kwargs: dict[str, Any]) -> tuple[DataSourceName, _LoadKey]:
+        """Returns a key that identifies loading data source `name` with `load_kwargs`.
 
-        return [load_key_to_data[encode_load_key(name, load_kwargs)] for name, load_kwargs in multi_name_load_kwargs]
+        This is the same load key that identifies the load in the cache, so that load keyword arguments that are
+        equivalent but not identical (e.g. sets in a different order, or an argument left as its default) have the
+        same key.
+        """
+        data = self[name]
+        if isinstance(data, _DynamicData):
+            return name, data._load_key(**load_kwargs)
+        return name, _canonical_key(load_kwargs)
+
+    def __get_load_executor(self) -> ThreadPoolExecutor:
+        # The executor is replaced if max_parallel_loads has changed since it was created. Shutting down the replaced
+        # executor lets its threads exit once they finish any loads that are still running.
+        with self.__load_executor_lock:
+            if self.__load_executor is None or self.__load_executor_max_workers != self.max_parallel_loads:
+                if self.__load_executor is not None:
+                    self.__load_executor.shutdown(wait=False)
+                self.__load_executor = ThreadPoolExecutor(
+                    max_workers=self.max_parallel_loads, thread_name_prefix="vizro_data_load"
+                )
+                self.__load_executor_max_workers = self.max_parallel_loads
+            return self.__load_executor
+
+    def _shutdown_load_executor(self):
+        with self.__load_executor_lock:
+            if self.__load_executor is not None:
+                self.__load_executor.shutdown(wait=False, cancel_futures=True)
+            self.__load_executor = None
+            self.__load_executor_max_workers = None
+
+    @staticmethod
+    def _get_data_version(data: pd.DataFrame) -> str | None:
+        """Returns the version of data loaded from the data manager, or None if it does not have one.
+
+        Static data and data that is cached have a version that identifies the data. The version changes whenever the
+        data changes, i.e. when dynamic data is reloaded on a cache miss. Data that's not cached has no version.
+
+        This must only be used on data as returned by load, since the version is stored in `DataFrame.attrs`, which
+        pandas also propagates to the result of operations such as filtering.
+        """
+        return data.attrs.get(_DATA_VERSION_ATTR)
+
+    def _get_derived_data(self, data_version: str | None, key: Hashable, compute: Callable[[], T]) -> T:
+        """Returns a value derived from data with `data_version`, computing it with `compute` if it's not cached.
+
+        This is used to reuse expensive computations on data that's loaded many times, e.g. indexes to filter it.
+        `key` should identify what is derived, e.g. the kind of index and the column it's for. If `data_version` is
+        None then the data has no version and so the value is always computed.
+        """
+        if data_version is None:
+            return compute()
+        return self._derived_data.get(data_version, key, compute)
 
     def _clear(self):
         # We do not actually call self.cache.clear() because (a) it would only work when self._cache_has_app is True,
         # which is not the case when e.g. Vizro._reset is called, and (b) because we do not want to accidentally
         # clear the cache if we eventually put a call to Vizro._reset inside Vizro(), since cache should be persisted
         # across server restarts.
+        self._shutdown_load_executor()
         self.__init__()  # type: ignore[misc]
 
     @property
@@ -266,3 +888,4 @@ class DataManager:
 
 
 data_manager: DataManager = DataManager()
+atexit.register(_shutdown_executors)
@@ -0,0 +1,139 @@
+"""Data source that reads a Parquet or Arrow IPC (Feather) file through a memory map."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from vizro.managers._data_manager import _FilterPredicate
+
+# File suffixes used to infer the format of the file when it's not given explicitly.
+_PARQUET_SUFFIXES = {".parquet", ".pq"}
+_FEATHER_SUFFIXES = {".feather", ".arrow", ".ipc"}
+
+
+class ParquetSource:
+    """Data source that reads a Parquet or Arrow IPC (Feather) file through a memory map.
+
+    Add it to the data manager like a dynamic data loading function:
+        >>> data_manager["sales"] = ParquetSource("sales.parquet")
+
+    The file is read through a memory map, and only the columns and rows that are needed are read: see `columns` and
+    `filters` in `__call__`. Data is reloaded whenever the file's modification time changes.
+
+    Parquet files and compressed Arrow IPC files, which pyarrow writes with lz4 compression by default, are decoded into
+    memory in each process that loads them. Only the data of an uncompressed Arrow IPC file that's loaded with
+    `dtype_backend="pyarrow"` refers to the memory map itself rather than to a copy, so that processes serving the
+    dashboard, such as gunicorn workers, share the file's pages through the operating system's page cache. Even then,
+    a cache that stores the loaded data, such as `FileSystemCache` or `RedisCache`, stores a copy of it.
+
+    Args:
+        path: Path to the file.
+        format: Format of the file. Defaults to `None`, which infers the format from the file's suffix.
+        dtype_backend: `"pyarrow"` to give a DataFrame with `pd.ArrowDtype` columns, which share memory with the Arrow
+            data, or `None` to give a DataFrame with the default pandas data types, which copies the Arrow data.
+            Defaults to `None`.
+
+    Raises:
+        ModuleNotFoundError: If pyarrow is not installed.
+        ValueError: If `format` is not given and cannot be inferred from the file's suffix.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        format: Literal["parquet", "feather"] | None = None,
+        dtype_backend: Literal["pyarrow"] | None = None,
+    ):
+        if importlib.util.find_spec("pyarrow") is None:
+            raise ModuleNotFoundError("You must install pyarrow to use ParquetSource.")
+
+        self.path = Path(path)
+        if format is None:
+            suffix = self.path.suffix.lower()
+            if suffix in _PARQUET_SUFFIXES:
+                format = "parquet"
+            elif suffix in _FEATHER_SUFFIXES:
+                format = "feather"
+            else:
+                raise ValueError(
+                    f"Cannot infer the format of {self.path} from its suffix; set format to 'parquet' or 'feather'."
+                )
+        self.format = format
+        self.dtype_backend = dtype_backend
+        # The table read from an uncompressed Arrow IPC file refers directly to the memory map rather than to a copy of
+        # the file, so it's kept for each modification time at no cost beyond the pages that are in use. The table of a
+        # compressed file is a decompressed copy in memory, so it's not kept.
+        self.__feather_table: pa.Table | None = None
+        self.__feather_mtime: int | None = None
+        self.__feather_lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.path)!r}, format={self.format!r})"
+
+    def _get_mtime(self) -> int:
+        """Returns the file's modification time, which DataManager adds to the load key so the data reloads with it."""
+        return os.stat(self.path).st_mtime_ns
+
+    def __call__(self, columns: list[str] | None = None, filters: list[_FilterPredicate] | None = None) -> pd.DataFrame:
+        """Loads data from the file.
+
+        Args:
+            columns: Columns to load. Defaults to `None`, which loads all columns.
+            filters: Conditions `(column, operator, value)` that rows must all satisfy, in the same form as the
+                `filters` argument of `pandas.read_parquet`. For a Parquet file, row groups whose statistics show that
+                no row can satisfy the conditions are not read at all. Defaults to `None`, which loads all rows.
+
+        Returns:
+            Loaded data.
+        """
+        # Import here since pyarrow is an optional dependency.
+        import pyarrow.parquet as pq
+
+        if self.format == "parquet":
+            table = pq.read_table(self.path, columns=columns, filters=filters or None, memory_map=True)
+        else:
+            table = self.__get_feather_table()
+            # Filter before selecting columns since the filters can use columns that are not selected.
+            if filters:
+                table = table.filter(pq.filters_to_expression(filters))
+            if columns is not None:
+                table = table.select(columns)
+
+        return table.to_pandas(types_mapper=pd.ArrowDtype if self.dtype_backend == "pyarrow" else None)
+
+    def __get_feather_table(self) -> pa.Table:
+        import pyarrow as pa
+
+        with self.__feather_lock:
+            mtime = self._get_mtime()
+            if self.__feather_table is not None and mtime == self.__feather_mtime:
+                return self.__feather_table
+            memory_map = pa.memory_map(str(self.path))
+            table = pa.ipc.open_file(memory_map).read_all()
+            mapped = _refers_to(table, memory_map)
+            self.__feather_table = table if mapped else None
+            self.__feather_mtime = mtime if mapped else None
+            return table
+
+
+def _refers_to(table: pa.Table, memory_map: pa.MemoryMappedFile) -> bool:
+    """Returns whether all the data of `table` refers to `memory_map` rather than to a copy of it in memory."""
+    memory_map.seek(0)
+    mapped = memory_map.read_buffer()
+    start, end = mapped.address, mapped.address + mapped.size
+    return all(
+        start <= buffer.address < end
+        for column in table.columns
+        for chunk in column.chunks
+        for buffer in chunk.buffers()
+        if buffer is not None
+    )
@@ -0,0 +1,114 @@
+"""Shares static data between processes through a memory-mapped Arrow IPC file."""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+import os
+import stat
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _get_shared_data_base_dir() -> Path:
+    # /dev/shm is memory rather than disk on Linux, so writing the file never waits for the disk.
+    return Path("/dev/shm") if os.path.isdir("/dev/shm") else Path(tempfile.gettempdir())  # noqa: S108
+
+
+def _check_private(path: Path):
+    """Checks that `path` is not a symlink and that only the current user can access it.
+
+    /dev/shm and the temporary directory are writable by every user, so another user could otherwise read the shared
+    data or plant a file to be mapped in place of it.
+
+    Raises:
+        PermissionError: If `path` is a symlink, is owned by another user or can be accessed by other users.
+    """
+    path_stat = os.lstat(path)
+    if stat.S_ISLNK(path_stat.st_mode):
+        raise PermissionError(f"Shared data path {path} is a symlink.")
+    # On Windows, the temporary directory is already private to the user and there is no owner or mode to check.
+    if hasattr(os, "getuid") and (path_stat.st_uid != os.getuid() or path_stat.st_mode & 0o077):
+        raise PermissionError(f"Shared data path {path} must be owned by the current user and private to them.")
+
+
+def _get_shared_data_dir() -> Path:
+    """Returns the directory of the shared data files of the current user, creating it if needed."""
+    user = os.getuid() if hasattr(os, "getuid") else "user"
+    path = _get_shared_data_base_dir() / f"vizro-{user}"
+    try:
+        path.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    _check_private(path)
+    return path
+
+
+def _get_data_hash(data: pd.DataFrame) -> str:
+    """Returns a hash of the contents of `data`, which is the same in every process that builds the same data."""
+    data_hash = hashlib.sha256()
+    data_hash.update(repr((list(data.columns), [str(dtype) for dtype in data.dtypes])).encode())
+    data_hash.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return data_hash.hexdigest()[:32]
+
+
+def _remove_file(path: Path, pid: int):
+    # A forked process inherits the handler but must not remove a file that its parent wrote.
+    if os.getpid() == pid:
+        with suppress(FileNotFoundError):
+            path.unlink()
+
+
+def _share_data(data: pd.DataFrame) -> pd.DataFrame:
+    """Returns `data` backed by a memory-mapped Arrow IPC file that every process with the same data uses.
+
+    The file is named by a hash of the data, so that processes that each build the same data, such as gunicorn workers
+    without --preload, write it only once and then all map the same file. The memory behind numerical and datetime
+    columns and string columns with an Arrow data type, such as the default string data type of pandas 3, is then the
+    file's pages in the operating system's page cache, which are shared between processes and never copied since
+    they're read-only. Other columns are copied into each process. In particular, string columns of Python objects, as
+    pandas 2 stores strings by default, are rebuilt as Python objects in each process.
+
+    Memory is only shared by the data that's loaded if pandas Copy-on-Write is enabled, as it always is from pandas 3.
+    Otherwise `_StaticData.load` still makes a deep copy of the data on every load.
+
+    The file is in a directory that only the current user can access, so other users can neither read the data nor
+    replace the file.
+
+    The returned data has the same data types as `data`. Processes forked after this is called, such as gunicorn
+    workers with --preload, share the memory map itself.
+    """
+    # Import here since pyarrow is an optional dependency.
+    import pyarrow as pa
+
+    # Arrow converts column names to strings, so other names would not be the same after the round trip.
+    if not all(isinstance(column, str) for column in data.columns):
+        raise TypeError("Only data with string column names can be shared between processes.")
+
+    path = _get_shared_data_dir() / f"vizro_{_get_data_hash(data)}.arrow"
+    if not path.exists():
+        table = pa.Table.from_pandas(data)
+        # Write to a temporary file first so that no process ever maps a file that is only partially written.
+        temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            # Create the file so that only the current user can read it before pyarrow writes to it.
+            temporary_path.unlink(missing_ok=True)
+            os.close(os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+            with pa.OSFile(str(temporary_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            os.replace(temporary_path, path)
+        except BaseException:
+            temporary_path.unlink(missing_ok=True)
+            raise
+        atexit.register(_remove_file, path, os.getpid())
+        logger.debug("Wrote shared data to %s", path)
+
+    _check_private(path)
+    # split_blocks=True gives each column its own block so that pandas does not copy columns to consolidate them.
+    return pa.ipc.open_file(pa.memory_map(str(path))).read_all().to_pandas(split_blocks=True)
@@ -0,0 +1,209 @@
+"""Serves blocks of rows to AG Grids that use the infinite row model, sorting and filtering them on the server."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import operator
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from dash import no_update, set_props
+from dash.exceptions import PreventUpdate
+
+from vizro._vizro_utils import _to_records
+from vizro.managers import data_manager
+from vizro.models._components._components_utils import _ServerSideStore
+
+logger = logging.getLogger(__name__)
+
+# Maximum number and total size of DataFrames that each process keeps in memory to serve rows from. This includes
+# DataFrames that are sorted and filtered by the grid, so that requests for further blocks of the same rows don't need
+# to repeat the work.
+_ROW_DATA_MAXSIZE = 64
+_ROW_DATA_MAXBYTES = 512 * 2**20
+
+# Prefix of the key under which the data of a grid is stored in data_manager.cache.
+_ROW_DATA_CACHE_KEY_PREFIX = "vizro_ag_grid_row_data_"
+
+# Number of seconds for which data without a version is kept in data_manager.cache. Such data can't be identified, so
+# it's stored under a new id every time a grid is drawn and is never reused by later renders.
+_UNVERSIONED_ROW_DATA_TIMEOUT = 600
+
+# Conditions of AG Grid's number and date column filters, which compare a cell with the filter's value.
+_COMPARISONS = {
+    "equals": operator.eq,
+    "notEqual": operator.ne,
+    "lessThan": operator.lt,
+    "lessThanOrEqual": operator.le,
+    "greaterThan": operator.gt,
+    "greaterThanOrEqual": operator.ge,
+}
+
+# Conditions of AG Grid's text column filter, which compare a lower case cell with the filter's lower case value.
+_TEXT_CONDITIONS = {
+    "equals": operator.eq,
+    "notEqual": operator.ne,
+    "contains": lambda values, value: values.str.contains(value, regex=False),
+    "notContains": lambda values, value: ~values.str.contains(value, regex=False),
+    "startsWith": lambda values, value: values.str.startswith(value),
+    "endsWith": lambda values, value: values.str.endswith(value),
+}
+
+
+def _get_row_data_id(data_frame: pd.DataFrame) -> str | None:
+    """Returns an id that identifies the rows and columns of `data_frame`, or None if it can't be identified.
+
+    A grid is drawn with data from the data manager that might be filtered by selecting some of its rows. Given the
+    version of the data, its columns and its unique index identify the data. Data without a version or with duplicate
+    index values can't be identified.
+    """
+    data_version = data_manager._get_data_version(data_frame)
+    if data_version is None or not data_frame.index.is_unique:
+        return None
+    digest = hashlib.sha256(json.dumps([str(column) for column in data_frame.columns]).encode())
+    digest.update(pd.util.hash_pandas_object(data_frame.index, index=False).to_numpy().tobytes())
+    return f"{data_version}_{digest.hexdigest()}"
+
+
+class _RowDataStore(_ServerSideStore):
+    """Data of AG Grids that use the infinite row model, from which blocks of rows are sent as the grid needs them."""
+
+    def set_data_frame(self, data_frame: pd.DataFrame, timeout: int | None) -> str:
+        """Stores `data_frame` and returns the id under which it's stored.
+
+        Data that can be identified by `_get_row_data_id` is stored under that id, so that drawing a grid again with
+        the same data reuses it. Other data is stored under a new id and kept in data_manager.cache for at most
+        `_UNVERSIONED_ROW_DATA_TIMEOUT` seconds.
+        """
+        if (row_data_id := _get_row_data_id(data_frame)) is not None:
+            return self.set(data_frame, timeout=timeout, stored_id=row_data_id)
+        return self.set(data_frame, timeout=_UNVERSIONED_ROW_DATA_TIMEOUT)
+
+    def get(self, row_data_id: str, filter_model: dict[str, Any], sort_model: list[dict[str, Any]]) -> pd.DataFrame:
+        """Returns the data stored under `row_data_id`, filtered by `filter_model` and sorted by `sort_model`.
+
+        Raises:
+            KeyError: If there is no data stored under `row_data_id`, e.g. because it has been evicted from the store.
+        """
+        if not filter_model and not sort_model:
+            return self.load(row_data_id)
+        key = (row_data_id, json.dumps(filter_model, sort_keys=True), json.dumps(sort_model))
+        if (data := self._get(key)) is not None:
+            return data
+
+        data = _apply_sort_model(_apply_filter_model(self.load(row_data_id), filter_model), sort_model)
+        self._put(key, data)
+        return data
+
+
+_row_data_store = _RowDataStore(
+    maxsize=_ROW_DATA_MAXSIZE, maxbytes=_ROW_DATA_MAXBYTES, cache_key_prefix=_ROW_DATA_CACHE_KEY_PREFIX
+)
+
+
+def _get_condition_mask(series: pd.Series, condition: dict[str, Any]) -> np.ndarray:
+    """Returns which values of `series` satisfy a single condition of an AG Grid column filter.
+
+    This follows AG Grid's default behavior: text conditions are case-insensitive, blank cells satisfy only the
+    notEqual and notContains text conditions, date conditions compare just the date and inRange excludes its ends.
+    """
+    filter_type, condition_type = condition.get("filterType"), condition.get("type")
+    value: Any
+    value_to: Any
+    if filter_type == "set":
+        return series.isin(condition["values"]).to_numpy()
+
+    if filter_type == "text":
+        values = series.astype("string").str.lower()
+        blank = values.str.strip().eq("").fillna(True)
+        if condition_type in _TEXT_CONDITIONS:
+            mask = _TEXT_CONDITIONS[condition_type](values, str(condition["filter"]).lower())
+            return np.where(
+                blank.to_numpy(dtype=bool),
+                condition_type in {"notEqual", "notContains"},
+                mask.fillna(False).to_numpy(dtype=bool),
+            )
+    elif filter_type == "date":
+        # The date filter gives its values as strings like "2024-01-31 00:00:00".
+        values = pd.to_datetime(series).dt.normalize()
+        blank = values.isna()
+        # Blank and notBlank conditions have no values.
+        value, value_to = (
+            pd.Timestamp(date) if date else None for date in (condition.get("dateFrom"), condition.get("dateTo"))
+        )
+    elif filter_type == "number":
+        values, value, value_to = series, condition.get("filter"), condition.get("filterTo")
+        blank = values.isna()
+    else:
+        raise ValueError(f"AG Grid filter type {filter_type} is not supported.")
+
+    if condition_type in {"blank", "notBlank"}:
+        return blank.to_numpy() == (condition_type == "blank")
+    if filter_type != "text" and condition_type == "inRange":
+        mask = (values > value) & (values < value_to)
+    elif filter_type != "text" and condition_type in _COMPARISONS:
+        mask = _COMPARISONS[condition_type](values, value)
+    else:
+        raise ValueError(f"AG Grid {filter_type} filter condition {condition_type} is not supported.")
+    return mask.fillna(False).to_numpy(dtype=bool) & ~blank.to_numpy()
+
+
+def _get_column_filter_mask(series: pd.Series, column_filter: dict[str, Any]) -> np.ndarray:
+    """Returns which values of `series` satisfy an AG Grid column filter, which can combine several conditions."""
+    if "operator" not in column_filter:
+        return _get_condition_mask(series, column_filter)
+    # Conditions are given as a list in AG Grid >= 29 and as condition1 and condition2 before that.
+    conditions = column_filter.get("conditions") or [
+        column_filter[key] for key in ("condition1", "condition2") if key in column_filter
+    ]
+    masks = [_get_condition_mask(series, condition) for condition in conditions]
+    return np.logical_and.reduce(masks) if column_filter["operator"] == "AND" else np.logical_or.reduce(masks)
+
+
+def _apply_filter_model(data: pd.DataFrame, filter_model: dict[str, Any]) -> pd.DataFrame:
+    """Filters `data` by the filterModel of an AG Grid, which gives a column filter for each filtered column."""
+    if not filter_model:
+        return data
+    mask = np.logical_and.reduce(
+        [_get_column_filter_mask(data[column], column_filter) for column, column_filter in filter_model.items()]
+    )
+    return data[mask]
+
+
+def _apply_sort_model(data: pd.DataFrame, sort_model: list[dict[str, Any]]) -> pd.DataFrame:
+    """Sorts `data` by the sortModel of an AG Grid, which gives the columns to sort by in order of priority."""
+    if not sort_model:
+        return data
+    return data.sort_values(
+        by=[sort["colId"] for sort in sort_model],
+        ascending=[sort["sort"] == "asc" for sort in sort_model],
+        kind="stable",
+    )
+
+
+def _get_rows(
+    get_rows_request: dict[str, Any] | None, row_data_id: str | None, reload_trigger_id: str | None = None
+) -> dict[str, Any]:
+    """Returns the getRowsResponse to an AG Grid's getRowsRequest for a block of rows.
+
+    If the grid's data is no longer stored, e.g. because it has been evicted from the store, the figures of the page are
+    reloaded by setting `reload_trigger_id`, the page's on page load trigger. This draws the grid again with the
+    current values of the page's controls and its data stored under a new id.
+    """
+    if get_rows_request is None or row_data_id is None:
+        raise PreventUpdate
+    try:
+        data = _row_data_store.get(
+            row_data_id, get_rows_request.get("filterModel") or {}, get_rows_request.get("sortModel") or []
+        )
+    except KeyError:
+        logger.warning("Data of AG Grid with row data id %s is no longer stored; reloading the page.", row_data_id)
+        if reload_trigger_id is None:
+            raise PreventUpdate
+        set_props(reload_trigger_id, {"data": None})
+        return no_update  # type: ignore[return-value]
+    rows = data.iloc[get_rows_request["startRow"] : get_rows_request["endRow"]]
+    return {"rowData": _to_records(rows), "rowCount": len(data)}
@@ -1,7 +1,14 @@
 import logging
+import threading
 import uuid
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from flask_caching.backends.nullcache import NullCache
 
 from vizro.managers import data_manager
+from vizro.managers._data_manager import _get_nbytes
 
 logger = logging.getLogger(__name__)
 
@@ -33,3 +40,103 @@ def _process_callable_data_frame(captured_callable):
     captured_callable["data_frame"] = data_source_name
 
     return captured_callable
+
+
+def _get_column_names(value: Any) -> set[str]:
+    """Returns the column names in a figure argument that refers to columns.
+
+    Columns are referred to by a single name, a list of names or a dictionary keyed by name, e.g.
+    `hover_data={"column": True}`. Any other value, such as an array of data, gives no names.
+    """
+    if isinstance(value, str):
+        return {value}
+    if isinstance(value, (list, tuple, dict)):
+        return {item for item in value if isinstance(item, str)}
+    return set()
+
+
+class _ServerSideStore:
+    """Data that a component keeps on the server and refers to in the browser by an id.
+
+    Each time a component is drawn, its data is stored under an id that is sent to the browser with the component. This
+    is a new id unless the data can be identified by a deterministic id, in which case data that's already stored under
+    that id is reused. The data is kept in a bounded store in this process and also put in data_manager.cache, so that
+    other processes that share the cache, such as gunicorn workers with a RedisCache, can also use it. Subclasses can
+    keep data that is derived from the stored data in the same bounded store with `_put` and `_get`.
+
+    Entries are evicted least recently used first once there are more than `maxsize` of them or their total size is
+    more than `maxbytes`. The entry that was stored last is never evicted, so that a component can always use its data
+    in this process however large it is.
+    """
+
+    def __init__(self, maxsize: int, maxbytes: int, cache_key_prefix: str):
+        self.__maxsize = maxsize
+        self.__maxbytes = maxbytes
+        self.__cache_key_prefix = cache_key_prefix
+        self.__data: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self.__nbytes = 0
+        self.__lock = threading.Lock()
+
+    def _put(self, key: Hashable, value: Any):
+        nbytes = _get_nbytes(value)
+        with self.__lock:
+            if key in self.__data:
+                self.__nbytes -= self.__data.pop(key)[1]
+            self.__data[key] = (value, nbytes)
+            self.__nbytes += nbytes
+            while len(self.__data) > 1 and (len(self.__data) > self.__maxsize or self.__nbytes > self.__maxbytes):
+                self.__nbytes -= self.__data.popitem(last=False)[1][1]
+
+    def _get(self, key: Hashable) -> Any | None:
+        with self.__lock:
+            if key not in self.__data:
+                return None
+            self.__data.move_to_end(key)
+            return self.__data[key][0]
+
+    @staticmethod
+    def __shared_cache_active() -> bool:
+        return data_manager._cache_has_app and not isinstance(data_manager.cache.cache, NullCache)
+
+    def set(self, value: Any, timeout: int | None = None, stored_id: str | None = None) -> str:
+        """Stores `value` and returns the id under which it's stored.
+
+        Args:
+            value: Value to store.
+            timeout: Number of seconds for which `value` is kept in data_manager.cache. Defaults to `None`, which uses
+                the cache's default timeout.
+            stored_id: Id that identifies `value`, so that any value stored under the same id is the same. If it's
+                already stored under this id, in this process or in data_manager.cache, then it is not stored again.
+                Defaults to `None`, which stores `value` under a new id.
+        """
+        is_new_id = stored_id is None
+        if stored_id is None:
+            stored_id = uuid.uuid4().hex
+        elif self._get(stored_id) is not None:
+            return stored_id
+        self._put(stored_id, value)
+        if self.__shared_cache_active():
+            cache_key = f"{self.__cache_key_prefix}{stored_id}"
+            # A new id can't be in the cache already, so the cache is only checked for a deterministic id.
+            if is_new_id or not data_manager.cache.has(cache_key):
+                data_manager.cache.set(cache_key, value, timeout=timeout)
+        return stored_id
+
+    def load(self, stored_id: str) -> Any:
+        """Returns the value stored under `stored_id`.
+
+        Raises:
+            KeyError: If there is no value stored under `stored_id`, e.g. because it has been evicted from the store.
+        """
+        if (value := self._get(stored_id)) is None:
+            if self.__shared_cache_active():
+                value = data_manager.cache.get(f"{self.__cache_key_prefix}{stored_id}")
+            if value is None:
+                raise KeyError(f"Data with id {stored_id} does not exist.")
+            self._put(stored_id, value)
+        return value
+
+
+def _get_cache_timeout(data_source_name: str) -> int | None:
+    """Returns the cache timeout of a data source, which is None for static data that doesn't have a timeout."""
+    return getattr(data_manager[data_source_name], "timeout", None)
@@ -0,0 +1,371 @@
+"""Reduces the number of points that Graph figures send to the browser by downsampling traces and binning histograms."""
+
+from __future__ import annotations
+
+import base64
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+import plotly
+from dash import Patch
+from dash.exceptions import PreventUpdate
+from packaging.version import parse
+from plotly import graph_objects as go
+
+from vizro.charts._charts_utils import _DashboardReadyFigure
+from vizro.models._components._components_utils import _ServerSideStore
+
+# Maximum number and total size of the full resolution traces of figures that each process keeps, to resample them when
+# zoomed.
+_FULL_RESOLUTION_MAXSIZE = 64
+_FULL_RESOLUTION_MAXBYTES = 256 * 2**20
+
+# Prefix of the key under which the full resolution traces of a figure are stored in data_manager.cache.
+_FULL_RESOLUTION_CACHE_KEY_PREFIX = "vizro_graph_full_resolution_"
+
+# Properties of scatter traces that can give a value for each point and so are downsampled together with x and y.
+_POINT_PROPERTIES = (
+    "x",
+    "y",
+    "customdata",
+    "text",
+    "hovertext",
+    "ids",
+    "marker.color",
+    "marker.size",
+    "marker.symbol",
+    "marker.opacity",
+    "error_x.array",
+    "error_x.arrayminus",
+    "error_y.array",
+    "error_y.arrayminus",
+)
+
+# Data types of the typed arrays that plotly.js decodes from base64, keyed by their numpy names.
+_TYPED_ARRAY_DTYPES = {
+    "int8": "i1",
+    "uint8": "u1",
+    "int16": "i2",
+    "uint16": "u2",
+    "int32": "i4",
+    "uint32": "u4",
+    "float32": "f4",
+    "float64": "f8",
+}
+
+# plotly >= 6 encodes the numerical arrays of a figure as typed arrays itself when it's converted to JSON.
+_PLOTLY_ENCODES_TYPED_ARRAYS = parse(plotly.__version__) >= parse("6")
+
+_full_resolution_store = _ServerSideStore(
+    maxsize=_FULL_RESOLUTION_MAXSIZE,
+    maxbytes=_FULL_RESOLUTION_MAXBYTES,
+    cache_key_prefix=_FULL_RESOLUTION_CACHE_KEY_PREFIX,
+)
+
+
+def _to_numeric(values: Any) -> np.ndarray | None:
+    """Returns `values` as floats, with datetimes as nanoseconds since the epoch, or None if they're not numerical."""
+    values = np.asarray(values)
+    if values.dtype.kind in "iufb":
+        return values.astype(float)
+    if values.dtype.kind == "M":
+        datetimes = values.astype("datetime64[ns]")
+        return np.where(np.isnat(datetimes), np.nan, datetimes.astype("int64").astype(float))
+    return None
+
+
+def _get_lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Returns the indices of `n_out` points chosen by the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept. The points in between are split into `n_out - 2` buckets, and from each
+    bucket the point that forms the largest triangle with the point chosen from the previous bucket and the average of
+    the next bucket is chosen. This keeps the visual shape of a line, including its peaks and troughs.
+    """
+    n = len(x)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    indices = np.empty(n_out, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # The last bucket is followed by just the last point.
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        # Missing values give no area, so are chosen only when the whole bucket is missing.
+        previous = start + int(np.nan_to_num(areas, nan=-1.0).argmax())
+        indices[bucket + 1] = previous
+    return indices
+
+
+def _get_min_max_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Returns the indices of at most `n_out` points that have the smallest and largest y in buckets along x.
+
+    The points are split into `n_out // 2` buckets of about the same number of points in order of x. Unlike LTTB, this
+    does not need the points to be ordered by x, so it suits markers that are not connected by lines.
+    """
+    n, n_buckets = len(x), max(n_out // 2, 1)
+    order = np.argsort(x, kind="stable")
+    buckets = np.arange(n) * n_buckets // n
+    # Sort the points in each bucket by y, so that each bucket starts with its smallest y and ends with its largest.
+    by_y = order[np.lexsort((y[order], buckets))]
+    starts = np.searchsorted(buckets, np.arange(n_buckets))
+    ends = np.append(starts[1:], n) - 1
+    return np.unique(by_y[np.concatenate([starts, ends])])
+
+
+def _get_downsampled_indices(
+    x: np.ndarray, y: np.ndarray, lines: bool, max_points: int, x_range: tuple[float, float] | None = None
+) -> np.ndarray:
+    """Returns the indices of at most `max_points` points to draw, optionally just those in `x_range`."""
+    indices = np.arange(len(x))
+    if x_range is not None:
+        inside = (x >= x_range[0]) & (x <= x_range[1])
+        if lines:
+            # Keep the points next to the range too, so that lines continue to the edges of the plot.
+            inside[1:] |= inside[:-1].copy()
+            inside[:-1] |= inside[1:].copy()
+        indices = np.flatnonzero(inside)
+    if len(indices) <= max_points:
+        return indices
+    get_indices = _get_lttb_indices if lines else _get_min_max_indices
+    return indices[get_indices(x[indices], y[indices], max_points)]
+
+
+def _get_scatter_points(trace: go.Scatter | go.Scattergl, max_points: int) -> dict[str, Any] | None:
+    """Returns the points of a scatter trace that has more than `max_points` points, or None if it can't be downsampled.
+
+    Traces that are stacked, or whose x or y are not numerical or datetimes, are not downsampled.
+    """
+    # Only go.Scatter traces can be stacked.
+    stacked = getattr(trace, "stackgroup", None) is not None
+    if trace.y is None or trace.x is None or len(trace.y) <= max_points or stacked:
+        return None
+    x, y = _to_numeric(trace.x), _to_numeric(trace.y)
+    if x is None or y is None or len(x) != len(y):
+        return None
+    properties = {}
+    for point_property in _POINT_PROPERTIES:
+        value = trace[point_property]
+        if value is not None and not isinstance(value, str) and np.ndim(value) > 0 and len(value) == len(y):
+            properties[point_property] = np.asarray(value)
+    return {
+        "properties": properties,
+        "x": x,
+        "y": y,
+        # Scatter traces are drawn with lines by default.
+        "lines": "lines" in (trace.mode or "lines"),
+        "xaxis": f"xaxis{(trace.xaxis or 'x')[1:]}",
+    }
+
+
+def _get_bins(values: np.ndarray, nbins: int | None, max_points: int) -> np.ndarray:
+    """Returns `nbins` equal bins that cover `values`, or as many as numpy's "auto" estimator gives if it's None."""
+    low, high = np.nanmin(values), np.nanmax(values)
+    if high == low:
+        high = low + 1
+    if nbins is None:
+        nbins = min(len(np.histogram_bin_edges(values[~np.isnan(values)], bins="auto")) - 1, max_points)
+    return np.linspace(low, high, nbins + 1)
+
+
+def _get_bins_property(bins: np.ndarray) -> dict[str, float]:
+    return {"start": bins[0], "end": bins[-1], "size": bins[1] - bins[0]}
+
+
+def _bin_histograms(fig: go.Figure, max_points: int):
+    """Bins histograms that have more than `max_points` values on the server rather than in the browser.
+
+    Each histogram then gets one value at the center of each of its non-empty bins with the bin's count, which plotly
+    sums. This gives the same bars as binning the values in the browser, including the same normalization with
+    `histnorm`. Histograms in a figure that bin the same axis share the same bins. Only histograms that count numerical
+    values are binned.
+    """
+    histograms: dict[str, list[tuple[go.Histogram, np.ndarray]]] = {"x": [], "y": []}
+    for trace in fig.data:
+        if not isinstance(trace, go.Histogram) or trace.histfunc not in {None, "count"}:
+            continue
+        if (trace.x is None) == (trace.y is None):
+            continue
+        axis = "x" if trace.x is not None else "y"
+        if (values := np.asarray(trace[axis])).dtype.kind in "iuf":
+            histograms[axis].append((trace, values.astype(float)))
+
+    for axis, traces in histograms.items():
+        if sum(len(values) for _, values in traces) <= max_points:
+            continue
+        all_values = np.concatenate([values for _, values in traces])
+        bins = _get_bins(all_values, traces[0][0][f"nbins{axis}"], max_points)
+        centers = (bins[:-1] + bins[1:]) / 2
+        value_axis = "y" if axis == "x" else "x"
+        for trace, values in traces:
+            counts, _ = np.histogram(values[~np.isnan(values)], bins=bins)
+            non_empty = counts > 0
+            trace.update(
+                {axis: centers[non_empty], value_axis: counts[non_empty], f"{axis}bins": _get_bins_property(bins)},
+                histfunc="sum",
+            )
+            trace[f"nbins{axis}"] = None
+
+    for trace in fig.data:
+        if not isinstance(trace, (go.Histogram2d, go.Histogram2dContour)) or trace.histfunc not in {None, "count"}:
+            continue
+        if trace.z is not None or trace.x is None or trace.y is None or len(trace.x) <= max_points:
+            continue
+        x, y = np.asarray(trace.x), np.asarray(trace.y)
+        if x.dtype.kind not in "iuf" or y.dtype.kind not in "iuf":
+            continue
+        x, y = x.astype(float), y.astype(float)
+        present = ~(np.isnan(x) | np.isnan(y))
+        x_bins = _get_bins(x[present], trace.nbinsx, max_points)
+        y_bins = _get_bins(y[present], trace.nbinsy, max_points)
+        counts, _, _ = np.histogram2d(x[present], y[present], bins=[x_bins, y_bins])
+        x_index, y_index = np.nonzero(counts)
+        trace.update(
+            x=((x_bins[:-1] + x_bins[1:]) / 2)[x_index],
+            y=((y_bins[:-1] + y_bins[1:]) / 2)[y_index],
+            z=counts[x_index, y_index],
+            histfunc="sum",
+            xbins=_get_bins_property(x_bins),
+            ybins=_get_bins_property(y_bins),
+            nbinsx=None,
+            nbinsy=None,
+        )
+
+
+def _downsample_figure(fig: go.Figure, max_points: int) -> dict[int, dict[str, Any]]:
+    """Reduces the number of points in `fig` to at most `max_points` for each trace, modifying `fig` in place.
+
+    Line traces are downsampled with LTTB and traces with just markers with min-max decimation. Histograms are binned
+    on the server. See `_bin_histograms`.
+
+    Returns:
+        The full resolution points of the line and scatter traces that were downsampled, keyed by the trace's index.
+    """
+    full_resolution = {}
+    for trace_index, trace in enumerate(fig.data):
+        if not isinstance(trace, (go.Scatter, go.Scattergl)):
+            continue
+        if (points := _get_scatter_points(trace, max_points)) is None:
+            continue
+        indices = _get_downsampled_indices(points["x"], points["y"], points["lines"], max_points)
+        for point_property, values in points["properties"].items():
+            trace[point_property] = values[indices]
+        full_resolution[trace_index] = points
+    _bin_histograms(fig, max_points)
+    return full_resolution
+
+
+def _to_typed_array(values: np.ndarray) -> np.ndarray | dict[str, str]:
+    """Returns numerical `values` as a plotly.js typed array, which is encoded in base64 rather than as a JSON list.
+
+    plotly >= 6 already encodes the arrays of a figure like this, and `_TypedArrayFigure` does so for plotly < 6, but
+    Dash encodes the values of a `Patch` as lists.
+    plotly.js has no 64-bit integer typed arrays, so 64-bit integers are converted to the smallest integer type that
+    holds them. Other values, and integers that don't fit in 32 bits, are returned unchanged.
+    """
+    if values.dtype.name in {"int64", "uint64"} and values.size:
+        low, high = values.min(), values.max()
+        for itemsize in (1, 2, 4):
+            info = np.iinfo(f"{values.dtype.kind}{itemsize}")
+            if info.min <= low and high <= info.max:
+                values = values.astype(info.dtype)
+                break
+    if values.dtype.name not in _TYPED_ARRAY_DTYPES or values.size == 0:
+        return values
+    # plotly.js reads the bytes as little-endian.
+    data = values.astype(values.dtype.newbyteorder("<"), copy=False).tobytes()
+    typed_array = {"dtype": _TYPED_ARRAY_DTYPES[values.dtype.name], "bdata": base64.b64encode(data).decode("ascii")}
+    if values.ndim > 1:
+        typed_array["shape"] = ", ".join(str(size) for size in values.shape)
+    return typed_array
+
+
+def _encode_typed_arrays(properties: dict[str, Any]) -> dict[str, Any]:
+    """Returns trace `properties` with their numerical arrays, including nested ones like marker.size, encoded."""
+    return {
+        name: _encode_typed_arrays(value)
+        if isinstance(value, dict)
+        else _to_typed_array(value)
+        if isinstance(value, np.ndarray)
+        else value
+        for name, value in properties.items()
+    }
+
+
+class _TypedArrayFigure(_DashboardReadyFigure):
+    """Figure whose numerical arrays are sent to the browser as typed arrays, like plotly >= 6 does for any figure.
+
+    Typed arrays can't be assigned to the traces of a figure with plotly < 6, so they are only encoded when Dash
+    converts the figure to JSON.
+    """
+
+    def to_plotly_json(self):
+        figure = super().to_plotly_json()
+        figure["data"] = [_encode_typed_arrays(trace) for trace in figure["data"]]
+        for frame in figure.get("frames", []):
+            frame["data"] = [_encode_typed_arrays(trace) for trace in frame.get("data", [])]
+        return figure
+
+
+def _get_x_range(relayout_data: dict[str, Any], xaxis: str) -> tuple[Any, Any] | None:
+    """Returns the x-axis range in a graph's relayoutData, or None if the x-axis is reset to its full range.
+
+    Raises:
+        KeyError: If `relayout_data` does not change the x-axis range.
+    """
+    if relayout_data.get(f"{xaxis}.autorange"):
+        return None
+    if f"{xaxis}.range" in relayout_data:
+        return tuple(relayout_data[f"{xaxis}.range"])
+    return relayout_data[f"{xaxis}.range[0]"], relayout_data[f"{xaxis}.range[1]"]
+
+
+def _get_numeric_x_range(x_range: tuple[Any, Any], is_date: bool) -> tuple[float, float]:
+    # Ranges of date axes are given as strings such as "2024-01-31 12:00:00.5".
+    values = pd.to_datetime(list(x_range), format="mixed").to_numpy() if is_date else np.array(x_range)
+    low, high = cast(np.ndarray, _to_numeric(values))
+    return low, high
+
+
+def _resample_on_zoom(relayout_data: dict[str, Any] | None, full_resolution_id: str | None) -> Patch:
+    """Returns a patch of a graph's figure that resamples the downsampled traces in the zoomed x-axis range.
+
+    The points in the zoomed range are drawn at full resolution when there are at most `max_points` of them and are
+    downsampled again otherwise. Zooming out to the full range restores the original downsampled traces.
+    """
+    if not relayout_data or full_resolution_id is None:
+        raise PreventUpdate
+    try:
+        full_resolution = _full_resolution_store.load(full_resolution_id)
+    except KeyError:
+        # The figure keeps its downsampled traces if its full resolution traces are no longer stored.
+        raise PreventUpdate
+
+    patch = Patch()
+    patched = False
+    for trace_index, points in full_resolution["traces"].items():
+        try:
+            x_range = _get_x_range(relayout_data, points["xaxis"])
+        except KeyError:
+            continue
+        if x_range is not None:
+            x_range = _get_numeric_x_range(x_range, is_date=points["properties"]["x"].dtype.kind == "M")
+        indices = _get_downsampled_indices(
+            points["x"], points["y"], points["lines"], full_resolution["max_points"], x_range
+        )
+        for point_property, values in points["properties"].items():
+            location = patch["data"][trace_index]
+            *parents, name = point_property.split(".")
+            for parent in parents:
+                location = location[parent]
+            location[name] = _to_typed_array(values[indices])
+        patched = True
+
+    if not patched:
+        raise PreventUpdate
+    return patch
@@ -1,10 +1,11 @@
 import logging
+import re
 from typing import Annotated, Any, Literal, TypeAlias, TypedDict, cast
 
 import dash_ag_grid as dag
 import pandas as pd
 import vizro_dash_components as vdc
-from dash import ClientsideFunction, Input, Output, State, clientside_callback, dcc, html, no_update
+from dash import ClientsideFunction, Input, Output, State, callback, clientside_callback, dcc, html, no_update
 from pydantic import (
     AfterValidator,
     BeforeValidator,
@@ -15,12 +16,18 @@ from pydantic import (
 )
 from pydantic.json_schema import SkipJsonSchema
 
+from vizro._constants import ON_PAGE_LOAD_ACTION_PREFIX
 from vizro.actions import filter_interaction, set_control
 from vizro.actions._actions_utils import CallbackTriggerDict, _get_triggered_model
 from vizro.managers import data_manager, model_manager
 from vizro.managers._model_manager import DuplicateIDError
 from vizro.models import Tooltip, VizroBaseModel
-from vizro.models._components._components_utils import _process_callable_data_frame
+from vizro.models._components._ag_grid_row_model import _get_rows, _row_data_store
+from vizro.models._components._components_utils import (
+    _get_cache_timeout,
+    _get_column_names,
+    _process_callable_data_frame,
+)
 from vizro.models._models_utils import (
     _log_call,
     make_actions_chain,
@@ -46,6 +53,42 @@ DAG_AG_GRID_PROPERTIES = set(dag.AgGrid().available_properties) - set(html.Div()
 # User-friendly shortcuts for accessing `cellClicked` trigger fields since its structure differs from `selectedRows`.
 CELL_CLICKED_MAPPING = {"cell": "value", "column": "colId", "row": "rowId"}
 
+# Matches JavaScript in AG Grid arguments that might read row data, e.g. `params.data.column` in a valueGetter function,
+# getRowId or rowClassRules.
+_ROW_DATA_ACCESS_PATTERN = re.compile(r"\bdata\s*[.\[]")
+
+
+def _get_column_defs_fields(column_defs: list[Any]) -> set[str] | None:
+    """Returns the fields of all columns in `column_defs`, including those in column groups.
+
+    Returns None if a column does not have a field, for example if it uses a valueGetter instead.
+    """
+    fields: set[str] = set()
+    for column_def in column_defs:
+        if not isinstance(column_def, dict):
+            return None
+        if "children" in column_def:
+            children_fields = _get_column_defs_fields(column_def["children"])
+            if children_fields is None:
+                return None
+            fields |= children_fields
+        elif isinstance(column_def.get("field"), str):
+            fields.add(column_def["field"])
+        else:
+            return None
+    return fields
+
+
+def _reads_row_data(value: Any) -> bool:
+    """Whether any string in an AG Grid argument, possibly nested in dictionaries and lists, might read row data."""
+    if isinstance(value, str):
+        return bool(_ROW_DATA_ACCESS_PATTERN.search(value))
+    if isinstance(value, dict):
+        return any(_reads_row_data(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_reads_row_data(item) for item in value)
+    return False
+
 
 class CellClicked(TypedDict):
     value: Any
@@ -218,7 +261,44 @@ class AgGrid(VizroBaseModel):
             if all_selected_rows_actions:
                 figure.dashGridOptions.setdefault("suppressCellFocus", True)
 
-        return html.Div([figure, dcc.Store(id=f"{self._inner_component_id}_guard_actions_chain", data=True)])
+        children = [figure, dcc.Store(id=f"{self._inner_component_id}_guard_actions_chain", data=True)]
+        # With the infinite row model, the data is kept on the server and the grid requests blocks of rows from it. See
+        # the callback defined in build.
+        if self._uses_infinite_row_model:
+            row_data_id = _row_data_store.set_data_frame(
+                kwargs["data_frame"], timeout=_get_cache_timeout(self["data_frame"])
+            )
+            children.append(dcc.Store(id=f"{self._inner_component_id}_row_data_id", data=row_data_id))
+        return html.Div(children)
+
+    @property
+    def _uses_infinite_row_model(self) -> bool:
+        return self.figure._arguments.get("rowModelType") == "infinite"
+
+    def _get_referenced_columns(self, figure_kwargs: dict[str, Any]) -> set[str] | None:
+        """Returns the columns of `data_frame` that the figure uses when called with `figure_kwargs`.
+
+        Returns None if the figure might use any column. Every column of the data is sent to the grid as `rowData`,
+        so this is known only for `dash_ag_grid` with `columnDefs` that give the field of every column and no
+        JavaScript that reads row data. The only actions must also be `set_control` and `filter_interaction`, which
+        read just the shown columns and the column given as `set_control` value.
+        """
+        function = self.figure._function
+        if (
+            getattr(function, "__module__", None) != "vizro.tables._dash_ag_grid"
+            or not isinstance(figure_kwargs.get("columnDefs"), list)
+            or _reads_row_data(figure_kwargs)
+            or not all(isinstance(action, (set_control, filter_interaction)) for action in self.actions)
+        ):
+            return None
+
+        columns = _get_column_defs_fields(figure_kwargs["columnDefs"])
+        if columns is None:
+            return None
+        for action in self.actions:
+            if isinstance(action, set_control) and isinstance(action.value, str):
+                columns |= _get_column_names(action.value) - CELL_CLICKED_MAPPING.keys()
+        return columns
 
     # Convenience wrapper/syntactic sugar.
     def __getitem__(self, arg_name: str):
@@ -288,6 +368,16 @@ class AgGrid(VizroBaseModel):
             prevent_initial_call=True,
             hidden=True,
         )
+        if self._uses_infinite_row_model:
+            # The page's on page load trigger is used to draw the grid again if its data is no longer stored.
+            page = model_manager._get_model_page(self)
+            callback(
+                Output(self._inner_component_id, "getRowsResponse"),
+                Input(self._inner_component_id, "getRowsRequest"),
+                State(f"{self._inner_component_id}_row_data_id", "data"),
+                *([State(f"{ON_PAGE_LOAD_ACTION_PREFIX}_trigger_{page.id}", "id")] if page is not None else []),
+                prevent_initial_call=True,
+            )(_get_rows)
 
         description = self.description.build().children if self.description else [None]
         return dcc.Loading(
@@ -1,4 +1,4 @@
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 from dash import dcc, html
 from pydantic import AfterValidator, Field, JsonValue, field_validator, model_validator
@@ -6,10 +6,13 @@ from pydantic.json_schema import SkipJsonSchema
 
 from vizro.managers import data_manager
 from vizro.models import VizroBaseModel
-from vizro.models._components._components_utils import _process_callable_data_frame
+from vizro.models._components._components_utils import _get_column_names, _process_callable_data_frame
 from vizro.models._models_utils import _log_call, make_actions_chain
 from vizro.models.types import ActionsType, CapturedCallable, _IdProperty, _validate_captured_callable
 
+# Arguments of the figure functions in vizro.figures that refer to columns of data_frame.
+_FIGURE_COLUMN_ARGUMENTS = ("value_column", "reference_column")
+
 
 class Figure(VizroBaseModel):
     """Object that is reactive to controls, for example a KPI card.
@@ -61,6 +64,16 @@ class Figure(VizroBaseModel):
         figure = self.figure(**kwargs)
         return figure
 
+    def _get_referenced_columns(self, figure_kwargs: dict[str, Any]) -> set[str] | None:
+        """Returns the columns of `data_frame` that the figure uses when called with `figure_kwargs`.
+
+        Returns None if the figure might use any column. Only the figure functions in `vizro.figures` are known to
+        refer to columns just through their arguments; a custom figure could use any column.
+        """
+        if getattr(self.figure._function, "__module__", None) != "vizro.figures.library":
+            return None
+        return set().union(*(_get_column_names(figure_kwargs.get(argument)) for argument in _FIGURE_COLUMN_ARGUMENTS))
+
     def __getitem__(self, arg_name: str):
         # pydantic discriminated union validation seems to try Figure["type"], which throws an error unless we
         # explicitly redirect it to the correct attribute.
@@ -1,3 +1,4 @@
+import inspect
 import logging
 import warnings
 from contextlib import suppress
@@ -6,18 +7,39 @@ from typing import Annotated, Any, Literal, cast
 import pandas as pd
 import vizro_dash_components as vdc
 from box import Box, BoxList
-from dash import ClientsideFunction, Input, Output, State, clientside_callback, dcc, html, set_props
+from dash import ClientsideFunction, Input, Output, State, callback, clientside_callback, dcc, html, set_props
 from dash.exceptions import MissingCallbackContextException
 from plotly import graph_objects as go
-from pydantic import AfterValidator, BeforeValidator, Field, JsonValue, field_validator, model_validator
+from pydantic import (
+    AfterValidator,
+    BeforeValidator,
+    Field,
+    JsonValue,
+    PositiveInt,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 from pydantic.json_schema import SkipJsonSchema
 
+from vizro._constants import WEBGL_THRESHOLD_DEFAULT
 from vizro._vizro_utils import _set_defaults_nested
 from vizro.actions import filter_interaction
 from vizro.actions._actions_utils import CallbackTriggerDict
 from vizro.managers import data_manager, model_manager
 from vizro.models import Tooltip, VizroBaseModel
-from vizro.models._components._components_utils import _process_callable_data_frame
+from vizro.models._components._components_utils import (
+    _get_cache_timeout,
+    _get_column_names,
+    _process_callable_data_frame,
+)
+from vizro.models._components._graph_downsampling import (
+    _PLOTLY_ENCODES_TYPED_ARRAYS,
+    _downsample_figure,
+    _full_resolution_store,
+    _resample_on_zoom,
+    _TypedArrayFigure,
+)
 from vizro.models._models_utils import (
     _log_call,
     make_actions_chain,
@@ -35,6 +57,122 @@ from vizro.models.types import (
 
 logger = logging.getLogger(__name__)
 
+# Arguments of plotly express chart functions that refer to columns of data_frame.
+_PX_COLUMN_ARGUMENTS = (
+    "x",
+    "y",
+    "z",
+    "a",
+    "b",
+    "c",
+    "r",
+    "theta",
+    "base",
+    "size",
+    "x_start",
+    "x_end",
+    "hover_name",
+    "hover_data",
+    "custom_data",
+    "text",
+    "names",
+    "values",
+    "parents",
+    "ids",
+    "path",
+    "dimensions",
+    "error_x",
+    "error_x_minus",
+    "error_y",
+    "error_y_minus",
+    "error_z",
+    "error_z_minus",
+    "lat",
+    "lon",
+    "locations",
+    "color",
+    "symbol",
+    "line_dash",
+    "pattern_shape",
+    "line_group",
+    "facet_row",
+    "facet_col",
+    "animation_frame",
+    "animation_group",
+)
+
+# Scatter traces that plotly can draw with SVG or WebGL, mapped to their WebGL type.
+_WEBGL_TRACE_TYPES: dict[type[go.Scatter | go.Scatterpolar], type[go.Scattergl | go.Scatterpolargl]] = {
+    go.Scatter: go.Scattergl,
+    go.Scatterpolar: go.Scatterpolargl,
+}
+
+
+# Properties of SVG scatter traces that only affect stacked traces, which are never drawn with WebGL. plotly express
+# sets orientation on all its scatter traces, so these are dropped without a warning.
+_STACKING_PROPERTIES = {"orientation", "groupnorm", "stackgaps"}
+
+
+def _get_n_points(trace: go.Scatter | go.Scattergl | go.Scatterpolar | go.Scatterpolargl) -> int:
+    values = trace.r if isinstance(trace, (go.Scatterpolar, go.Scatterpolargl)) else trace.y
+    return len(values) if values is not None else 0
+
+
+def _get_dropped_properties(properties: dict[str, Any], new_properties: dict[str, Any], prefix: str = "") -> list[str]:
+    """Returns the paths of the trace properties in `properties` that are not in `new_properties`."""
+    dropped = []
+    for name, value in properties.items():
+        if name not in new_properties:
+            dropped.append(f"{prefix}{name}")
+        elif isinstance(value, dict) and isinstance(new_properties[name], dict):
+            dropped.extend(_get_dropped_properties(value, new_properties[name], prefix=f"{prefix}{name}."))
+    return dropped
+
+
+def _set_render_mode(fig: go.Figure, webgl_threshold: int):
+    """Draws the scatter traces of `fig` with WebGL if they have more than `webgl_threshold` points in total.
+
+    Like plotly express does for its own charts, traces are not drawn with WebGL in animated figures or when they have
+    features that WebGL can't draw, namely stacking and spline lines. WebGL traces in figures with fewer points are
+    drawn with SVG instead. Properties that the new type of trace doesn't have are dropped with a warning.
+    """
+    trace_types = (*_WEBGL_TRACE_TYPES, *_WEBGL_TRACE_TYPES.values())
+    traces = [trace for trace in fig.data if isinstance(trace, trace_types)]
+    webgl_unsupported = any(
+        getattr(trace, "stackgroup", None) or getattr(trace.line, "shape", None) == "spline" for trace in traces
+    )
+    webgl = sum(_get_n_points(trace) for trace in traces) > webgl_threshold and not fig.frames and not webgl_unsupported
+    new_trace_types = (
+        _WEBGL_TRACE_TYPES if webgl else {webgl_type: svg_type for svg_type, webgl_type in _WEBGL_TRACE_TYPES.items()}
+    )
+    if not any(type(trace) in new_trace_types for trace in fig.data):
+        return
+
+    data = []
+    for trace in fig.data:
+        if type(trace) not in new_trace_types:
+            data.append(trace)
+            continue
+        properties = trace.to_plotly_json()
+        new_trace = new_trace_types[type(trace)](properties, skip_invalid=True)
+        dropped = [
+            name
+            for name in _get_dropped_properties(properties, new_trace.to_plotly_json())
+            if name not in _STACKING_PROPERTIES
+        ]
+        if dropped:
+            logger.warning(
+                "Drawing %s trace as %s drops properties that it does not support: %s. Set render_mode to draw the "
+                "chart with a particular trace type.",
+                type(trace).__name__,
+                type(new_trace).__name__,
+                ", ".join(dropped),
+            )
+        data.append(new_trace)
+    # The data of a figure can only be assigned its own traces, so the traces are added again.
+    fig.data = []
+    fig.add_traces(data)
+
 
 class Graph(VizroBaseModel):
     """Wrapper for `dcc.Graph` to visualize charts.
@@ -76,6 +214,17 @@ class Graph(VizroBaseModel):
             Hovering over the icon shows a tooltip with the provided description.""",
         ),
     ]
+    max_points: PositiveInt | None = Field(
+        default=None,
+        description="""Maximum number of points to send to the browser for each trace of the figure. Line and scatter
+traces with more points are downsampled and histograms with more values are binned on the server. Defaults to `None`,
+which sends every point.""",
+    )
+    resample_on_zoom: bool = Field(
+        default=False,
+        description="""Whether to resample downsampled traces from their full resolution points when the graph is
+zoomed, so that more detail is shown in the zoomed x-axis range. Requires `max_points`.""",
+    )
     actions: ActionsType = []
     extra: SkipJsonSchema[
         Annotated[
@@ -91,8 +240,17 @@ underlying component may change in the future.""",
         ]
     ]
 
+    # Set by Dashboard.webgl_threshold.
+    _webgl_threshold: int | None = PrivateAttr(WEBGL_THRESHOLD_DEFAULT)
+
     _validate_figure = field_validator("figure", mode="before")(_validate_captured_callable)
 
+    @model_validator(mode="after")
+    def _validate_resample_on_zoom(self):
+        if self.resample_on_zoom and self.max_points is None:
+            raise ValueError("`Graph` must have `max_points` set when `resample_on_zoom` is True.")
+        return self
+
     @model_validator(mode="after")
     def _make_actions_chain(self):
         return make_actions_chain(self)
@@ -183,6 +341,12 @@ underlying component may change in the future.""",
             kwargs["data_frame"] = data_manager[self["data_frame"]].load()
         fig = self.figure(**kwargs)
         fig = self._optimise_fig_layout_for_dashboard(fig)
+        full_resolution = _downsample_figure(fig, self.max_points) if self.max_points is not None else {}
+        if self._webgl_threshold is not None and self._uses_auto_render_mode:
+            _set_render_mode(fig, self._webgl_threshold)
+        if not _PLOTLY_ENCODES_TYPED_ARRAYS:
+            # Send the numerical arrays of the figure to the browser as typed arrays rather than JSON lists.
+            fig.__class__ = _TypedArrayFigure
 
         # Possibly we should enforce that __call__ can only be used within the context of a callback, but it's easy
         # to just swallow up the error here as it doesn't cause any problems.
@@ -194,12 +358,53 @@ underlying component may change in the future.""",
             # argument `running` on the clientside callback but this only exists for serverside callbacks, so we do it
             # manually.
             set_props(self.id, {"style": {"visibility": "hidden"}})
+            # The full resolution points of downsampled traces are kept on the server to resample them when the graph
+            # is zoomed. See the callback defined in build.
+            if self.resample_on_zoom:
+                full_resolution_id = (
+                    _full_resolution_store.set(
+                        {"max_points": self.max_points, "traces": full_resolution},
+                        timeout=_get_cache_timeout(self["data_frame"]),
+                    )
+                    if full_resolution
+                    else None
+                )
+                set_props(f"{self.id}_full_resolution_id", {"data": full_resolution_id})
 
         # No "guard" component needed for vm.Graph. The reason is that vm.Graph has never been recreated after it's
         # built. Only that updates is its "figure" property after the build method.
         # Guard components are only for components (e.g. AgGrid, dynamic Filter) that get fully recreated.
         return fig
 
+    @property
+    def _uses_auto_render_mode(self) -> bool:
+        """Whether the figure chooses between SVG and WebGL itself, i.e. has a `render_mode` argument that's "auto".
+
+        This is the case for plotly express charts that draw scatter traces, unless `render_mode` is set. A custom chart
+        opts in by having a `render_mode` argument too.
+        """
+        parameter = inspect.signature(self.figure._function).parameters.get("render_mode")
+        return parameter is not None and self.figure._arguments.get("render_mode", parameter.default) == "auto"
+
+    def _get_referenced_columns(self, figure_kwargs: dict[str, Any]) -> set[str] | None:
+        """Returns the columns of `data_frame` that the figure uses when called with `figure_kwargs`.
+
+        Returns None if the figure might use any column. Only plotly express chart functions are known to refer to
+        columns just through their arguments; a custom chart could use any column.
+        """
+        function = self.figure._function
+        if getattr(function, "__module__", None) != "plotly.express._chart_types":
+            return None
+
+        parameters = inspect.signature(function).parameters
+        # Without x and y, plotly express treats every column as wide-form data, and without dimensions it uses every
+        # column as a dimension.
+        wide_form = {"x", "y"} <= parameters.keys() and all(figure_kwargs.get(axis) is None for axis in ("x", "y"))
+        all_dimensions = "dimensions" in parameters and figure_kwargs.get("dimensions") is None
+        if wide_form or all_dimensions:
+            return None
+        return set().union(*(_get_column_names(figure_kwargs.get(argument)) for argument in _PX_COLUMN_ARGUMENTS))
+
     # Convenience wrapper/syntactic sugar.
     def __getitem__(self, arg_name: str):
         # See figure implementation for more details.
@@ -324,6 +529,14 @@ underlying component may change in the future.""",
             hidden=True,
         )
 
+        if self.resample_on_zoom:
+            callback(
+                Output(self.id, "figure", allow_duplicate=True),
+                Input(self.id, "relayoutData"),
+                State(f"{self.id}_full_resolution_id", "data"),
+                prevent_initial_call=True,
+            )(_resample_on_zoom)
+
         # The empty figure here is just a placeholder designed to be replaced by the actual figure when the filters
         # etc. are applied. It only appears on the screen for a brief instant, but we need to make sure it's
         # transparent and has no axes so it doesn't draw anything on the screen which would flicker away when the
@@ -353,6 +566,7 @@ underlying component may change in the future.""",
             children=html.Div(
                 children=[
                     dcc.Store(id=f"{self.id}_action_trigger"),
+                    *([dcc.Store(id=f"{self.id}_full_resolution_id")] if self.resample_on_zoom else []),
                     html.H3([html.Span(self.title, id=f"{self.id}_title"), *description], className="figure-title")
                     if self.title
                     else None,
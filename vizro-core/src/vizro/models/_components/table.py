@@ -1,5 +1,5 @@
 import logging
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 import pandas as pd
 import vizro_dash_components as vdc
@@ -111,6 +111,14 @@ class Table(VizroBaseModel):
         figure.id = self._inner_component_id
         return html.Div([figure, dcc.Store(id=f"{self._inner_component_id}_guard_actions_chain", data=True)])
 
+    def _get_referenced_columns(self, figure_kwargs: dict[str, Any]) -> set[str] | None:
+        """Returns the columns of `data_frame` that the figure uses when called with `figure_kwargs`.
+
+        This is always None, meaning the figure might use any column, since every column is sent to the table as
+        `data` and its arguments can refer to columns in many places, e.g. filter queries in conditional styles.
+        """
+        return None
+
     # Convenience wrapper/syntactic sugar.
     def __getitem__(self, arg_name: str):
         # See figure implementation for more details.
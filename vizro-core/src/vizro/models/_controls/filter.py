@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import functools
 import re
+from collections import defaultdict
 from collections.abc import Callable, Iterable
 from contextlib import suppress
+from datetime import date as dt_date
 from datetime import datetime as dt_datetime
 from datetime import time as dt_time
 from typing import Any, Literal, cast
 
+import numpy as np
 import pandas as pd
 from dash import dcc, html
 from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
@@ -16,7 +19,7 @@ from pydantic import Field, PrivateAttr, model_validator
 from vizro._constants import FILTER_ACTION_PREFIX
 from vizro.actions import update_targets
 from vizro.managers import data_manager, model_manager
-from vizro.managers._data_manager import DataSourceName, _DynamicData
+from vizro.managers._data_manager import DataSourceName, _DynamicData, _FilterPredicate
 from vizro.managers._model_manager import FIGURE_MODELS
 from vizro.models import VizroBaseModel
 from vizro.models._components.form import (
@@ -30,6 +33,7 @@ from vizro.models._components.form import (
 )
 from vizro.models._components.form.cascader import (
     Cascader,
+    _iter_cascader_leaves_depth_first,
     _iter_cascader_paths_depth_first,
     _normalize_cascader_path,
 )
@@ -94,6 +98,10 @@ _DATETIME_REGEX = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2})?$")
 _DATE_ONLY_REGEX = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 _TIME_PARTS_HH_MM = 2  # "HH:MM".split(":") → 2 parts, i.e. no seconds in format
 _RANGE_VALUE_LEN = 2  # Range filters always carry exactly [start, end].
+# Represents a null in the integers used by _filter_temporal_integers. numpy uses the same value for NaT.
+_NULL_TEMPORAL_INTEGER = np.iinfo(np.int64).min
+# Number of values checked before all the values when finding the column type of a filter.
+_COLUMN_TYPE_SAMPLE_SIZE = 1000
 
 # Column types whose filter options/bounds can update when the underlying data source is dynamic.
 # "time" and "boolean" are always static.
@@ -126,24 +134,12 @@ def _to_dt_time(entry: Any) -> Any:
     return None
 
 
-def _coerce_temporal(
-    series: pd.Series, value: list[Any], normalize_precision: bool = False
-) -> tuple[pd.Series, list[Any]]:
-    """If needed, coerce `series` and `value` to comparable temporal objects.
-
-    Handles three input shapes:
-      - "HH:MM[:SS]" time-of-day strings (from TimePicker) -> compare as `datetime.time`.
-      - "YYYY-MM-DDTHH:MM[:SS]" ISO datetime strings (from DateTimePicker) -> compare as `pd.Timestamp`.
-      - Date strings on a datetime64 series (from DatePicker) -> compare as `datetime.date`.
+def _pad_mixed_precision_range(value: list[Any]) -> list[Any]:
+    """Pad the date-only entries of a range `value` that also has a full datetime to full datetimes.
 
-    `normalize_precision=True` strips microseconds (and optionally seconds) from the series to make
-    comparisons consistent with the user-provided string format.
+    This is the case for a DateTimePicker with one end's time cleared. Index 0 is padded to start-of-day and index 1
+    to end-of-day so they can be compared on equal footing with the full datetime. Anything else is left unchanged.
     """
-    # Mixed-precision range filter (DateTimePicker with one end's time cleared): if at least one
-    # value is a full datetime and at least one is date-only, pad the date-only entries to full
-    # datetimes position-wise so they can be compared on equal footing — index 0 is start-of-day,
-    # index 1 is end-of-day. (Both-date-only and both-full-datetime cases fall through to the
-    # existing _is_date / _is_datetime branches unchanged.)
     if len(value) == _RANGE_VALUE_LEN:
         has_full_datetime = any(_DATETIME_REGEX.match(str(v)) for v in value)
         has_date_only = any(_DATE_ONLY_REGEX.match(str(v)) for v in value)
@@ -156,13 +152,48 @@ def _coerce_temporal(
                 else v
                 for i, v in enumerate(value)
             ]
+    return value
+
+
+def _temporal_kind(series: pd.Series, value: list[Any]) -> Literal["time", "datetime", "date"] | None:
+    """The kind of temporal comparison that `_coerce_temporal` makes for `value` (already padded), if any."""
+    if value and all(_TIME_REGEX.match(str(v)) for v in value):
+        return "time"
+    # IMPORTANT: check datetime before date so that an ISO datetime string is not collapsed to a date.
+    if value and all(_DATETIME_REGEX.match(str(v)) for v in value):
+        return "datetime"
+    if is_datetime64_any_dtype(series):
+        return "date"
+    return None
+
+
+def _strip_seconds(value: list[Any], kind: Literal["time", "datetime"]) -> bool:
+    """Whether no entry of `value` has seconds defined, in which case seconds are stripped from the series too."""
+    if kind == "time":
+        return all(len(str(v).split(":")) == _TIME_PARTS_HH_MM for v in value)
+    # The separator is "T" on input or " " after Mantine round-trips the value — normalize both.
+    return all(len(str(v).replace(" ", "T").split("T")[1].split(":")) == _TIME_PARTS_HH_MM for v in value)
+
+
+def _coerce_temporal(
+    series: pd.Series, value: list[Any], normalize_precision: bool = False
+) -> tuple[pd.Series, list[Any]]:
+    """If needed, coerce `series` and `value` to comparable temporal objects.
 
-    _is_time = value and all(_TIME_REGEX.match(str(v)) for v in value)
-    # IMPORTANT: check _is_datetime before _is_date so that an ISO datetime string is not collapsed to a date.
-    _is_datetime = not _is_time and value and all(_DATETIME_REGEX.match(str(v)) for v in value)
-    _is_date = not _is_time and not _is_datetime and is_datetime64_any_dtype(series)
+    Handles three input shapes:
+      - "HH:MM[:SS]" time-of-day strings (from TimePicker) -> compare as `datetime.time`.
+      - "YYYY-MM-DDTHH:MM[:SS]" ISO datetime strings (from DateTimePicker) -> compare as `pd.Timestamp`.
+      - Date strings on a datetime64 series (from DatePicker) -> compare as `datetime.date`.
+
+    `normalize_precision=True` strips microseconds (and optionally seconds) from the series to make
+    comparisons consistent with the user-provided string format.
+    """
+    # Mixed-precision range filter: pad date-only entries so they can be compared with full datetimes. (Both-date-only
+    # and both-full-datetime cases fall through to the date / datetime branches unchanged.)
+    value = _pad_mixed_precision_range(value)
+    kind = _temporal_kind(series, value)
 
-    if _is_time:
+    if kind == "time":
         if is_datetime64_any_dtype(series):
             # Converting Timestamp to datetime.time
             series = series.dt.time
@@ -173,7 +204,7 @@ def _coerce_temporal(
 
         if normalize_precision:
             # If no `value` has seconds defined, strip seconds from the input series as well to ensure comparability.
-            strip_seconds = all(len(str(v).split(":")) == _TIME_PARTS_HH_MM for v in value)
+            strip_seconds = _strip_seconds(value, "time")
             # Nulls have no precision to strip and must stay null so that they don't match anything.
             # Both levels of precision are stripped in a single pass to keep this to one traversal.
             series = series.map(
@@ -189,7 +220,7 @@ def _coerce_temporal(
         # Time selector: convert "HH:MM" or "HH:MM:SS" input value strings to datetime.time objects.
         value = pd.to_datetime(value, format="mixed").time
 
-    elif _is_datetime:
+    elif kind == "datetime":
         # DateTimePicker selector: convert ISO datetime strings to Timestamps and compare against the datetime series.
         # Use format="ISO8601" so a mix of "YYYY-MM-DDTHH:MM" and "YYYY-MM-DDTHH:MM:SS" parses correctly.
         value_strs = [str(v) for v in value]
@@ -208,11 +239,10 @@ def _coerce_temporal(
             # Strip sub-second precision from the series.
             series = series.dt.floor("s")
             # If no `value` has seconds defined, also strip seconds from the series.
-            # The separator is "T" on input or " " after Mantine round-trips the value — normalize both.
-            if all(len(v.replace(" ", "T").split("T")[1].split(":")) == _TIME_PARTS_HH_MM for v in value_strs):
+            if _strip_seconds(value_strs, "datetime"):
                 series = series.dt.floor("min")
 
-    elif _is_date:
+    elif kind == "date":
         # Date selector: convert date strings to datetime.date objects.
         value = pd.to_datetime(value).date
         # Converting Timestamp to datetime.date
@@ -221,12 +251,103 @@ def _coerce_temporal(
     return series, value
 
 
-def _filter_isin(series: pd.Series, value: MultiValueType) -> pd.Series:
+def _time_to_microseconds(entry: dt_time) -> int:
+    return ((entry.hour * 60 + entry.minute) * 60 + entry.second) * 10**6 + entry.microsecond
+
+
+def _temporal_integers(series: pd.Series, unit: Literal["time", "D", "s", "m"]) -> np.ndarray:
+    """Represent `series` as integers that compare the same as the temporal objects `_coerce_temporal` converts it to.
+
+    With `unit="time"`, these are the time of day in microseconds, for any series that `_coerce_temporal` handles
+    for a time-of-day comparison. Otherwise `series` must be datetime64 and these are its datetimes floored to days,
+    seconds or minutes since the epoch. Days are counted by wall-clock date like `series.dt.date`; seconds and minutes
+    are in UTC. Nulls are `_NULL_TEMPORAL_INTEGER`, which is less than any other value.
+    """
+    tz = getattr(series.dt, "tz", None) if is_datetime64_any_dtype(series) else None
+    if unit == "time" and not is_datetime64_any_dtype(series):
+        return np.array(
+            [
+                _time_to_microseconds(v) if isinstance(v, dt_time) else _NULL_TEMPORAL_INTEGER
+                for v in series.map(_to_dt_time)
+            ],
+            dtype=np.int64,
+        )
+    if tz is not None:
+        # Time of day and date are read from the wall-clock time, like series.dt.time and series.dt.date.
+        series = series.dt.tz_localize(None) if unit in {"time", "D"} else series.dt.tz_convert(None)
+    # numpy represents NaT as the smallest int64, and so as _NULL_TEMPORAL_INTEGER.
+    values = series.to_numpy()
+    if unit == "time":
+        values = values.astype("M8[us]")
+        return (values - values.astype("M8[D]")).astype(np.int64)
+    return values.astype(f"M8[{unit}]").astype(np.int64)
+
+
+def _filter_temporal_integers(
+    series: pd.Series, value: list[Any], data_version: str, *, normalize_precision: bool, between: bool
+) -> pd.Series | None:
+    """Filter a temporal comparison with integers computed once per data version by `_temporal_integers`.
+
+    This gives the same result as `_filter_isin` (`between=False`) or `_filter_between` (`between=True`) but avoids
+    converting every row to a Python temporal object on every request. Returns None if `value` does not give a
+    temporal comparison that can be done this way.
+    """
+    value = _pad_mixed_precision_range(value)
+    kind = _temporal_kind(series, value)
+    if kind is None or (kind == "datetime" and not (normalize_precision and is_datetime64_any_dtype(series))):
+        return None
+
+    _, coerced_value = _coerce_temporal(series=series.iloc[:0], value=value, normalize_precision=normalize_precision)
+    # Coarsest precision that series values are floored to before comparing.
+    unit: Literal["time", "D", "s", "m"]
+    floor = 1
+    if kind == "time":
+        unit = "time"
+        value_integers = [_time_to_microseconds(v) for v in coerced_value]
+        if normalize_precision:
+            floor = 60 * 10**6 if _strip_seconds(value, "time") else 10**6
+    elif kind == "date":
+        unit = "D"
+        value_integers = [int(np.datetime64(v, "D").astype(np.int64)) for v in coerced_value]
+    else:
+        unit = "m" if _strip_seconds(value, "datetime") else "s"
+        value_integers = [
+            int(np.datetime64((v.tz_convert(None) if v.tz is not None else v).to_datetime64(), unit).astype(np.int64))
+            for v in coerced_value
+        ]
+
+    integers = data_manager._get_derived_data(
+        data_version, ("temporal_integers", unit, series.name), lambda: _temporal_integers(series, unit)
+    )
+    not_null = integers != _NULL_TEMPORAL_INTEGER
+    if floor > 1:
+        integers = integers - integers % floor
+
+    if not between:
+        mask = np.isin(integers, value_integers) & not_null
+    elif kind == "time" and value_integers[0] > value_integers[1]:
+        # Time-of-day range that crosses midnight, as in _filter_between.
+        mask = ((integers >= value_integers[0]) | (integers <= value_integers[1])) & not_null
+    else:
+        mask = (integers >= value_integers[0]) & (integers <= value_integers[1]) & not_null
+    return pd.Series(mask, index=series.index)
+
+
+def _factorize(series: pd.Series) -> tuple[np.ndarray, pd.Series]:
+    """Encode `series` as codes into its unique values (including null), using the smallest possible integer dtype."""
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    return codes.astype(np.min_scalar_type(len(uniques))), pd.Series(uniques)
+
+
+def _filter_isin(series: pd.Series, value: MultiValueType, data_version: str | None = None) -> pd.Series:
     """Filter using .isin() - works with boolean/categorical data.
 
     Switch selectors work with 0/1 columns due to pandas automatic type conversion:
     >>> pd.Series([0, 1]).isin([False])  # [True, False]
     >>> pd.Series([False, True]).isin([1])  # [False, True]
+
+    If `data_version` is given then `series` must be the whole column of the data with that version. The column is
+    then factorized once per data version and the filter is evaluated on its unique values rather than on every row.
     """
     # A single-select selector supplies a scalar; wrap it so `.isin` always receives a list of selected values.
     value = value if isinstance(value, list) else [value]
@@ -235,22 +356,116 @@ def _filter_isin(series: pd.Series, value: MultiValueType) -> pd.Series:
     if any(v in [None, ""] for v in value):
         return pd.Series(True, index=series.index)
 
+    if data_version is not None:
+        if (
+            mask := _filter_temporal_integers(series, value, data_version, normalize_precision=True, between=False)
+        ) is not None:
+            return mask
+        codes, uniques = data_manager._get_derived_data(
+            data_version, ("factorize", series.name), lambda: _factorize(series)
+        )
+        # Coercion and isin work value by value, so doing them on the unique values and then looking up each row's
+        # code gives the same result as doing them on the whole series.
+        uniques, value = _coerce_temporal(series=uniques, value=value, normalize_precision=True)
+        return pd.Series(uniques.isin(value).to_numpy()[codes], index=series.index)
+
     # If needed, coerce series and value to comparable time or date objects based on value format.
     series, value = _coerce_temporal(series=series, value=value, normalize_precision=True)
     return series.isin(value)
 
 
-def _filter_between(series: pd.Series, value: list[float] | list[str | None]) -> pd.Series:
+def _sortable_values(series: pd.Series) -> np.ndarray | None:
+    """Values of a numerical or datetime `series` as a numpy array that sorts in the same order, otherwise None.
+
+    Timezone-aware datetimes are converted to UTC.
+    """
+    if is_datetime64_any_dtype(series):
+        if getattr(series.dt, "tz", None) is not None:
+            series = series.dt.tz_convert(None)
+        return series.to_numpy()
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "iuf":
+        return series.to_numpy()
+    return None
+
+
+def _argsort(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Positions that sort `values` (in the smallest possible unsigned integer dtype) and the sorted values."""
+    order = np.argsort(values)
+    return order.astype(np.min_scalar_type(len(order))), values[order]
+
+
+def _between_bounds(series: pd.Series, value: list[Any]) -> tuple[Any, Any, Literal["left", "right"]] | None:
+    """Bounds to binary search for in the values given by `_sortable_values(series)` to filter between `value`.
+
+    Returns (lower bound, upper bound, side to search for the upper bound), or None if the filter can't be done with
+    a binary search, e.g. for a time-of-day filter.
+    """
+    # Coercing an empty slice of the series tells us how the filter would coerce the whole series without doing it.
+    coerced_series, coerced_value = _coerce_temporal(series=series.iloc[:0], value=value, normalize_precision=False)
+    if coerced_series.dtype == series.dtype:
+        if is_datetime64_any_dtype(series) and all(isinstance(v, pd.Timestamp) for v in coerced_value):
+            # DateTimePicker: the values have the same timezone as the series, so convert them to UTC in the same way.
+            lower, upper = (v.tz_convert(None) if v.tz is not None else v for v in coerced_value)
+            return lower.to_datetime64(), upper.to_datetime64(), "right"
+        if is_numeric_dtype(series) and all(
+            isinstance(v, int | float | np.number) and not isinstance(v, bool) for v in coerced_value
+        ):
+            return coerced_value[0], coerced_value[1], "right"
+    elif (
+        is_datetime64_any_dtype(series)
+        and getattr(series.dt, "tz", None) is None
+        and all(isinstance(v, dt_date) and not isinstance(v, dt_datetime) for v in coerced_value)
+    ):
+        # DatePicker: the series was converted to dates. A datetime is on or before a date if it's before the start of
+        # the next day.
+        lower, upper = pd.Timestamp(coerced_value[0]), pd.Timestamp(coerced_value[1]) + pd.Timedelta(days=1)
+        return lower.to_datetime64(), upper.to_datetime64(), "left"
+    return None
+
+
+def _filter_between(
+    series: pd.Series, value: list[float] | list[str | None], data_version: str | None = None
+) -> pd.Series:
     """Filter using .between() - works with numerical/date/time range data.
 
     Time-of-day ranges that cross midnight are handled with an OR condition:
     >>> _filter_between(pd.Series([dt_time(23, 0)]), [dt_time(21, 0), dt_time(6, 0)])  # [True]
     >>> _filter_between(pd.Series([dt_time(12, 0)]), [dt_time(21, 0), dt_time(6, 0)])  # [False]
+
+    If `data_version` is given then `series` must be the whole column of the data with that version. Numerical and
+    date/datetime columns are then sorted once per data version and filtered with a binary search, which finds the
+    rows in range without comparing every row.
     """
     # Skip filtering if any value is missing — both pickers must be set for a range filter.
     if any(v in [None, ""] for v in value):
         return pd.Series(True, index=series.index)
 
+    if (
+        data_version is not None
+        and _sortable_values(series.iloc[:0]) is not None
+        and (bounds := _between_bounds(series, value)) is not None
+    ):
+        order, sorted_values = data_manager._get_derived_data(
+            data_version, ("argsort", series.name), lambda: _argsort(cast(np.ndarray, _sortable_values(series)))
+        )
+        lower, upper, upper_side = bounds
+        start = np.searchsorted(sorted_values, lower, side="left")
+        end = np.searchsorted(sorted_values, upper, side=upper_side)
+        mask = np.zeros(len(series), dtype=bool)
+        mask[order[start:end]] = True
+        return pd.Series(mask, index=series.index)
+
+    if (
+        data_version is not None
+        and (
+            temporal_mask := _filter_temporal_integers(
+                series, value, data_version, normalize_precision=False, between=True
+            )
+        )
+        is not None
+    ):
+        return temporal_mask
+
     # If needed, coerce series and value to comparable time or date objects based on value format.
     series, value = _coerce_temporal(series=series, value=value, normalize_precision=False)
 
@@ -260,7 +475,103 @@ def _filter_between(series: pd.Series, value: list[float] | list[str | None]) ->
     return series.between(value[0], value[1], inclusive="both")
 
 
-def _filter_hierarchical_isin(df: pd.DataFrame, value: Any, *, multi: bool) -> pd.Series:
+def _factorize_as_str(series: pd.Series) -> tuple[np.ndarray, pd.Index]:
+    """Encode `series.astype(str)` as codes into its unique values, where possible without casting every row to `str`.
+
+    Equal values of an object column don't necessarily have the same string, e.g. 2 and 2.0, so such a column is cast
+    in full.
+    """
+    if series.dtype == object:
+        codes, strings = pd.factorize(series.astype(str), use_na_sentinel=False)
+        return codes, pd.Index(strings)
+    codes, uniques = _factorize(series)
+    string_codes, strings = pd.factorize(uniques.astype(str), use_na_sentinel=False)
+    return string_codes[codes], pd.Index(strings)
+
+
+def _combine_codes(level_codes: list[np.ndarray], sizes: list[int]) -> tuple[np.ndarray, list[pd.Index]]:
+    """Encode each row's combination of `level_codes` as a single code.
+
+    `sizes` gives the number of possible codes at each level. Combinations are renumbered level by level so that the
+    codes can't overflow however many levels and unique values there are. Also returns the combinations seen at each
+    level after the first, which `_combine_selected_codes` uses to encode selected combinations in the same way.
+    """
+    combined = level_codes[0].astype(np.int64)
+    seen_combinations = []
+    for codes, size in zip(level_codes[1:], sizes[1:]):
+        combined, combinations = pd.factorize(combined * size + codes)
+        seen_combinations.append(pd.Index(combinations))
+    return combined, seen_combinations
+
+
+def _combine_selected_codes(
+    level_codes: list[np.ndarray], sizes: list[int], seen_combinations: list[pd.Index]
+) -> np.ndarray:
+    """Encode each selected combination of `level_codes` in the same way as `_combine_codes` encoded the rows.
+
+    A code of -1 means the selected value doesn't exist at that level. Combinations that don't exist in the rows are
+    dropped.
+    """
+    selected = np.column_stack(level_codes).astype(np.int64)
+    selected = selected[(selected >= 0).all(axis=1)]
+    combined = selected[:, 0]
+    for position, (size, combinations) in enumerate(zip(sizes[1:], seen_combinations), start=1):
+        combined = combinations.get_indexer(combined * size + selected[:, position])
+        selected = selected[combined >= 0]
+        combined = combined[combined >= 0]
+    return combined
+
+
+def _filter_paths(df: pd.DataFrame, paths: list[list[Any] | tuple[Any, ...]], data_version: str | None) -> np.ndarray:
+    """Mask of rows of `df` that match any of `paths`, which all have the same length.
+
+    See `_filter_hierarchical_isin` for how paths are matched.
+    """
+    path_length = len(paths[0])
+    # A path is matched against as many columns as it has segments. Its last segment is matched against the leaf
+    # column with `_filter_isin`, and the others are matched against branch columns as strings. A path longer than
+    # the number of columns is matched as strings against all of them.
+    columns = df.columns[:path_length]
+    leaf_position = path_length - 1 if path_length <= len(columns) else None
+    levels = []
+    for position, column in enumerate(columns):
+        if position == leaf_position:
+            key, factorize = ("factorize", column), _factorize
+        else:
+            key, factorize = ("factorize_as_str", column), _factorize_as_str
+        levels.append(data_manager._get_derived_data(data_version, key, lambda: factorize(df[column])))
+    sizes = [len(uniques) for _, uniques in levels]
+    row_codes, seen_combinations = data_manager._get_derived_data(
+        data_version,
+        ("combine_codes", tuple(columns), leaf_position),
+        lambda: _combine_codes([codes for codes, _ in levels], sizes),
+    )
+
+    # Codes of each selected path's segments at each level, one row per path and leaf code it matches.
+    selected_codes = [
+        uniques.get_indexer([str(path[position]) for path in paths])
+        for position, (_, uniques) in enumerate(levels)
+        if position != leaf_position
+    ]
+    if leaf_position is not None:
+        leaf_uniques = levels[leaf_position][1]
+        # Paths often share a leaf label, e.g. the same city under different countries, so match each label once.
+        codes_by_leaf: dict[tuple[type, Any], np.ndarray] = {}
+        leaf_codes = []
+        for path in paths:
+            leaf = path[leaf_position]
+            if (type(leaf), leaf) not in codes_by_leaf:
+                codes_by_leaf[type(leaf), leaf] = np.flatnonzero(_filter_isin(leaf_uniques, [leaf]).to_numpy())
+            leaf_codes.append(codes_by_leaf[type(leaf), leaf])
+        counts = [len(codes) for codes in leaf_codes]
+        selected_codes = [np.repeat(codes, counts) for codes in selected_codes]
+        selected_codes.append(np.concatenate(leaf_codes))
+    return np.isin(row_codes, _combine_selected_codes(selected_codes, sizes, seen_combinations))
+
+
+def _filter_hierarchical_isin(
+    df: pd.DataFrame, value: Any, data_version: str | None = None, *, multi: bool
+) -> pd.Series:
     """Filter rows whose ordered path columns match any selected root-to-leaf path.
 
     `df` holds the hierarchical filter's path columns in root-to-leaf order (branch columns first, the leaf
@@ -282,27 +593,42 @@ def _filter_hierarchical_isin(df: pd.DataFrame, value: Any, *, multi: bool) -> p
 
     An empty/None selection matches no rows (returns an empty result), because a hierarchical filter with
     nothing selected has no path to match against.
+
+    Selected paths are matched with a single lookup: each row's combination of path column values is encoded as one
+    code and each selected path is encoded in the same way. The leaf match of each selected path is still made with
+    `_filter_isin`, but on the leaf column's unique values rather than on every row. If `data_version` is given then
+    `df` must be the whole of the path columns of the data with that version, and the row codes are then computed
+    only once per data version.
     """
     if not value:
         return pd.Series(False, index=df.index)
     # multi=False: `value` is a single entry (one path or one legacy leaf).
     # multi=True: `value` is a list of entries (paths and/or legacy leaves).
     entries = (value if isinstance(value, (list, tuple)) else [value]) if multi else [value]
-    leaf_column = df.columns[-1]
-    mask = pd.Series(False, index=df.index)
+    legacy_leaves = []
+    paths_by_length: defaultdict[int, list[list[Any] | tuple[Any, ...]]] = defaultdict(list)
     for entry in entries:
         if entry is None or (isinstance(entry, (list, tuple)) and not len(entry)):
             continue
-        if not isinstance(entry, (list, tuple)):
-            # Legacy leaf-only value: no branch context, so match the leaf column alone.
-            mask |= _filter_isin(df[leaf_column], [entry])
-            continue
-        row_matches = pd.Series(True, index=df.index)
-        for position, (column, segment) in enumerate(zip(df.columns, entry)):
-            is_leaf = position == len(entry) - 1
-            row_matches &= _filter_isin(df[column], [segment]) if is_leaf else df[column].astype(str) == str(segment)
-        mask |= row_matches
-    return mask
+        if isinstance(entry, (list, tuple)):
+            paths_by_length[len(entry)].append(entry)
+        else:
+            legacy_leaves.append(entry)
+
+    mask = np.zeros(len(df), dtype=bool)
+    if legacy_leaves:
+        # Legacy leaf-only value: no branch context, so match the leaf column alone.
+        codes, uniques = data_manager._get_derived_data(
+            data_version, ("factorize", df.columns[-1]), lambda: _factorize(df.iloc[:, -1])
+        )
+        matches = np.zeros(len(uniques), dtype=bool)
+        for leaf in legacy_leaves:
+            matches |= _filter_isin(uniques, [leaf]).to_numpy()
+        mask |= matches[codes]
+
+    for paths in paths_by_length.values():
+        mask |= _filter_paths(df, paths, data_version)
+    return pd.Series(mask, index=df.index)
 
 
 def _paths_in_tree(tree: dict[str, Any]) -> set[tuple[Any, ...]]:
@@ -318,6 +644,9 @@ def _ensure_path_in_tree(tree: dict[str, Any], path: list[Any]) -> None:
     selected path that a data reload dropped, so the selection stays valid even if it now matches no rows.
     Because the path carries its own branch context, no lookup of previous options is needed.
 
+    Only `tree` itself is changed: the nodes below it on the way to `path` are copied rather than changed, so `tree`
+    can be a shallow copy of options that are shared, e.g. cached options.
+
     Example:
         >>> tree = {"Eu": ["DE"]}
         >>> _ensure_path_in_tree(tree, ["Eu", "FR"])
@@ -335,46 +664,189 @@ def _ensure_path_in_tree(tree: dict[str, Any], path: list[Any]) -> None:
         child = node.get(key)
         if child is None:
             child = {}
-            node[key] = child
         elif not isinstance(child, dict):
             return  # shape mismatch — a leaf list already lives where we'd need a branch dict
+        else:
+            child = dict(child)
+        node[key] = child
         node = child
     terminal = str(branch[-1])
     existing = node.get(terminal)
     if existing is None:
         node[terminal] = [leaf]
     elif isinstance(existing, list) and leaf not in existing:
-        existing.append(leaf)
+        node[terminal] = [*existing, leaf]
+
+
+def _unique_rows(rows: np.ndarray, sizes: list[int]) -> np.ndarray:
+    """Sorted unique rows of `rows`, where the values in each column are in the range `[-1, size)`."""
+    # Encoding each row as a single integer in mixed radix is much faster than np.unique(rows, axis=0), but only
+    # possible if the integers don't overflow.
+    if np.prod([float(size + 1) for size in sizes]) >= np.iinfo(np.int64).max:
+        return np.unique(rows, axis=0)
+    keys = np.zeros(len(rows), dtype=np.int64)
+    for column, size in zip(rows.T, sizes):
+        keys = keys * (size + 1) + column + 1
+    unique_keys = np.unique(keys)
+    unique_rows = np.empty((len(unique_keys), len(sizes)), dtype=np.int64)
+    for position, size in reversed(list(enumerate(sizes))):
+        unique_keys, unique_rows[:, position] = np.divmod(unique_keys, size + 1)
+    return unique_rows - 1
+
+
+def _group_starts(rows: np.ndarray) -> np.ndarray:
+    """Positions in sorted `rows` where a new group of identical rows starts."""
+    return np.flatnonzero(np.r_[True, (np.diff(rows, axis=0) != 0).any(axis=1)])
+
+
+def _has_mixed_types(series: pd.Series) -> bool:
+    """Whether `series` has values of different types, e.g. integers and strings in the same object column."""
+    return series.dtype == object and pd.api.types.infer_dtype(series, skipna=True).startswith("mixed")
+
+
+def _dataframe_path_to_cascader_options_by_groupby(df: pd.DataFrame, path_columns: list[str]) -> dict[str, Any]:
+    """Build nested Cascader options from the unique rows of `df[path_columns]` with a groupby.
+
+    This is used for columns with values of different types, which can't all be sorted together or can be equal
+    without being identical (e.g. 1, 1.0 and True). Leaves are then only sorted among the leaves of the same branch.
+    """
+    leaves_by_branch = (
+        df[path_columns]
+        .drop_duplicates()
+        .groupby(path_columns[:-1], observed=True, sort=True)[path_columns[-1]]
+        .apply(lambda leaves: sorted(leaves.dropna().unique().tolist()))
+    )
+    options: dict[str, Any] = {}
+    for branch_key, leaves in leaves_by_branch.items():
+        *parents, branch = branch_key if isinstance(branch_key, tuple) else (branch_key,)
+        node = options
+        for parent in parents:
+            node = node.setdefault(str(parent), {})
+        node[str(branch)] = leaves
+    return options
 
 
 def _dataframe_path_to_cascader_options(df: pd.DataFrame, path_columns: list[str]) -> dict[str, Any]:
-    """Build nested Cascader options from unique rows via groupby then nested dict (str keys, list leaves).
+    """Build nested Cascader options from the unique rows of `df[path_columns]` (str keys, sorted list leaves).
 
     Callers must pass at least two column names (hierarchical filter path + leaf); see `Filter.column`.
+
+    The branch columns are factorized in sorted order and the leaf codes are ranked in `sorted` order, so sorting the
+    unique rows of codes orders branches as a sorted groupby would and sorts the leaves under each branch. Like a
+    groupby, rows with a null branch label are dropped, and a branch whose leaves are all null is kept with no leaves.
+    Columns with values of different types use `_dataframe_path_to_cascader_options_by_groupby` instead.
     """
-    sub = df[path_columns].drop_duplicates()
-    if sub.empty:
+    if df.empty:
         raise ValueError("Cannot build cascader options from empty path data.")
+    if any(_has_mixed_types(df[column]) for column in path_columns):
+        return _dataframe_path_to_cascader_options_by_groupby(df, path_columns)
+
+    branch_labels = []
+    codes = []
+    for column in path_columns[:-1]:
+        column_codes, column_labels = pd.factorize(df[column], sort=True)
+        codes.append(column_codes)
+        branch_labels.append([str(label) for label in column_labels.tolist()])
+    leaf_codes, leaf_values = pd.factorize(df[path_columns[-1]])
+    leaf_values = leaf_values.tolist()
+    leaf_order = sorted(range(len(leaf_values)), key=leaf_values.__getitem__)
+    leaf_ranks = np.empty(len(leaf_order), dtype=np.int64)
+    leaf_ranks[leaf_order] = np.arange(len(leaf_order))
+    codes.append(np.where(leaf_codes >= 0, leaf_ranks[leaf_codes] if len(leaf_ranks) else leaf_codes, -1))
+
+    rows = np.column_stack(codes)
+    rows = _unique_rows(
+        rows[(rows[:, :-1] >= 0).all(axis=1)], [len(labels) for labels in branch_labels] + [len(leaf_order)]
+    )
+
+    if not len(rows):
+        return {}
+
+    # Rows are sorted, so the rows of each branch are contiguous, as are the branches under each parent. Leaves are
+    # sliced out of `leaves`, where `leaf_offsets` gives the position of each row's leaf, skipping null leaves.
+    has_leaf = rows[:, -1] >= 0
+    leaf_labels = np.empty(len(leaf_order), dtype=object)
+    leaf_labels[:] = [leaf_values[position] for position in leaf_order]
+    leaves = leaf_labels[rows[has_leaf, -1]].tolist()
+    leaf_offsets = np.r_[0, np.cumsum(has_leaf)]
+
+    # Build the tree bottom up: at each level, group the nodes by their parent, i.e. by their codes at the levels above.
+    node_rows = rows[:, :-1]
+    node_starts = _group_starts(node_rows)
+    children: list[Any] = [
+        leaves[start:end]
+        for start, end in zip(
+            leaf_offsets[node_starts].tolist(), leaf_offsets[np.r_[node_starts[1:], len(rows)]].tolist()
+        )
+    ]
+    node_rows = node_rows[node_starts]
+    for level in reversed(range(1, len(branch_labels))):
+        keys = [branch_labels[level][code] for code in node_rows[:, level].tolist()]
+        parent_starts = _group_starts(node_rows[:, :level])
+        parent_ends = np.r_[parent_starts[1:], len(node_rows)]
+        children = [
+            dict(zip(keys[start:end], children[start:end]))
+            for start, end in zip(parent_starts.tolist(), parent_ends.tolist())
+        ]
+        node_rows = node_rows[parent_starts]
+    return dict(zip([branch_labels[0][code] for code in node_rows[:, 0].tolist()], children))
 
-    branch_cols = path_columns[:-1]
-    leaf_col = path_columns[-1]
 
-    def _sorted_unique_leaves(s: pd.Series) -> list[Any]:
-        return sorted(s.dropna().unique().tolist())
+def _has_time_of_day(values: np.ndarray) -> bool:
+    """Whether any non-null entry of datetime64 `values` is not at midnight."""
+    return bool(((values != values.astype("datetime64[D]")) & ~np.isnat(values)).any())
 
-    leaves_by_branch = sub.groupby(branch_cols, observed=True, sort=True)[leaf_col].apply(_sorted_unique_leaves)
 
-    def _assign_nested(root: dict[str, Any], branch_key: Any, leaves: list[Any]) -> None:
-        parts = branch_key if isinstance(branch_key, tuple) else (branch_key,)
-        node = root
-        for k in parts[:-1]:
-            node = node.setdefault(str(k), {})
-        node[str(parts[-1])] = leaves
+def _get_series_column_type(
+    series: pd.Series,
+) -> Literal["numerical", "categorical", "date", "datetime", "time", "boolean"]:
+    """Column type of a single target's `series`, found from its dtype where possible.
 
-    out: dict[str, Any] = {}
-    for branch_key, leaves in leaves_by_branch.items():
-        _assign_nested(out, branch_key, leaves)
-    return out
+    Only a time-of-day column and telling a date from a datetime column need the values to be checked. These first
+    check a sample of `_COLUMN_TYPE_SAMPLE_SIZE` values, which is often enough to decide, and only check all the
+    values if it's not.
+    """
+    if is_bool_dtype(series):
+        return "boolean"
+    if is_numeric_dtype(series):
+        return "numerical"
+    if is_datetime64_any_dtype(series):
+        # Date columns are all at midnight while datetime columns have at least one non-midnight time-of-day. This
+        # uses the wall-clock time, like `.dt.time` does.
+        wall_clock = series.dt.tz_localize(None) if getattr(series.dt, "tz", None) is not None else series
+        values = np.asarray(wall_clock.to_numpy())
+        if values.dtype.kind != "M":
+            has_time_of_day = (series.dropna().dt.time != dt_time.min).any()
+        else:
+            has_time_of_day = _has_time_of_day(values[:_COLUMN_TYPE_SAMPLE_SIZE]) or _has_time_of_day(values)
+        return "datetime" if has_time_of_day else "date"
+    # A sample with a value that's not a time (as opposed to no values at all) means the column isn't a time column.
+    if pd.api.types.infer_dtype(series.iloc[:_COLUMN_TYPE_SAMPLE_SIZE], skipna=True) in {"time", "empty"}:
+        if pd.api.types.infer_dtype(series, skipna=True) == "time":
+            return "time"
+    return "categorical"
+
+
+def _reduce_targeted_data(targeted_data: pd.DataFrame, *, min_max: bool) -> pd.DataFrame:
+    """Shorten `targeted_data` while keeping its dtypes and what `Filter._get_options`/`_get_min_max` find from it.
+
+    Each column is reduced to its unique values, or just its minimum and maximum values if `min_max`. Columns are made
+    as long as the longest one by repeating their values rather than padding with nulls, which would change their
+    dtype and so the options and min/max found from them.
+    """
+    reduced = {}
+    for target, series in targeted_data.items():
+        if min_max and (not_null := series.dropna()).size:
+            reduced[target] = not_null.iloc[[not_null.argmin(), not_null.argmax()]]
+        else:
+            reduced[target] = series.drop_duplicates()
+    length = max(len(series) for series in reduced.values())
+    return pd.DataFrame(
+        {
+            target: series.take(np.arange(length) % len(series)).reset_index(drop=True)
+            for target, series in reduced.items()
+        }
+    )
 
 
 class Filter(VizroBaseModel):
@@ -416,7 +888,8 @@ class Filter(VizroBaseModel):
 
     _dynamic: bool = PrivateAttr(False)
     # Accepts a Series for flat/leaf-mode filters and a DataFrame for path-mode hierarchical filters (column is a list).
-    _filter_function: Callable[[pd.Series | pd.DataFrame, Any], pd.Series] = PrivateAttr()
+    # Takes an optional data_version as third argument; see _filter_isin.
+    _filter_function: Callable[..., pd.Series] = PrivateAttr()
     # The column(s) the filter function operates on: the leaf column for flat/leaf-mode filters, or the full
     # ordered path for path-mode hierarchical filters. Kept separate from the public `column` field (which
     # retains the user-provided config) so runtime code and validators still see the original value.
@@ -486,12 +959,11 @@ class Filter(VizroBaseModel):
         # as their options are always set to True/False.
         # Although targets are fixed at build time, the validation logic is repeated during runtime, so if a column
         # is missing then it will raise an error. We could change this if we wanted.
-        targeted_data = self._validate_targeted_data(
-            {target: data_frame for target, data_frame in target_to_data_frame.items() if target in self.targets},
-            eagerly_raise_column_not_found_error=True,
+        targeted_data, column_type = self._get_targeted_data_and_column_type(
+            {target: data_frame for target, data_frame in target_to_data_frame.items() if target in self.targets}
         )
 
-        if (column_type := self._validate_column_type(targeted_data)) != self._column_type:
+        if column_type != self._column_type:
             raise ValueError(
                 f"{self._single_filter_column} has changed type from {self._column_type} to {column_type}. "
                 "A filtered column cannot change type while the dashboard is running."
@@ -559,7 +1031,10 @@ class Filter(VizroBaseModel):
         self.targets = list(targeted_data.columns)
 
         # Set default selector according to column type and whether it's a hierarchical filter.
-        self._column_type = self._validate_column_type(targeted_data)
+        self._column_type = self._validate_column_type(
+            targeted_data,
+            {target: data_manager._get_data_version(target_to_data_frame[target]) for target in self.targets},
+        )
         self.selector = self.selector or DEFAULT_SELECTORS[self._column_type]()
         self.selector.title = self.selector.title or self._single_filter_column.title()
 
@@ -673,6 +1148,27 @@ class Filter(VizroBaseModel):
             className="d-none" if not self.visible else "",
         )
 
+    def _get_filter_predicates(self, value: Any) -> list[_FilterPredicate] | None:
+        """Returns predicates that select the same rows as filtering with selector value `value`.
+
+        This is used to push the filter down into a dynamic data loading function. All the predicates must hold for a
+        row to be selected. Returns None if the filter can't be given as predicates, in which case it's only applied
+        in memory. Only categorical and numerical filters are given, since other filters convert values (e.g. to
+        dates or times of day) in ways that a data source could not reproduce.
+        """
+        if self._column_type not in {"categorical", "numerical"}:
+            return None
+        # As in _filter_isin and _filter_between, a missing value means there's no filtering to do.
+        values = value if isinstance(value, list) else [value]
+        if any(v in [None, ""] for v in values):
+            return None
+        # As in pre_build, a RangeSlider filters with _filter_between and other selectors with _filter_isin.
+        if isinstance(self.selector, RangeSlider):
+            return [(self._single_filter_column, ">=", values[0]), (self._single_filter_column, "<=", values[1])]
+        if isinstance(value, list):
+            return [(self._single_filter_column, "in", value)]
+        return [(self._single_filter_column, "==", value)]
+
     def _validate_targeted_data(
         self, target_to_data_frame: dict[ModelID, pd.DataFrame], eagerly_raise_column_not_found_error
     ) -> pd.DataFrame:
@@ -710,29 +1206,66 @@ class Filter(VizroBaseModel):
 
         return targeted_data
 
+    def _get_targeted_data_and_column_type(
+        self, target_to_data_frame: dict[ModelID, pd.DataFrame]
+    ) -> tuple[
+        pd.DataFrame, Literal["hierarchical", "numerical", "categorical", "date", "datetime", "time", "boolean"]
+    ]:
+        """Validated targeted data and its column type, computed only once per version of the data.
+
+        The same data is loaded for many refreshes of a dynamic filter, so these are cached by the versions of the
+        targeted data frames. Only the values of the targeted data needed to find the options or min/max are cached
+        (see `_reduce_targeted_data`), so a refresh only needs to merge in the current value.
+        """
+
+        def compute():
+            targeted_data = self._validate_targeted_data(
+                target_to_data_frame, eagerly_raise_column_not_found_error=True
+            )
+            column_type = self._validate_column_type(targeted_data, dict(zip(target_to_data_frame, data_versions)))
+            if data_version is not None:
+                targeted_data = _reduce_targeted_data(targeted_data, min_max=min_max)
+            return targeted_data, column_type
+
+        data_versions = [data_manager._get_data_version(data_frame) for data_frame in target_to_data_frame.values()]
+        data_version = None if None in data_versions else "-".join(cast(list[str], data_versions))
+        path_or_leaf = [self.column] if isinstance(self.column, str) else self.column
+        # Filters on the same column and targets share the cached data only if they reduce it in the same way, e.g. a
+        # Dropdown needs all unique values but a RangeSlider just the minimum and maximum.
+        min_max = _is_numerical_or_date_selector(cast(SelectorType, self.selector))
+        return data_manager._get_derived_data(
+            data_version, ("targeted_data", tuple(target_to_data_frame), tuple(path_or_leaf), min_max), compute
+        )
+
     def _validate_column_type(
-        self, targeted_data: pd.DataFrame
+        self, targeted_data: pd.DataFrame, data_versions: dict[ModelID, str | None] | None = None
     ) -> Literal["hierarchical", "numerical", "categorical", "date", "datetime", "time", "boolean"]:
-        is_boolean = targeted_data.apply(is_bool_dtype)
-        is_numerical = targeted_data.apply(is_numeric_dtype)
-        is_date = targeted_data.apply(is_datetime64_any_dtype)
-        is_time = targeted_data.apply(lambda x: pd.api.types.infer_dtype(x, skipna=True) == "time")
-        is_categorical = ~(is_boolean | is_numerical | is_date | is_time)
+        """Column type of `targeted_data`, which must be the same for all targets.
 
+        `data_versions` gives the version of each target's data (see `DataManager._get_data_version`). Each target's
+        column type is then only found once per version of its data.
+        """
         if isinstance(self.column, list):
             return "hierarchical"
-        if is_boolean.all():
+
+        data_versions = data_versions or {}
+        column_types = {
+            data_manager._get_derived_data(
+                data_versions.get(target),
+                ("column_type", self._single_filter_column),
+                functools.partial(_get_series_column_type, series),
+            )
+            for target, series in targeted_data.items()
+        }
+        # A boolean column is also numerical, and a date column is also datetime if another column has times.
+        if column_types == {"boolean"}:
             return "boolean"
-        if is_numerical.all():
+        if column_types <= {"boolean", "numerical"}:
             return "numerical"
-        if is_date.all():
-            # Pure-date columns are all at midnight while datetime columns have at least one non-midnight time-of-day.
-            has_time_component = targeted_data.apply(lambda col: (col.dropna().dt.time != dt_time.min).any()).any()
-            return "datetime" if has_time_component else "date"
-        if is_time.all():
-            return "time"
-        if is_categorical.all():
-            return "categorical"
+        if column_types <= {"date", "datetime"}:
+            return "datetime" if "datetime" in column_types else "date"
+        if len(column_types) == 1 and (column_type := next(iter(column_types))) in {"time", "categorical"}:
+            return column_type
 
         raise ValueError(
             f"Inconsistent types detected in column {self._single_filter_column}. "
@@ -817,11 +1350,20 @@ class Filter(VizroBaseModel):
           selector's current `options` and the leaf is restored there.
         """
         path_cols = list(cast(list[str], self.column))
-        combined = pd.concat(
-            [target_to_data_frame[target_id][path_cols] for target_id in self.targets],
-            ignore_index=True,
-        ).drop_duplicates()
-        new_options = _dataframe_path_to_cascader_options(combined, path_cols)
+        # Targets often share a data frame, so each distinct one only needs to be included once.
+        targeted_data_frames = [target_to_data_frame[target_id] for target_id in self.targets]
+        data_frames = list({id(data_frame): data_frame for data_frame in targeted_data_frames}.values())
+        # The options depend only on the data, so they're built once per combination of data versions. Only
+        # `_ensure_path_in_tree` is used to change them below, which doesn't change the cached options.
+        data_versions = {data_manager._get_data_version(data_frame) for data_frame in data_frames}
+        data_version = None if None in data_versions else "-".join(sorted(cast(set[str], data_versions)))
+        new_options = data_manager._get_derived_data(
+            data_version,
+            ("cascader_options", tuple(path_cols)),
+            lambda: _dataframe_path_to_cascader_options(
+                pd.concat([data_frame[path_cols] for data_frame in data_frames], ignore_index=True), path_cols
+            ),
+        )
 
         # None and an empty list mean "no selection"; a falsy leaf (0, False, "") is a real selection.
         if current_value is None or (isinstance(current_value, list) and not current_value):
@@ -834,21 +1376,33 @@ class Filter(VizroBaseModel):
                 if selector.multi
                 else [current_value]
             )
-            present = _paths_in_tree(new_options)
-            for entry in entries:
-                if not isinstance(entry, (list, tuple)) or not entry:
-                    continue
-                if _normalize_cascader_path(entry) not in present:
-                    _ensure_path_in_tree(new_options, list(entry))
+            present = data_manager._get_derived_data(
+                data_version, ("cascader_paths", tuple(path_cols)), lambda: _paths_in_tree(new_options)
+            )
+            stale_paths = [
+                entry
+                for entry in entries
+                if isinstance(entry, (list, tuple)) and entry and _normalize_cascader_path(entry) not in present
+            ]
+            if not stale_paths:
+                return new_options
+            new_options = dict(new_options)
+            for entry in stale_paths:
+                _ensure_path_in_tree(new_options, list(entry))
             return new_options
 
         # Leaf mode: a bare leaf carries no branch context, so look up its previous path in the selector's prior
         # options and re-insert it (via `_ensure_path_in_tree`) so the selection survives a data reload.
         selected_leaves = current_value if isinstance(current_value, list) else [current_value]
-        new_leaves = {path[-1] for path in _iter_cascader_paths_depth_first(new_options)}
+        new_leaves = data_manager._get_derived_data(
+            data_version,
+            ("cascader_leaves", tuple(path_cols)),
+            lambda: set(_iter_cascader_leaves_depth_first(new_options)),
+        )
         stale_leaves = {leaf for leaf in selected_leaves if leaf is not None and leaf not in new_leaves}
         if not stale_leaves:
             return new_options
+        new_options = dict(new_options)
         prev_options = getattr(self.selector, "options", None) or {}
         for path in _iter_cascader_paths_depth_first(prev_options):
             if path[-1] in stale_leaves:
@@ -27,14 +27,15 @@ from pydantic import (
     AfterValidator,
     BeforeValidator,
     Field,
+    PositiveInt,
     ValidationInfo,
 )
 from typing_extensions import TypedDict
 
 import vizro
-from vizro._constants import MODULE_PAGE_404, VIZRO_ASSETS_PATH
+from vizro._constants import MODULE_PAGE_404, VIZRO_ASSETS_PATH, WEBGL_THRESHOLD_DEFAULT
 from vizro.managers import model_manager
-from vizro.models import NavBar, Navigation, Tooltip, VizroBaseModel
+from vizro.models import Graph, NavBar, Navigation, Tooltip, VizroBaseModel
 from vizro.models._action._action import _BaseAction
 from vizro.models._controls import Filter, Parameter
 from vizro.models._models_utils import _all_hidden, _log_call, warn_description_without_title
@@ -106,6 +107,11 @@ class Dashboard(VizroBaseModel):
         Navigation | None, AfterValidator(set_navigation_pages), Field(default=None, validate_default=True)
     ]
     title: str = Field(default="", description="Dashboard title to appear on every page on top left-side.")
+    webgl_threshold: PositiveInt | None = Field(
+        default=WEBGL_THRESHOLD_DEFAULT,
+        description="""Number of points above which the scatter and line traces of graphs are drawn with WebGL rather
+than SVG, which is much faster for many points. If `None`, traces are drawn as the chart function gives them.""",
+    )
     # TODO: ideally description would have json_schema_input_type=str | Tooltip attached to the BeforeValidator,
     #  but this requires pydantic >= 2.9.
     description: Annotated[
@@ -132,6 +138,9 @@ class Dashboard(VizroBaseModel):
     def pre_build(self):
         self._validate_logos()
 
+        for graph in cast(Iterable[Graph], model_manager._get_models(Graph, root_model=self)):
+            graph._webgl_threshold = self.webgl_threshold
+
         # Setting order here ensures that the pages in dash.page_registry preserves the order of the list[Page].
         # For now the homepage (path /) corresponds to self.pages[0].
         # Note redirect_from=["/"] doesn't work and so the / route must be defined separately.
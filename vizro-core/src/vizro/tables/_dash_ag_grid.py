@@ -5,7 +5,7 @@ from typing import Any
 import dash_ag_grid as dag
 import pandas as pd
 
-from vizro._vizro_utils import _set_defaults_nested
+from vizro._vizro_utils import _set_defaults_nested, _to_records
 from vizro.models.types import capture
 
 _FORMAT_CURRENCY_EU = """d3.formatLocale({
@@ -75,7 +75,6 @@ def dash_ag_grid(data_frame: pd.DataFrame, **kwargs: Any) -> dag.AgGrid:
     defaults = {
         "className": "ag-theme-vizro",
         "columnDefs": [{"field": col} for col in data_frame.columns],
-        "rowData": data_frame.to_dict(orient="records"),
         "defaultColDef": {
             "resizable": True,
             "sortable": True,
@@ -95,6 +94,10 @@ def dash_ag_grid(data_frame: pd.DataFrame, **kwargs: Any) -> dag.AgGrid:
         },
         "columnSize": "responsiveSizeToFit",
     }
+    # With the infinite row model, the grid instead requests blocks of rows from the server as it needs them, so the
+    # records of data_frame aren't built at all. See vm.AgGrid.
+    if kwargs.get("rowModelType") != "infinite":
+        defaults["rowData"] = _to_records(data_frame)
     kwargs = _set_defaults_nested(kwargs, defaults)
 
     return dag.AgGrid(**kwargs)
@@ -5,7 +5,7 @@ from typing import Any
 import pandas as pd
 from dash import dash_table
 
-from vizro._vizro_utils import _set_defaults_nested
+from vizro._vizro_utils import _set_defaults_nested, _to_records
 from vizro.models.types import capture
 
 
@@ -52,4 +52,4 @@ def dash_data_table(data_frame: pd.DataFrame, **kwargs: Any) -> dash_table.DataT
         ],
     }
     kwargs = _set_defaults_nested(kwargs, defaults)
-    return dash_table.DataTable(data=data_frame.to_dict("records"), **kwargs)
+    return dash_table.DataTable(data=_to_records(data_frame), **kwargs)
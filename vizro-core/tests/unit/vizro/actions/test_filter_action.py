@@ -1,12 +1,17 @@
+import plotly.graph_objects as go
 import pytest
 from dash._callback_context import context_value
 from dash._utils import AttributeDict
 
 import vizro.models as vm
+import vizro.models._controls.filter
 import vizro.plotly.express as px
+from vizro import Vizro
 from vizro._constants import FILTER_ACTION_PREFIX
-from vizro.actions._actions_utils import CallbackTriggerDict
-from vizro.managers import model_manager
+from vizro.actions._actions_utils import CallbackTriggerDict, _get_pushed_down_filters
+from vizro.managers import data_manager, model_manager
+from vizro.managers._data_manager import _StaticData
+from vizro.models.types import capture
 
 
 @pytest.fixture
@@ -360,3 +365,205 @@ class TestFilter:
         expected = {"scatter_chart": target_scatter_filtered_continent_and_pop}
 
         assert result == expected
+
+
+class TestFilterSharedData:
+    @pytest.mark.parametrize("ctx_filter_continent", [["Africa"]], indirect=True)
+    def test_targets_with_same_data_filtered_once(
+        self, ctx_filter_continent, gapminder_2007, scatter_params, box_params, mocker
+    ):
+        data_manager["gapminder_2007"] = gapminder_2007
+        vm.Page(
+            id="test_page",
+            title="My first dashboard",
+            components=[
+                vm.Graph(id="box_chart", figure=px.box("gapminder_2007", **box_params)),
+                vm.Graph(id="scatter_chart", figure=px.scatter("gapminder_2007", **scatter_params)),
+            ],
+            controls=[vm.Filter(id="test_filter", column="continent", selector=vm.Dropdown(id="continent_filter"))],
+        )
+        filter_isin_spy = mocker.spy(vizro.models._controls.filter, "_filter_isin")
+        Vizro._pre_build()
+
+        result = model_manager[f"{FILTER_ACTION_PREFIX}_test_filter"].function(_controls=None)
+
+        filtered_data = gapminder_2007[gapminder_2007["continent"] == "Africa"]
+        expected_box = px.box(filtered_data, **box_params)
+        expected_scatter = px.scatter(filtered_data, **scatter_params)
+        expected_box.update_layout(modebar_remove=["select2d", "lasso2d"])
+        expected_scatter.update_layout(modebar_remove=["select2d", "lasso2d"])
+        assert result == {"box_chart": expected_box, "scatter_chart": expected_scatter}
+        assert filter_isin_spy.call_count == 1
+
+    # The second filter value keeps every row, which doesn't copy the data when it's filtered.
+    @pytest.mark.parametrize(
+        "ctx_filter_continent, continents",
+        [(["Africa"],) * 2, (["Africa", "Americas", "Asia", "Europe", "Oceania"],) * 2],
+        indirect=["ctx_filter_continent"],
+    )
+    @pytest.mark.parametrize("copy_on_write", [True, False])
+    def test_target_modifying_data_does_not_change_other_targets(
+        self, ctx_filter_continent, continents, copy_on_write, gapminder_2007, scatter_params, mocker
+    ):
+        mocker.patch("vizro.actions._actions_utils._copy_on_write_enabled", return_value=copy_on_write)
+
+        @capture("graph")
+        def modifying_chart(data_frame):
+            data_frame.loc[:, "lifeExp"] = 0
+            return go.Figure()
+
+        data_manager["gapminder_2007"] = gapminder_2007
+        vm.Page(
+            id="test_page",
+            title="My first dashboard",
+            components=[
+                vm.Graph(id="modifying_chart", figure=modifying_chart("gapminder_2007")),
+                vm.Graph(id="scatter_chart", figure=px.scatter("gapminder_2007", **scatter_params)),
+            ],
+            controls=[vm.Filter(id="test_filter", column="continent", selector=vm.Dropdown(id="continent_filter"))],
+        )
+        Vizro._pre_build()
+
+        result = model_manager[f"{FILTER_ACTION_PREFIX}_test_filter"].function(_controls=None)
+
+        filtered_data = gapminder_2007[gapminder_2007["continent"].isin(continents)]
+        expected_scatter = px.scatter(filtered_data, **scatter_params)
+        expected_scatter.update_layout(modebar_remove=["select2d", "lasso2d"])
+        assert result["scatter_chart"] == expected_scatter
+
+    @pytest.mark.parametrize("ctx_filter_continent", [["Africa"]], indirect=True)
+    def test_targets_load_only_referenced_columns(
+        self, ctx_filter_continent, gapminder_2007, scatter_params, box_params, mocker
+    ):
+        data_manager["gapminder_2007"] = gapminder_2007
+        vm.Page(
+            id="test_page",
+            title="My first dashboard",
+            components=[
+                vm.Graph(id="box_chart", figure=px.box("gapminder_2007", **box_params)),
+                vm.Graph(id="scatter_chart", figure=px.scatter("gapminder_2007", **scatter_params)),
+            ],
+            controls=[vm.Filter(id="test_filter", column="continent", selector=vm.Dropdown(id="continent_filter"))],
+        )
+        Vizro._pre_build()
+        load_spy = mocker.spy(_StaticData, "load")
+
+        result = model_manager[f"{FILTER_ACTION_PREFIX}_test_filter"].function(_controls=None)
+
+        # Both targets share a single load of the columns used by either of them or by the filter.
+        load_spy.assert_called_once_with(mocker.ANY, columns=["continent", "gdpPercap", "lifeExp"])
+        filtered_data = gapminder_2007[gapminder_2007["continent"] == "Africa"]
+        expected_box = px.box(filtered_data, **box_params)
+        expected_scatter = px.scatter(filtered_data, **scatter_params)
+        expected_box.update_layout(modebar_remove=["select2d", "lasso2d"])
+        expected_scatter.update_layout(modebar_remove=["select2d", "lasso2d"])
+        assert result == {"box_chart": expected_box, "scatter_chart": expected_scatter}
+
+
+class TestFilterPushdown:
+    @pytest.mark.parametrize("ctx_filter_continent", [["Africa"]], indirect=True)
+    def test_filter_pushed_down_into_data_loading_function(
+        self, ctx_filter_continent, gapminder_2007, scatter_params, mocker
+    ):
+        pushed_down_filters = []
+
+        def load_gapminder_2007(filters=None):
+            pushed_down_filters.append(filters)
+            data = gapminder_2007
+            for column, _, value in filters or []:
+                data = data[data[column].isin(value)]
+            return data
+
+        data_manager["gapminder_2007"] = load_gapminder_2007
+        vm.Page(
+            id="test_page",
+            title="My first dashboard",
+            components=[vm.Graph(id="scatter_chart", figure=px.scatter("gapminder_2007", **scatter_params))],
+            controls=[vm.Filter(id="test_filter", column="continent", selector=vm.Dropdown(id="continent_filter"))],
+        )
+        Vizro._pre_build()
+        pushed_down_filters.clear()
+        filter_isin_spy = mocker.spy(vizro.models._controls.filter, "_filter_isin")
+
+        result = model_manager[f"{FILTER_ACTION_PREFIX}_test_filter"].function(_controls=None)
+
+        expected_scatter = px.scatter(gapminder_2007[gapminder_2007["continent"] == "Africa"], **scatter_params)
+        expected_scatter.update_layout(modebar_remove=["select2d", "lasso2d"])
+        assert result == {"scatter_chart": expected_scatter}
+        assert pushed_down_filters == [[("continent", "in", ["Africa"])]]
+        # The filter is not applied again in memory.
+        assert filter_isin_spy.call_count == 0
+
+    @pytest.mark.parametrize(
+        "filter_targets, unfiltered_targets, expected_pushed_down_filters",
+        [
+            (["box_chart", "scatter_chart"], [], {"continent_filter": [("continent", "in", ["Africa"])]}),
+            # Targets that load the same data push down only the filters that they share.
+            (["box_chart"], [], {}),
+            (["box_chart", "scatter_chart"], ["scatter_chart"], {}),
+        ],
+    )
+    @pytest.mark.parametrize("ctx_filter_continent", [["Africa"]], indirect=True)
+    def test_get_pushed_down_filters(
+        self, ctx_filter_continent, filter_targets, unfiltered_targets, expected_pushed_down_filters, gapminder_2007
+    ):
+        data_manager["gapminder_2007"] = lambda filters=None: gapminder_2007
+        vm.Page(
+            id="test_page",
+            title="My first dashboard",
+            components=[
+                vm.Graph(id="box_chart", figure=px.box("gapminder_2007", x="continent", y="lifeExp")),
+                vm.Graph(id="scatter_chart", figure=px.scatter("gapminder_2007", x="gdpPercap", y="lifeExp")),
+            ],
+            controls=[
+                vm.Filter(
+                    id="test_filter",
+                    column="continent",
+                    targets=filter_targets,
+                    selector=vm.Dropdown(id="continent_filter"),
+                )
+            ],
+        )
+        Vizro._pre_build()
+        ctds_filter = ctx_filter_continent.get()["args_grouping"]["external"]["_controls"]["filters"]
+
+        result = _get_pushed_down_filters([], ctds_filter, ["box_chart", "scatter_chart"], unfiltered_targets)
+
+        assert result == {"box_chart": expected_pushed_down_filters, "scatter_chart": expected_pushed_down_filters}
+
+
+class TestNativeData:
+    @pytest.mark.parametrize(
+        "ctx_filter_continent_and_pop,target_scatter_filtered_continent_and_pop",
+        [([["Africa", "Europe"], [10**6, 10**7]], [["Africa", "Europe"], [10**6, 10**7]])],
+        indirect=True,
+    )
+    def test_data_filtered_before_conversion_to_pandas(
+        self,
+        ctx_filter_continent_and_pop,
+        target_scatter_filtered_continent_and_pop,
+        gapminder_2007,
+        scatter_params,
+        mocker,
+    ):
+        pa = pytest.importorskip("pyarrow")
+        data_manager["gapminder_2007"] = lambda: pa.Table.from_pandas(gapminder_2007, preserve_index=False)
+        vm.Page(
+            id="test_page",
+            title="My first dashboard",
+            components=[vm.Graph(id="scatter_chart", figure=px.scatter("gapminder_2007", **scatter_params))],
+            controls=[
+                vm.Filter(id="test_filter", column="continent", selector=vm.Dropdown(id="continent_filter")),
+                vm.Filter(column="pop", selector=vm.RangeSlider(id="pop_filter")),
+            ],
+        )
+        Vizro._pre_build()
+        filter_isin_spy = mocker.spy(vizro.models._controls.filter, "_filter_isin")
+        filter_between_spy = mocker.spy(vizro.models._controls.filter, "_filter_between")
+
+        result = model_manager[f"{FILTER_ACTION_PREFIX}_test_filter"].function(_controls=None)
+
+        assert result == {"scatter_chart": target_scatter_filtered_continent_and_pop}
+        # The filters are applied by PyArrow rather than pandas.
+        assert filter_isin_spy.call_count == 0
+        assert filter_between_spy.call_count == 0
@@ -1,5 +1,14 @@
 """Unit tests for vizro.managers.data_manager."""
 
+import contextvars
+import datetime
+import os
+import stat
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from functools import partial
 
@@ -14,6 +23,7 @@ from pandas.testing import assert_frame_equal
 from vizro import Vizro
 from vizro.managers import data_manager
 from vizro.managers._data_manager import _DynamicData, _StaticData
+from vizro.managers._shared_data import _get_data_hash, _get_shared_data_dir
 
 
 # Fixture that freezes the time so that tests involving time.sleep can run quickly. Instead of time.sleep,
@@ -56,6 +66,36 @@ class TestLoad:
         # Make sure loaded_data is a copy rather than the same object.
         assert loaded_data is not data
 
+    def test_static_mutation_does_not_affect_data(self):
+        data_manager["data"] = make_fixed_data()
+        loaded_data = data_manager["data"].load()
+        loaded_data.loc[0, 0] = 100
+        assert_frame_equal(data_manager["data"].load(), make_fixed_data())
+
+    def test_static_copy_on_write_shares_memory(self, monkeypatch):
+        monkeypatch.setattr("vizro.managers._data_manager._copy_on_write_enabled", lambda: True)
+        data = make_fixed_data()
+        data_manager["data"] = data
+        loaded_data = data_manager["data"].load()
+        assert np.shares_memory(loaded_data[0].to_numpy(), data[0].to_numpy())
+
+    def test_static_columns(self):
+        data = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+        data_manager["data"] = data
+        loaded_data = data_manager["data"].load(columns=["c", "a", "d"])
+        # Columns are in the order of the data and names that aren't columns are ignored.
+        assert_frame_equal(loaded_data, data[["a", "c"]])
+        # The version is the same as for the whole data.
+        data_version = data_manager._get_data_version(data_manager["data"].load())
+        assert data_manager._get_data_version(loaded_data) == data_version
+
+    def test_static_columns_mutation_does_not_affect_data(self):
+        data = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+        data_manager["data"] = data
+        loaded_data = data_manager["data"].load(columns=["a"])
+        loaded_data.loc[0, "a"] = 100
+        assert_frame_equal(data_manager["data"].load(), pd.DataFrame({"a": [1, 2], "b": [3, 4]}))
+
     def test_dynamic(self):
         data = make_fixed_data
         data_manager["data"] = data
@@ -72,6 +112,13 @@ class TestLoad:
         # Make sure loaded_data is a copy rather than the same object.
         assert loaded_data is not data()
 
+    def test_dynamic_not_pandas(self):
+        pa = pytest.importorskip("pyarrow")
+        data_manager["data"] = lambda: pa.table({"a": [1, 2, 3]})
+        loaded_data = data_manager["data"].load()
+        # Data in other formats is converted to pandas.
+        assert_frame_equal(loaded_data, pd.DataFrame({"a": [1, 2, 3]}))
+
 
 class TestMultiLoad:
     def test_static_single_request(self, mocker):
@@ -118,8 +165,23 @@ class TestMultiLoad:
         assert_frame_equal(loaded_data[1], make_fixed_data())
         assert_frame_equal(loaded_data[2], make_fixed_data())
 
-    # Test various JSON-serialisable types of argument value.
-    @pytest.mark.parametrize("label", ["y", None, [1, 2, 3], {"a": "b"}])
+    # Test various types of argument value, including ones that are not JSON-serialisable.
+    @pytest.mark.parametrize(
+        "label",
+        [
+            "y",
+            None,
+            [1, 2, 3],
+            {"a": "b"},
+            (1, 2, 3),
+            datetime.date(2024, 1, 1),
+            datetime.datetime(2024, 1, 1, 12, 30),
+            pd.Timestamp("2024-01-01"),
+            np.int64(1),
+            np.float64(1.5),
+            np.datetime64("2024-01-01"),
+        ],
+    )
     def test_dynamic_single_request_with_args(self, label, mocker):
         # Single value in multi_name_load_kwargs loads the data.
         data_manager["data"] = make_fixed_data_with_args
@@ -166,6 +228,251 @@ class TestMultiLoad:
         assert_frame_equal(loaded_data[1], make_fixed_data_with_args(label="x", another_label="y"))
         assert_frame_equal(loaded_data[2], make_fixed_data_with_args(label="x", another_label="x"))
 
+    @pytest.mark.parametrize(
+        "label_1, label_2",
+        [
+            ([1, 2], (1, 2)),
+            ([1, 2], np.array([1, 2])),
+            ({"a", "b", "c"}, {"c", "b", "a"}),
+            ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+            (1, np.int64(1)),
+            (datetime.datetime(2024, 1, 1), pd.Timestamp("2024-01-01")),
+            (datetime.datetime(2024, 1, 1), np.datetime64("2024-01-01T00:00")),
+        ],
+    )
+    def test_dynamic_equivalent_args_loaded_once(self, label_1, label_2, mocker):
+        data_manager["data"] = lambda label: make_fixed_data()
+        load_spy = mocker.spy(_DynamicData, "load")
+        loaded_data = data_manager._multi_load([("data", {"label": label_1}), ("data", {"label": label_2})])
+        assert load_spy.call_count == 1
+        assert len(loaded_data) == 2
+
+    @pytest.mark.parametrize(
+        "label_1, label_2",
+        [
+            (1, 1.0),
+            (1, True),
+            ("1", 1),
+            (datetime.date(2024, 1, 1), datetime.datetime(2024, 1, 1)),
+            ([1, 2], [2, 1]),
+            ([1, 2], {1, 2}),
+        ],
+    )
+    def test_dynamic_different_args_loaded_separately(self, label_1, label_2, mocker):
+        data_manager["data"] = lambda label: make_fixed_data()
+        load_spy = mocker.spy(_DynamicData, "load")
+        data_manager._multi_load([("data", {"label": label_1}), ("data", {"label": label_2})])
+        assert load_spy.call_count == 2
+
+    def test_dynamic_default_args_loaded_once(self, mocker):
+        data_manager["data"] = make_fixed_data_with_args
+        load_spy = mocker.spy(_DynamicData, "load")
+        data_manager._multi_load([("data", {"label": "x"}), ("data", {"label": "x", "another_label": "x"})])
+        assert load_spy.call_count == 1
+
+
+class TestMultiLoadNative:
+    @pytest.mark.parametrize("native", [True, False])
+    def test_dynamic_not_pandas(self, native):
+        pa = pytest.importorskip("pyarrow")
+        data = pa.table({"a": [1, 2, 3]})
+        data_manager["dynamic_data"] = lambda: data
+        data_manager["static_data"] = pd.DataFrame({"a": [1, 2, 3]})
+
+        dynamic_data, static_data = data_manager._multi_load([("dynamic_data", {}), ("static_data", {})], native=native)
+
+        # Only dynamic data is returned in the format given by its data loading function.
+        assert dynamic_data is data if native else isinstance(dynamic_data, pd.DataFrame)
+        assert_frame_equal(static_data, pd.DataFrame({"a": [1, 2, 3]}))
+
+
+class TestMultiLoadColumns:
+    def test_static(self):
+        data_manager["data"] = pd.DataFrame({"a": [1], "b": [2], "c": [3]})
+        loaded_data = data_manager._multi_load([("data", {})], [{"a"}])
+        assert list(loaded_data[0].columns) == ["a"]
+
+    def test_static_union_of_columns_loaded_once(self, mocker):
+        data_manager["data"] = pd.DataFrame({"a": [1], "b": [2], "c": [3]})
+        load_spy = mocker.spy(_StaticData, "load")
+        loaded_data = data_manager._multi_load([("data", {}), ("data", {})], [{"c"}, {"a"}])
+        assert load_spy.call_count == 1
+        assert loaded_data[0] is loaded_data[1]
+        assert list(loaded_data[0].columns) == ["a", "c"]
+
+    @pytest.mark.parametrize("multi_columns", [None, [{"a"}, None], [None, {"a"}]])
+    def test_static_all_columns(self, multi_columns):
+        data_manager["data"] = pd.DataFrame({"a": [1], "b": [2], "c": [3]})
+        loaded_data = data_manager._multi_load([("data", {}), ("data", {})], multi_columns)
+        assert list(loaded_data[0].columns) == ["a", "b", "c"]
+
+    def test_dynamic_with_columns_argument(self, mocker):
+        load_data = mocker.Mock(return_value=pd.DataFrame({"a": [1]}))
+        data_manager["data"] = lambda columns=None: load_data(columns=columns)
+        data_manager._multi_load([("data", {}), ("data", {})], [{"b", "a"}, {"c"}])
+        load_data.assert_called_once_with(columns=["a", "b", "c"])
+
+    def test_dynamic_with_columns_argument_set_by_load_kwargs(self, mocker):
+        load_data = mocker.Mock(return_value=pd.DataFrame({"a": [1]}))
+        data_manager["data"] = lambda columns=None: load_data(columns=columns)
+        data_manager._multi_load([("data", {"columns": ["x"]})], [{"a"}])
+        load_data.assert_called_once_with(columns=["x"])
+
+    def test_dynamic_without_columns_argument(self):
+        data_manager["data"] = lambda: pd.DataFrame({"a": [1], "b": [2]})
+        loaded_data = data_manager._multi_load([("data", {})], [{"a"}])
+        assert list(loaded_data[0].columns) == ["a", "b"]
+
+
+@pytest.fixture
+def shared_data_dir(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr("vizro.managers._shared_data._get_shared_data_base_dir", lambda: tmp_path)
+    data_manager.share_static_data = True
+    return _get_shared_data_dir()
+
+
+class TestShareStaticData:
+    def test_load(self, shared_data_dir):
+        data = pd.DataFrame({"a": [1, 2], "b": ["x", "y"], "c": pd.to_datetime(["2024-01-01", "2024-01-02"])})
+        data_manager["data"] = data
+        loaded_data = data_manager["data"].load()
+        assert_frame_equal(loaded_data, data)
+        assert_frame_equal(data_manager["data"].load(columns=["b"]), data[["b"]])
+        assert len(list(shared_data_dir.glob("*.arrow"))) == 1
+
+    def test_mutation_does_not_affect_data(self, shared_data_dir):
+        data_manager["data"] = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+        loaded_data = data_manager["data"].load()
+        loaded_data.loc[0, "a"] = 100
+        assert_frame_equal(data_manager["data"].load(), pd.DataFrame({"a": [1, 2], "b": [3, 4]}))
+
+    def test_same_data_shares_file(self, shared_data_dir):
+        data_manager["data_1"] = pd.DataFrame({"a": [1, 2]})
+        data_manager["data_2"] = pd.DataFrame({"a": [1, 2]})
+        data_manager["data_3"] = pd.DataFrame({"a": [1, 3]})
+        for name in ["data_1", "data_2", "data_3"]:
+            data_manager[name].load()
+        assert len(list(shared_data_dir.glob("*.arrow"))) == 2
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pd.DataFrame({"a": [1, "x", [1]]}),
+            # Arrow would convert the column names to strings.
+            pd.DataFrame({0: [1, 2]}),
+        ],
+    )
+    def test_data_that_cannot_be_shared(self, shared_data_dir, caplog, data):
+        data_manager["data"] = data
+        assert_frame_equal(data_manager["data"].load(), data)
+        assert "Could not share static data between processes" in caplog.text
+        assert not list(shared_data_dir.glob("*.arrow"))
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Windows has no file modes to check.")
+    def test_file_private_to_user(self, shared_data_dir):
+        data_manager["data"] = pd.DataFrame({"a": [1, 2]})
+        data_manager["data"].load()
+        [path] = shared_data_dir.glob("*.arrow")
+        assert stat.S_IMODE(shared_data_dir.stat().st_mode) == 0o700
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Windows has no file modes to check.")
+    @pytest.mark.parametrize("private_path", ["directory", "file"])
+    def test_path_accessible_by_other_users_not_used(self, shared_data_dir, caplog, private_path):
+        data = pd.DataFrame({"a": [1, 2]})
+        # Another user could plant a file with the name of the shared data or make the directory accessible.
+        planted_path = shared_data_dir / f"vizro_{_get_data_hash(data)}.arrow"
+        planted_path.write_bytes(b"planted")
+        planted_path.chmod(0o600)
+        (shared_data_dir if private_path == "directory" else planted_path).chmod(0o755)
+
+        data_manager["data"] = data
+        assert_frame_equal(data_manager["data"].load(), data)
+        assert "Could not share static data between processes" in caplog.text
+
+    def test_pyarrow_not_installed(self, mocker):
+        mocker.patch("importlib.util.find_spec", return_value=None)
+        with pytest.raises(ModuleNotFoundError, match="You must install pyarrow to use share_static_data"):
+            data_manager.share_static_data = True
+
+
+class TestParallelMultiLoad:
+    def test_dynamic_loads_run_in_parallel(self):
+        # Each load waits for the other to start, which is only possible if they run at the same time.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def data_x():
+            barrier.wait()
+            return make_fixed_data_with_args(label="x")
+
+        def data_y():
+            barrier.wait()
+            return make_fixed_data_with_args(label="y")
+
+        data_manager["data_x"] = data_x
+        data_manager["data_y"] = data_y
+        loaded_data = data_manager._multi_load([("data_x", {}), ("data_y", {}), ("data_x", {})])
+
+        assert_frame_equal(loaded_data[0], make_fixed_data_with_args(label="x"))
+        assert_frame_equal(loaded_data[1], make_fixed_data_with_args(label="y"))
+        assert_frame_equal(loaded_data[2], make_fixed_data_with_args(label="x"))
+
+    @pytest.mark.parametrize("max_parallel_loads, parallel_load", [(1, True), (8, False)])
+    def test_dynamic_loads_run_in_calling_thread(self, max_parallel_loads, parallel_load):
+        load_threads = []
+
+        def data_with_args(label):
+            load_threads.append(threading.current_thread())
+            return make_fixed_data_with_args(label)
+
+        data_manager.max_parallel_loads = max_parallel_loads
+        data_manager["data"] = data_with_args
+        data_manager["data"].parallel_load = parallel_load
+        data_manager._multi_load([("data", {"label": "x"}), ("data", {"label": "y"})])
+
+        assert load_threads == [threading.current_thread()] * 2
+
+    def test_replaced_executor_shut_down(self, mocker):
+        data_manager["data"] = make_fixed_data_with_args
+        data_manager._multi_load([("data", {"label": "x"}), ("data", {"label": "y"})])
+        shutdown = mocker.spy(ThreadPoolExecutor, "shutdown")
+
+        data_manager.max_parallel_loads = 4
+        data_manager._multi_load([("data", {"label": "x"}), ("data", {"label": "y"})])
+
+        shutdown.assert_called_once_with(mocker.ANY, wait=False)
+
+    def test_context_copied_to_load_threads(self):
+        context_var = contextvars.ContextVar("context_var")
+        context_var.set("value")
+        loaded_values = []
+
+        def data_with_args(label):
+            loaded_values.append(context_var.get())
+            return make_fixed_data_with_args(label)
+
+        data_manager["data"] = data_with_args
+        data_manager._multi_load([("data", {"label": "x"}), ("data", {"label": "y"})])
+
+        assert loaded_values == ["value", "value"]
+
+    def test_error_propagated(self):
+        def failing_data():
+            raise ValueError("Failed to load")
+
+        data_manager["data_x"] = failing_data
+        data_manager["data_y"] = make_fixed_data
+        with pytest.raises(ValueError, match="Failed to load"):
+            data_manager._multi_load([("data_x", {}), ("data_y", {})])
+
+    def test_static_data_does_not_support_parallel_load(self):
+        data_manager["data"] = make_fixed_data()
+        with pytest.raises(
+            AttributeError, match=r"Static data that is a pandas\.DataFrame itself does not support parallel_load"
+        ):
+            data_manager["data"].parallel_load = False
+
 
 class TestInvalid:
     def test_static_data_does_not_support_timeout(self):
@@ -550,3 +857,383 @@ class TestCacheIndependence:
         # Cache has expired for data_y but not data_x.
         assert_frame_equal(loaded_data_x_1, loaded_data_x_2)
         assert_frame_not_equal(loaded_data_y_1, loaded_data_y_2)
+
+
+class TestMemoizedLoadData:
+    def test_memoize_built_once(self, simple_cache, mocker):
+        memoize_spy = mocker.spy(data_manager.cache, "memoize")
+        data_manager["data"] = make_random_data
+        data_manager["data"].load()
+        data_manager["data"].load()
+        assert memoize_spy.call_count == 1
+
+    def test_memoize_rebuilt_for_new_cache(self, simple_cache):
+        data_manager["data"] = make_random_data
+        loaded_data_1 = data_manager["data"].load()
+        data_manager.cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
+        Vizro()
+        loaded_data_2 = data_manager["data"].load()
+        loaded_data_3 = data_manager["data"].load()
+        assert_frame_not_equal(loaded_data_1, loaded_data_2)
+        assert_frame_equal(loaded_data_2, loaded_data_3)
+
+    def test_change_timeout_after_load(self, simple_cache, freezer):
+        # Changing the timeout applies to data cached after the change without needing to rebuild the memoized function.
+        data_manager["data"] = make_random_data_with_args
+        data_manager["data"].load("x")
+        data_manager["data"].timeout = 100
+        loaded_data_y_1 = data_manager["data"].load("y")
+        freezer.tick(100 + 50)
+        loaded_data_y_2 = data_manager["data"].load("y")
+        assert_frame_not_equal(loaded_data_y_1, loaded_data_y_2)
+
+
+class TestLoadKey:
+    def test_equivalent_args_share_cache(self, simple_cache):
+        data_manager["data"] = make_random_data_with_args
+        loaded_data_1 = data_manager["data"].load(label=np.int64(1))
+        loaded_data_2 = data_manager["data"].load(1)
+        assert_frame_equal(loaded_data_1, loaded_data_2)
+
+    def test_same_in_every_process(self):
+        # The order of a set of strings depends on the hash seed, which is different in each process.
+        code = (
+            "import datetime, numpy as np;"
+            "from vizro.managers._data_manager import _DynamicData;"
+            "load_key = _DynamicData(lambda label, values: None)._load_key("
+            "'x', values={'a', 'b', 'c', 'd', datetime.date(2024, 1, 1), np.int64(1)});"
+            "print(load_key)"
+        )
+        load_keys = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "PYTHONHASHSEED": str(seed)},
+            ).stdout
+            for seed in range(3)
+        }
+        assert len(load_keys) == 1
+
+
+class TestDataVersion:
+    def test_static(self):
+        data_manager["data"] = make_fixed_data()
+        data_version_1 = data_manager._get_data_version(data_manager["data"].load())
+        data_version_2 = data_manager._get_data_version(data_manager["data"].load())
+        assert data_version_1 is not None
+        assert data_version_1 == data_version_2
+
+    def test_static_does_not_modify_data(self):
+        data = make_fixed_data()
+        data_manager["data"] = data
+        data_manager["data"].load()
+        assert data.attrs == {}
+
+    def test_dynamic_cache(self, simple_cache, freezer):
+        data_manager["data"] = make_random_data
+        data_version_1 = data_manager._get_data_version(data_manager["data"].load())
+        data_version_2 = data_manager._get_data_version(data_manager["data"].load())
+        freezer.tick(300 + 50)
+        data_version_3 = data_manager._get_data_version(data_manager["data"].load())
+        assert data_version_1 is not None
+        assert data_version_1 == data_version_2
+        assert data_version_2 != data_version_3
+
+    def test_dynamic_cache_with_arguments(self, simple_cache):
+        data_manager["data"] = make_random_data_with_args
+        data_version_x = data_manager._get_data_version(data_manager["data"].load("x"))
+        data_version_y = data_manager._get_data_version(data_manager["data"].load("y"))
+        assert data_version_x != data_version_y
+
+    def test_dynamic_null_cache(self):
+        data_manager["data"] = make_random_data
+        Vizro()
+        assert data_manager._get_data_version(data_manager["data"].load()) is None
+
+    def test_dynamic_returns_versioned_data(self):
+        # A data loading function could return data that's derived from another data source and so has that data
+        # source's version.
+        data_manager["static_data"] = make_fixed_data()
+        data_manager["data"] = lambda: data_manager["static_data"].load().head(1)
+        assert data_manager._get_data_version(data_manager["data"].load()) is None
+
+    def test_derived_data(self, mocker):
+        compute = mocker.Mock(side_effect=[1, 2])
+        assert data_manager._get_derived_data("version", "key", compute) == 1
+        assert data_manager._get_derived_data("version", "key", compute) == 1
+        assert data_manager._get_derived_data("new_version", "key", compute) == 2
+        assert compute.call_count == 2
+
+    def test_derived_data_evicted(self, mocker):
+        data_manager._derived_data.maxsize = 2
+        compute = mocker.Mock(side_effect=[1, 2, 3, 4])
+        data_manager._get_derived_data("version", "key_1", compute)
+        data_manager._get_derived_data("version", "key_2", compute)
+        data_manager._get_derived_data("version", "key_1", compute)  # Now key_2 is least recently used.
+        data_manager._get_derived_data("version", "key_3", compute)
+        assert len(data_manager._derived_data) == 2
+        assert data_manager._get_derived_data("version", "key_1", compute) == 1
+        assert data_manager._get_derived_data("version", "key_2", compute) == 4
+
+    def test_derived_data_evicted_by_size(self):
+        data_manager._derived_data.maxbytes = 3000
+        data_manager._get_derived_data("version", "key_1", lambda: np.zeros(100))
+        data_manager._get_derived_data("version", "key_2", lambda: (np.zeros(100), pd.Index(range(100, 200, 3))))
+        data_manager._get_derived_data("version", "key_3", lambda: np.zeros(200))
+        # key_1 is evicted so that the values take at most 3000 bytes.
+        assert len(data_manager._derived_data) == 2
+        assert data_manager._derived_data.nbytes <= 3000
+        assert data_manager._get_derived_data("version", "key_1", lambda: "recomputed") == "recomputed"
+
+    def test_derived_data_too_large_not_cached(self, mocker):
+        data_manager._derived_data.maxbytes = 100
+        compute = mocker.Mock(side_effect=lambda: np.zeros(100))
+        data_manager._get_derived_data("version", "key", compute)
+        data_manager._get_derived_data("version", "key", compute)
+        assert compute.call_count == 2
+        assert len(data_manager._derived_data) == 0
+
+
+class TestLoadStats:
+    def test_cache(self, simple_cache, freezer):
+        data_manager["data"] = make_random_data_with_args
+        data_manager["data"].load("x")
+        data_manager["data"].load("x")
+        data_manager["data"].load("y")
+        freezer.tick(300 + 50)
+        data_manager["data"].load("x")
+
+        stats = data_manager["data"]._stats
+        assert (stats.loads, stats.hits, stats.misses) == (4, 1, 3)
+        assert stats.load_time > 0
+
+    def test_cache_not_operational(self):
+        data_manager["data"] = make_random_data
+        data_manager["data"].load()
+        data_manager["data"].load()
+
+        stats = data_manager["data"]._stats
+        assert (stats.loads, stats.hits, stats.misses) == (2, 0, 2)
+
+
+class TestSingleFlight:
+    def test_concurrent_loads_coalesced(self):
+        # The first load blocks until all the other threads are waiting for it, so the loads are concurrent.
+        release_load = threading.Event()
+        load_calls = []
+
+        def slow_data(label="x"):
+            load_calls.append(label)
+            release_load.wait(timeout=5)
+            return make_random_data_with_args(label)
+
+        data_manager["data"] = slow_data
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(data_manager["data"].load, label="x") for _ in range(4)]
+            time.sleep(0.2)
+            release_load.set()
+            loaded_data = [future.result() for future in futures]
+
+        assert load_calls == ["x"]
+        for data in loaded_data[1:]:
+            assert_frame_equal(data, loaded_data[0])
+            assert data is not loaded_data[0]
+
+    def test_concurrent_loads_different_args_not_coalesced(self):
+        release_load = threading.Event()
+        load_calls = []
+
+        def slow_data(label="x"):
+            load_calls.append(label)
+            release_load.wait(timeout=5)
+            return make_random_data_with_args(label)
+
+        data_manager["data"] = slow_data
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(data_manager["data"].load, label=label) for label in ["x", "y"]]
+            time.sleep(0.2)
+            release_load.set()
+            [future.result() for future in futures]
+
+        assert sorted(load_calls) == ["x", "y"]
+
+    def test_error_propagated_to_waiting_loads(self):
+        release_load = threading.Event()
+
+        def failing_data():
+            release_load.wait(timeout=5)
+            raise ValueError("Failed to load")
+
+        data_manager["data"] = failing_data
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(data_manager["data"].load) for _ in range(2)]
+            time.sleep(0.2)
+            release_load.set()
+            for future in futures:
+                with pytest.raises(ValueError, match="Failed to load"):
+                    future.result()
+
+        # Nothing is left in flight, so a later load runs again.
+        release_load.set()
+        with pytest.raises(ValueError, match="Failed to load"):
+            data_manager["data"].load()
+
+
+class TestLoadLock:
+    def test_lock_not_held(self, simple_cache, mocker):
+        delete_spy = mocker.spy(data_manager.cache, "delete")
+        data_manager["data"] = make_random_data
+        data_manager["data"].lock_timeout = 10
+
+        loaded_data_1 = data_manager["data"].load()
+        loaded_data_2 = data_manager["data"].load()
+
+        assert_frame_equal(loaded_data_1, loaded_data_2)
+        assert data_manager["data"]._stats.misses == 1
+        # The lock is released after loading.
+        assert delete_spy.call_count == 1
+
+    def test_lock_held_by_other_process(self, simple_cache, mocker):
+        # Another process holds the lock and puts the data into the cache while this process waits.
+        data_from_other_process = make_random_data()
+        mocker.patch.object(data_manager.cache, "add", return_value=False)
+        mocker.patch.object(data_manager.cache, "get", side_effect=[None, data_from_other_process])
+        delete_spy = mocker.spy(data_manager.cache, "delete")
+        data_manager["data"] = make_random_data
+        data_manager["data"].lock_timeout = 10
+
+        loaded_data = data_manager["data"].load()
+
+        assert_frame_equal(loaded_data, data_from_other_process)
+        assert data_manager["data"]._stats.misses == 0
+        # This process didn't acquire the lock so must not release it.
+        assert delete_spy.call_count == 0
+
+    def test_lock_held_by_other_process_timeout(self, simple_cache, mocker):
+        # Another process holds the lock but never puts the data into the cache, so this process loads it instead.
+        mocker.patch.object(data_manager.cache, "add", return_value=False)
+        data_manager["data"] = make_random_data
+        data_manager["data"].lock_timeout = 1
+
+        data_manager["data"].load()
+
+        assert data_manager["data"]._stats.misses == 1
+
+    def test_static_data_does_not_support_lock_timeout(self):
+        data_manager["data"] = make_fixed_data()
+        with pytest.raises(
+            AttributeError, match=r"Static data that is a pandas\.DataFrame itself does not support lock_timeout"
+        ):
+            data_manager["data"].lock_timeout = 10
+
+
+@pytest.fixture
+def refresh_executor(monkeypatch):
+    # Background refreshes run in this executor, so tests can wait for them to finish with executor.shutdown().
+    executor = ThreadPoolExecutor()
+    monkeypatch.setattr("vizro.managers._data_manager._refresh_executor", executor)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.usefixtures("simple_cache")
+class TestRefreshInBackground:
+    def test_stale_data_served_while_refreshing(self, freezer, refresh_executor):
+        data_manager["data"] = make_random_data
+        data_manager["data"].timeout = 100
+        data_manager["data"].refresh = "background"
+
+        loaded_data_1 = data_manager["data"].load()
+        freezer.tick(100 + 50)
+        loaded_data_2 = data_manager["data"].load()
+        refresh_executor.shutdown(wait=True)
+        loaded_data_3 = data_manager["data"].load()
+        loaded_data_4 = data_manager["data"].load()
+
+        # loaded_data_2 is stale data served while the refresh runs. Subsequent loads get the refreshed data.
+        assert_frame_equal(loaded_data_1, loaded_data_2)
+        assert_frame_not_equal(loaded_data_2, loaded_data_3)
+        assert_frame_equal(loaded_data_3, loaded_data_4)
+        assert data_manager["data"]._stats.misses == 2
+
+    def test_fresh_data_not_refreshed(self, freezer):
+        data_manager["data"] = make_random_data
+        data_manager["data"].timeout = 100
+        data_manager["data"].refresh = "background"
+
+        loaded_data_1 = data_manager["data"].load()
+        freezer.tick(50)
+        loaded_data_2 = data_manager["data"].load()
+
+        assert_frame_equal(loaded_data_1, loaded_data_2)
+        assert data_manager["data"]._stats.misses == 1
+
+    def test_max_staleness(self, freezer):
+        data_manager["data"] = make_random_data
+        data_manager["data"].timeout = 100
+        data_manager["data"].refresh = "background"
+        data_manager["data"].max_staleness = 100
+
+        loaded_data_1 = data_manager["data"].load()
+        # Data is older than timeout + max_staleness so is no longer served and is reloaded straight away.
+        freezer.tick(100 + 100 + 50)
+        loaded_data_2 = data_manager["data"].load()
+
+        assert_frame_not_equal(loaded_data_1, loaded_data_2)
+        assert data_manager["data"]._stats.misses == 2
+
+    def test_failed_refresh_keeps_stale_data(self, freezer, refresh_executor, caplog):
+        calls = []
+
+        def flaky_data():
+            calls.append(None)
+            if len(calls) > 1:
+                raise ValueError("Failed to load")
+            return make_random_data()
+
+        data_manager["data"] = flaky_data
+        data_manager["data"].timeout = 100
+        data_manager["data"].refresh = "background"
+
+        loaded_data_1 = data_manager["data"].load()
+        freezer.tick(100 + 50)
+        loaded_data_2 = data_manager["data"].load()
+        refresh_executor.shutdown(wait=True)
+
+        assert_frame_equal(loaded_data_1, loaded_data_2)
+        assert len(calls) == 2
+        assert "Failed to refresh data in background" in caplog.text
+
+    def test_context_copied_to_refresh_thread(self, freezer, refresh_executor):
+        context_var = contextvars.ContextVar("context_var")
+        context_var.set("value")
+        loaded_values = []
+
+        def context_data():
+            loaded_values.append(context_var.get())
+            return make_random_data()
+
+        data_manager["data"] = context_data
+        data_manager["data"].timeout = 100
+        data_manager["data"].refresh = "background"
+
+        data_manager["data"].load()
+        freezer.tick(100 + 50)
+        data_manager["data"].load()
+        refresh_executor.shutdown(wait=True)
+
+        assert loaded_values == ["value", "value"]
+
+    def test_invalid_refresh(self):
+        data_manager["data"] = make_random_data
+        with pytest.raises(ValueError, match="refresh must be 'blocking' or 'background', not 'invalid'"):
+            data_manager["data"].refresh = "invalid"
+
+    def test_static_data_does_not_support_refresh(self):
+        data_manager["static_data"] = make_fixed_data()
+        with pytest.raises(
+            AttributeError, match=r"Static data that is a pandas\.DataFrame itself does not support refresh"
+        ):
+            data_manager["static_data"].refresh = "background"
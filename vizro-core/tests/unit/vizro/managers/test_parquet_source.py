@@ -0,0 +1,118 @@
+"""Unit tests for vizro.managers.ParquetSource."""
+
+import os
+from contextlib import suppress
+
+import pandas as pd
+import pytest
+from flask_caching import Cache
+from pandas.testing import assert_frame_equal
+
+from vizro import Vizro
+from vizro.managers import ParquetSource, data_manager
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame(
+        {"continent": ["Africa", "Asia", "Africa", "Europe"], "year": [2000, 2000, 2007, 2007], "pop": [1, 2, 3, 4]}
+    )
+
+
+@pytest.fixture(params=["parquet", "feather"])
+def path(request, tmp_path, data):
+    path = tmp_path / f"data.{request.param}"
+    # Small row groups so that Parquet filters can skip some of them.
+    if request.param == "parquet":
+        data.to_parquet(path, row_group_size=2)
+    else:
+        data.to_feather(path)
+    return path
+
+
+@pytest.fixture
+def simple_cache():
+    data_manager.cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
+    Vizro()
+    yield
+    with suppress(AttributeError):
+        data_manager.cache.clear()
+
+
+def overwrite(path, data, mtime_ns):
+    if path.suffix == ".parquet":
+        data.to_parquet(path)
+    else:
+        data.to_feather(path)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestParquetSource:
+    def test_load(self, path, data):
+        assert_frame_equal(ParquetSource(path)(), data)
+
+    def test_load_columns_and_filters(self, path, data):
+        result = ParquetSource(path)(columns=["year", "pop"], filters=[("continent", "in", ["Africa"])])
+        expected = data.loc[data["continent"] == "Africa", ["year", "pop"]].reset_index(drop=True)
+        assert_frame_equal(result, expected)
+
+    def test_pyarrow_dtype_backend(self, path):
+        result = ParquetSource(path, dtype_backend="pyarrow")(columns=["pop"])
+        assert isinstance(result["pop"].dtype, pd.ArrowDtype)
+
+    @pytest.mark.parametrize("file_format", ["parquet", "feather"])
+    def test_explicit_format(self, tmp_path, data, file_format):
+        path = tmp_path / "data"
+        getattr(data, f"to_{file_format}")(path)
+        assert_frame_equal(ParquetSource(path, format=file_format)(), data)
+
+    @pytest.mark.parametrize("compression, expected_reads", [("uncompressed", 1), ("lz4", 2)])
+    def test_feather_table_kept_only_if_memory_mapped(self, tmp_path, data, mocker, compression, expected_reads):
+        import pyarrow as pa
+
+        path = tmp_path / "data.feather"
+        data.to_feather(path, compression=compression)
+        open_file = mocker.spy(pa.ipc, "open_file")
+        source = ParquetSource(path)
+        source()
+        source()
+
+        # The table of a compressed file is a decompressed copy in memory, so it's read again rather than kept.
+        assert open_file.call_count == expected_reads
+
+    def test_format_cannot_be_inferred(self):
+        with pytest.raises(ValueError, match="Cannot infer the format"):
+            ParquetSource("data.csv")
+
+    def test_pyarrow_not_installed(self, mocker):
+        mocker.patch("importlib.util.find_spec", return_value=None)
+        with pytest.raises(ModuleNotFoundError, match="You must install pyarrow to use ParquetSource"):
+            ParquetSource("data.parquet")
+
+
+class TestDataManagerParquetSource:
+    def test_columns_and_filters_pushed_down(self, path, data):
+        data_manager["data"] = ParquetSource(path)
+        assert data_manager["data"]._accepts_argument("columns")
+        assert data_manager["data"]._accepts_argument("filters")
+
+        result = data_manager["data"].load(columns=["pop"], filters=[("year", ">=", 2007)])
+        assert_frame_equal(result, pd.DataFrame({"pop": [3, 4]}))
+
+    def test_reload_when_file_changes(self, path, data, simple_cache):
+        os.utime(path, ns=(1, 1))
+        data_manager["data"] = ParquetSource(path)
+        loaded_data_1 = data_manager["data"].load()
+
+        new_data = data.assign(pop=data["pop"] * 10)
+        overwrite(path, new_data, mtime_ns=1)
+        # The data is cached and the file's modification time is unchanged.
+        loaded_data_2 = data_manager["data"].load()
+        overwrite(path, new_data, mtime_ns=2)
+        loaded_data_3 = data_manager["data"].load()
+
+        assert_frame_equal(loaded_data_1, data)
+        assert_frame_equal(loaded_data_2, data)
+        assert_frame_equal(loaded_data_3, new_data)
@@ -2,6 +2,7 @@
 
 import re
 
+import dash
 import dash_ag_grid as dag
 import dash_bootstrap_components as dbc
 import pytest
@@ -17,6 +18,7 @@ from vizro import Vizro
 from vizro.managers import data_manager
 from vizro.managers._model_manager import DuplicateIDError
 from vizro.models._action._action import Action
+from vizro.models._components._ag_grid_row_model import _get_rows
 from vizro.models._components.ag_grid import DAG_AG_GRID_PROPERTIES
 from vizro.models.types import capture
 from vizro.tables import dash_ag_grid
@@ -330,6 +332,84 @@ class TestDunderMethodsAgGrid:
 
         assert result_ag_grid_table.dashGridOptions.get("theme") == {"function": "vizroTheme(themeQuartz, agGrid)"}
 
+    def test_call_infinite_row_model(self):
+        gapminder = px.data.gapminder()
+        ag_grid = vm.AgGrid(id="ag_grid_id", figure=dash_ag_grid(data_frame=gapminder, rowModelType="infinite"))
+        ag_grid.pre_build()
+        # ag_grid() is the same as ag_grid.__call__()
+        result_ag_grid = ag_grid()
+
+        [result_ag_grid_table, _, result_row_data_id_store] = result_ag_grid.children
+
+        assert not hasattr(result_ag_grid_table, "rowData")
+        assert result_row_data_id_store.id == "__input_ag_grid_id_row_data_id"
+        result = _get_rows({"startRow": 0, "endRow": 2}, result_row_data_id_store.data)
+        assert result == {"rowData": gapminder.head(2).to_dict(orient="records"), "rowCount": len(gapminder)}
+
+    def test_call_infinite_row_model_cache_timeout(self, mocker):
+        data_manager["gapminder"] = px.data.gapminder
+        data_manager["gapminder"].timeout = 5
+        row_data_store_set = mocker.patch("vizro.models._components.ag_grid._row_data_store.set_data_frame")
+        ag_grid = vm.AgGrid(figure=dash_ag_grid(data_frame="gapminder", rowModelType="infinite"))
+        ag_grid.pre_build()
+        ag_grid()
+
+        row_data_store_set.assert_called_once_with(mocker.ANY, timeout=5)
+
+
+class TestAgGridReferencedColumns:
+    @pytest.mark.parametrize(
+        "figure_kwargs, actions, expected_columns",
+        [
+            ({"columnDefs": [{"field": "country"}, {"field": "pop"}]}, [], {"country", "pop"}),
+            (
+                {"columnDefs": [{"headerName": "Group", "children": [{"field": "country"}]}, {"field": "pop"}]},
+                [],
+                {"country", "pop"},
+            ),
+            (
+                {"columnDefs": [{"field": "country"}]},
+                [va.set_control(control="control_id", value="continent")],
+                {"country", "continent"},
+            ),
+            ({"columnDefs": [{"field": "country"}]}, [va.set_control(control="control_id", value="cell")], {"country"}),
+        ],
+    )
+    def test_column_defs(self, figure_kwargs, actions, expected_columns):
+        ag_grid = vm.AgGrid(figure=dash_ag_grid(data_frame="gapminder", **figure_kwargs), actions=actions)
+        assert ag_grid._get_referenced_columns(figure_kwargs) == expected_columns
+
+    @pytest.mark.parametrize(
+        "figure_kwargs",
+        [
+            # Without columnDefs, every column is shown.
+            {},
+            {"columnDefs": [{"field": "country"}, {"valueGetter": {"function": "params.data.pop * 2"}}]},
+            {"columnDefs": [{"field": "country"}], "getRowId": "params.data.iso_alpha"},
+            {"columnDefs": [{"field": "country"}], "rowClassRules": {"big": "data['pop'] > 1e8"}},
+        ],
+    )
+    def test_all_columns(self, figure_kwargs):
+        ag_grid = vm.AgGrid(figure=dash_ag_grid(data_frame="gapminder", **figure_kwargs))
+        assert ag_grid._get_referenced_columns(figure_kwargs) is None
+
+    def test_all_columns_custom_action(self, identity_action_function):
+        figure_kwargs = {"columnDefs": [{"field": "country"}]}
+        ag_grid = vm.AgGrid(
+            figure=dash_ag_grid(data_frame="gapminder", **figure_kwargs),
+            actions=[vm.Action(function=identity_action_function())],
+        )
+        assert ag_grid._get_referenced_columns(figure_kwargs) is None
+
+    def test_all_columns_custom_ag_grid(self):
+        @capture("ag_grid")
+        def custom_dash_ag_grid(data_frame, columnDefs):
+            return dag.AgGrid(columnDefs=columnDefs, rowData=data_frame.to_dict("records"))
+
+        figure_kwargs = {"columnDefs": [{"field": "country"}]}
+        ag_grid = vm.AgGrid(figure=custom_dash_ag_grid(data_frame="gapminder", **figure_kwargs))
+        assert ag_grid._get_referenced_columns(figure_kwargs) is None
+
 
 class TestProcessAgGridDataFrame:
     def test_process_figure_data_frame_str_df(self, dash_ag_grid_with_str_dataframe, gapminder):
@@ -451,6 +531,31 @@ class TestBuildAgGrid:
 
         assert_component_equal(result_ag_grid, expected_ag_grid)
 
+    def test_ag_grid_build_infinite_row_model(self):
+        ag_grid = vm.AgGrid(
+            id="ag_grid_id", figure=dash_ag_grid(data_frame=px.data.gapminder(), rowModelType="infinite")
+        )
+        ag_grid.pre_build()
+        ag_grid.build()
+
+        registered_callback = dash._callback.GLOBAL_CALLBACK_LIST[-1]
+        assert registered_callback["output"] == "__input_ag_grid_id.getRowsResponse"
+        assert registered_callback["state"] == [{"id": "__input_ag_grid_id_row_data_id", "property": "data"}]
+
+    def test_ag_grid_build_infinite_row_model_on_page(self):
+        ag_grid = vm.AgGrid(
+            id="ag_grid_id", figure=dash_ag_grid(data_frame=px.data.gapminder(), rowModelType="infinite")
+        )
+        vm.Page(id="page_id", title="Page", components=[ag_grid])
+        ag_grid.pre_build()
+        ag_grid.build()
+
+        registered_callback = dash._callback.GLOBAL_CALLBACK_LIST[-1]
+        assert registered_callback["state"] == [
+            {"id": "__input_ag_grid_id_row_data_id", "property": "data"},
+            {"id": "__on_page_load_action_trigger_page_id", "property": "id"},
+        ]
+
     def test_aggrid_build_title_header_footer(self, standard_ag_grid):
         ag_grid = vm.AgGrid(
             figure=standard_ag_grid, title="Title", header="""#### Subtitle""", footer="""SOURCE: **DATA**"""
@@ -0,0 +1,212 @@
+"""Unit tests for the infinite row model of vizro.models.AgGrid."""
+
+from contextlib import suppress
+
+import pandas as pd
+import pytest
+from dash import no_update
+from dash.exceptions import PreventUpdate
+from flask_caching import Cache
+from pandas.testing import assert_frame_equal
+from plotly.io.json import to_json_plotly
+
+from vizro import Vizro
+from vizro.managers import data_manager
+from vizro.models._components._ag_grid_row_model import (
+    _UNVERSIONED_ROW_DATA_TIMEOUT,
+    _get_rows,
+    _row_data_store,
+    _RowDataStore,
+)
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame(
+        {
+            "country": ["France", "Spain", None, "Chile", "china"],
+            "pop": [67.0, 47.0, 5.0, None, 1400.0],
+            "date": pd.to_datetime(
+                ["2024-01-01 00:00", "2024-01-02 12:00", "2024-01-03 00:00", None, "2024-01-05 00:00"]
+            ),
+        }
+    )
+
+
+@pytest.fixture
+def row_data_id(data):
+    return _row_data_store.set(data)
+
+
+@pytest.fixture
+def simple_cache():
+    data_manager.cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
+    Vizro()
+    yield
+    with suppress(AttributeError):
+        data_manager.cache.clear()
+
+
+def assert_rows_equal(row_data, expected):
+    # Compare as JSON since that's how the rows are sent, and missing values in the records are not equal to themselves.
+    assert to_json_plotly(row_data) == to_json_plotly(expected.to_dict(orient="records"))
+
+
+def get_rows_request(start_row=0, end_row=100, filter_model=None, sort_model=None):
+    return {"startRow": start_row, "endRow": end_row, "filterModel": filter_model or {}, "sortModel": sort_model or []}
+
+
+class TestGetRows:
+    def test_block_of_rows(self, row_data_id, data):
+        result = _get_rows(get_rows_request(start_row=1, end_row=3), row_data_id)
+        assert_rows_equal(result["rowData"], data.iloc[1:3])
+        assert result["rowCount"] == 5
+
+    @pytest.mark.parametrize(
+        "filter_model, expected_rows",
+        [
+            ({"country": {"filterType": "text", "type": "contains", "filter": "CH"}}, [3, 4]),
+            ({"country": {"filterType": "text", "type": "notEqual", "filter": "france"}}, [1, 2, 3, 4]),
+            ({"country": {"filterType": "text", "type": "startsWith", "filter": "s"}}, [1]),
+            ({"country": {"filterType": "text", "type": "blank"}}, [2]),
+            ({"country": {"filterType": "set", "values": ["Spain", "Chile"]}}, [1, 3]),
+            ({"pop": {"filterType": "number", "type": "greaterThanOrEqual", "filter": 47}}, [0, 1, 4]),
+            ({"pop": {"filterType": "number", "type": "inRange", "filter": 5, "filterTo": 67}}, [1]),
+            ({"pop": {"filterType": "number", "type": "notBlank"}}, [0, 1, 2, 4]),
+            ({"date": {"filterType": "date", "type": "blank", "dateFrom": None}}, [3]),
+            ({"date": {"filterType": "date", "type": "equals", "dateFrom": "2024-01-02 00:00:00"}}, [1]),
+            ({"date": {"filterType": "date", "type": "lessThan", "dateFrom": "2024-01-03 00:00:00"}}, [0, 1]),
+            (
+                {
+                    "pop": {
+                        "filterType": "number",
+                        "operator": "OR",
+                        "conditions": [
+                            {"filterType": "number", "type": "lessThan", "filter": 10},
+                            {"filterType": "number", "type": "greaterThan", "filter": 1000},
+                        ],
+                    }
+                },
+                [2, 4],
+            ),
+            (
+                {
+                    "pop": {
+                        "filterType": "number",
+                        "operator": "AND",
+                        "condition1": {"filterType": "number", "type": "greaterThan", "filter": 10},
+                        "condition2": {"filterType": "number", "type": "lessThan", "filter": 100},
+                    },
+                    "country": {"filterType": "text", "type": "notContains", "filter": "fr"},
+                },
+                [1],
+            ),
+        ],
+    )
+    def test_filter_model(self, row_data_id, data, filter_model, expected_rows):
+        result = _get_rows(get_rows_request(filter_model=filter_model), row_data_id)
+        assert_rows_equal(result["rowData"], data.iloc[expected_rows])
+        assert result["rowCount"] == len(expected_rows)
+
+    @pytest.mark.parametrize(
+        "sort_model, expected_rows",
+        [
+            ([{"colId": "pop", "sort": "asc"}], [2, 1, 0, 4, 3]),
+            ([{"colId": "pop", "sort": "desc"}], [4, 0, 1, 2, 3]),
+        ],
+    )
+    def test_sort_model(self, row_data_id, data, sort_model, expected_rows):
+        result = _get_rows(get_rows_request(sort_model=sort_model), row_data_id)
+        assert_rows_equal(result["rowData"], data.iloc[expected_rows])
+
+    def test_filter_and_sort_model_then_block_of_rows(self, row_data_id, data):
+        request = get_rows_request(
+            start_row=1,
+            end_row=2,
+            filter_model={"pop": {"filterType": "number", "type": "greaterThan", "filter": 10}},
+            sort_model=[{"colId": "pop", "sort": "desc"}],
+        )
+        result = _get_rows(request, row_data_id)
+        assert_rows_equal(result["rowData"], data.iloc[[0]])
+        assert result["rowCount"] == 3
+
+    def test_unsupported_filter(self, row_data_id):
+        filter_model = {"pop": {"filterType": "number", "type": "contains", "filter": 1}}
+        with pytest.raises(ValueError, match="AG Grid number filter condition contains is not supported"):
+            _get_rows(get_rows_request(filter_model=filter_model), row_data_id)
+
+    @pytest.mark.parametrize("request_, row_data_id_", [(None, "row_data_id"), ({"startRow": 0, "endRow": 1}, None)])
+    def test_no_request_or_row_data_id(self, request_, row_data_id_):
+        with pytest.raises(PreventUpdate):
+            _get_rows(request_, row_data_id_)
+
+    def test_missing_row_data_id_reloads_page(self, mocker, caplog):
+        set_props = mocker.patch("vizro.models._components._ag_grid_row_model.set_props")
+        result = _get_rows(get_rows_request(), "unknown", "page_trigger_id")
+        assert result is no_update
+        set_props.assert_called_once_with("page_trigger_id", {"data": None})
+        assert "is no longer stored" in caplog.text
+
+    def test_missing_row_data_id_without_reload_trigger(self):
+        with pytest.raises(PreventUpdate):
+            _get_rows(get_rows_request(), "unknown")
+
+
+class TestRowDataStore:
+    def test_missing_row_data_id(self):
+        with pytest.raises(KeyError, match="Data with id unknown does not exist"):
+            _RowDataStore(maxsize=1, maxbytes=10**6, cache_key_prefix="prefix_").get("unknown", {}, [])
+
+    def test_bounded(self, data):
+        row_data_store = _RowDataStore(maxsize=1, maxbytes=10**6, cache_key_prefix="prefix_")
+        row_data_id = row_data_store.set(data)
+        row_data_store.set(data)
+        with pytest.raises(KeyError):
+            row_data_store.get(row_data_id, {}, [])
+
+    def test_bounded_by_size(self, data):
+        row_data_store = _RowDataStore(maxsize=10, maxbytes=data.memory_usage().sum() + 1, cache_key_prefix="prefix_")
+        row_data_id = row_data_store.set(data)
+        large_data = pd.concat([data] * 10)
+        large_row_data_id = row_data_store.set(large_data)
+        with pytest.raises(KeyError):
+            row_data_store.get(row_data_id, {}, [])
+        # The data stored last is kept even though it's larger than maxbytes.
+        assert_frame_equal(row_data_store.get(large_row_data_id, {}, []), large_data)
+
+    def test_cache_timeout(self, data, simple_cache, mocker):
+        cache_set = mocker.spy(data_manager.cache, "set")
+        row_data_id = _RowDataStore(maxsize=1, maxbytes=10**6, cache_key_prefix="prefix_").set(data, timeout=5)
+        cache_set.assert_called_once_with(f"prefix_{row_data_id}", data, timeout=5)
+
+    def test_versioned_data_reused(self, data, simple_cache, mocker):
+        data_manager["data"] = data
+        cache_set = mocker.spy(data_manager.cache, "set")
+        row_data_store = _RowDataStore(maxsize=10, maxbytes=10**6, cache_key_prefix="prefix_")
+        row_data_id = row_data_store.set_data_frame(data_manager["data"].load().iloc[1:], timeout=None)
+
+        # Drawing the grid again with the same rows reuses the stored data, in this process and in others.
+        assert row_data_store.set_data_frame(data_manager["data"].load().iloc[1:], timeout=None) == row_data_id
+        other_row_data_store = _RowDataStore(maxsize=10, maxbytes=10**6, cache_key_prefix="prefix_")
+        assert other_row_data_store.set_data_frame(data_manager["data"].load().iloc[1:], timeout=None) == row_data_id
+        cache_set.assert_called_once()
+
+        # Different rows or columns of the data are stored under different ids.
+        fewer_rows = data_manager["data"].load().iloc[2:]
+        fewer_columns = data_manager["data"].load(columns=["pop"]).iloc[1:]
+        assert row_data_store.set_data_frame(fewer_rows, timeout=None) != row_data_id
+        assert row_data_store.set_data_frame(fewer_columns, timeout=None) != row_data_id
+
+    def test_unversioned_data_timeout(self, data, simple_cache, mocker):
+        cache_set = mocker.spy(data_manager.cache, "set")
+        row_data_store = _RowDataStore(maxsize=10, maxbytes=10**6, cache_key_prefix="prefix_")
+        row_data_id = row_data_store.set_data_frame(data, timeout=None)
+
+        assert row_data_store.set_data_frame(data, timeout=None) != row_data_id
+        cache_set.assert_called_with(mocker.ANY, data, timeout=_UNVERSIONED_ROW_DATA_TIMEOUT)
+
+    def test_shared_through_cache(self, data, simple_cache):
+        row_data_id = _RowDataStore(maxsize=1, maxbytes=10**6, cache_key_prefix="prefix_").set(data)
+        # Another store, like one in a different process, serves the data from the cache.
+        row_data_store = _RowDataStore(maxsize=1, maxbytes=10**6, cache_key_prefix="prefix_")
+        assert_frame_equal(row_data_store.get(row_data_id, {}, []), data)
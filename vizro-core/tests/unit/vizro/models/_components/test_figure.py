@@ -8,8 +8,9 @@ from dash import dcc, html
 from pydantic import ValidationError
 
 import vizro.models as vm
-from vizro.figures import kpi_card
+from vizro.figures import kpi_card, kpi_card_reference
 from vizro.managers import data_manager
+from vizro.models.types import capture
 
 
 @pytest.fixture
@@ -80,6 +81,25 @@ class TestDunderMethodsFigure:
             figure["unknown_args"]
 
 
+class TestFigureReferencedColumns:
+    def test_kpi_card(self, kpi_card_with_str_dataframe):
+        figure = vm.Figure(figure=kpi_card_with_str_dataframe)
+        assert figure._get_referenced_columns({"value_column": "lifeExp", "agg_func": "mean"}) == {"lifeExp"}
+
+    def test_kpi_card_reference(self):
+        figure = vm.Figure(figure=kpi_card_reference("gapminder", value_column="lifeExp", reference_column="pop"))
+        figure_kwargs = {"value_column": "lifeExp", "reference_column": "pop"}
+        assert figure._get_referenced_columns(figure_kwargs) == {"lifeExp", "pop"}
+
+    def test_custom_figure(self, gapminder):
+        @capture("figure")
+        def custom_figure(data_frame, column):
+            return html.Div(str(data_frame[column].max()))
+
+        figure = vm.Figure(figure=custom_figure(gapminder, column="lifeExp"))
+        assert figure._get_referenced_columns({"column": "lifeExp"}) is None
+
+
 class TestProcessFigureDataFrame:
     def test_process_figure_data_frame_str_df(self, kpi_card_with_str_dataframe, gapminder):
         data_manager["gapminder"] = gapminder
@@ -2,7 +2,9 @@
 
 import re
 
+import dash
 import dash_bootstrap_components as dbc
+import pandas as pd
 import plotly.graph_objects as go
 import pytest
 import vizro_dash_components as vdc
@@ -15,6 +17,24 @@ import vizro.models as vm
 import vizro.plotly.express as px
 from vizro.managers import data_manager
 from vizro.models._action._action import Action
+from vizro.models._components._graph_downsampling import _full_resolution_store, _TypedArrayFigure
+from vizro.models._components.graph import _set_render_mode
+from vizro.models.types import capture
+
+small_data = pd.DataFrame({"x": range(20), "y": range(20)})
+small_polar_data = pd.DataFrame({"r": range(20), "t": range(20)})
+large_data = pd.DataFrame({"x": range(2000), "y": range(2000)})
+
+
+@capture("graph")
+def custom_scatter_chart(data_frame):
+    return go.Figure(go.Scatter(x=data_frame["x"], y=data_frame["y"]))
+
+
+@capture("graph")
+def custom_render_mode_chart(data_frame, render_mode="auto"):
+    trace_type = go.Scattergl if render_mode == "webgl" else go.Scatter
+    return go.Figure(trace_type(x=data_frame["x"], y=data_frame["y"]))
 
 
 @pytest.fixture
@@ -77,6 +97,10 @@ class TestGraphInstantiation:
             "description": "tooltip-id-text.children",
         }
 
+    def test_resample_on_zoom_without_max_points(self, standard_px_chart):
+        with pytest.raises(ValidationError, match="`Graph` must have `max_points` set when `resample_on_zoom` is True"):
+            vm.Graph(figure=standard_px_chart, resample_on_zoom=True)
+
     def test_mandatory_figure_missing(self):
         with pytest.raises(ValidationError, match="Field required"):
             vm.Graph()
@@ -257,12 +281,177 @@ class TestDunderMethodsGraph:
 
         assert graph == standard_px_chart
 
+    @pytest.mark.parametrize("resample_on_zoom", [False, True])
+    def test_call_max_points(self, gapminder, resample_on_zoom, mocker):
+        mock_set_props = mocker.patch("vizro.models._components.graph.set_props")
+        graph = vm.Graph(
+            id="graph_id",
+            figure=px.scatter(data_frame=gapminder, x="gdpPercap", y="lifeExp"),
+            max_points=100,
+            resample_on_zoom=resample_on_zoom,
+        )
+        fig = graph.__call__()
+
+        assert len(fig.data[0].x) <= 100
+        if resample_on_zoom:
+            full_resolution_id = mock_set_props.call_args.args[1]["data"]
+            mock_set_props.assert_called_with("graph_id_full_resolution_id", {"data": full_resolution_id})
+            full_resolution = _full_resolution_store.load(full_resolution_id)
+            assert full_resolution["max_points"] == 100
+            assert len(full_resolution["traces"][0]["properties"]["x"]) == len(gapminder)
+        else:
+            mock_set_props.assert_called_once_with("graph_id", {"style": {"visibility": "hidden"}})
+
+    @pytest.mark.parametrize(
+        "figure, webgl_threshold, expected_trace_type",
+        [
+            # plotly express already draws more than 1000 points with WebGL.
+            (px.scatter(data_frame=large_data, x="x", y="y"), 1000, go.Scattergl),
+            (px.scatter(data_frame=large_data, x="x", y="y"), 5000, go.Scatter),
+            (px.scatter(data_frame=large_data, x="x", y="y"), None, go.Scattergl),
+            (
+                px.scatter(data_frame=large_data, x="x", y="y", render_mode="webgl"),
+                5000,
+                go.Scattergl,
+            ),
+            (px.line(data_frame=small_data, x="x", y="y"), 10, go.Scattergl),
+            (
+                px.line(data_frame=small_data, x="x", y="y", line_shape="spline"),
+                10,
+                go.Scatter,
+            ),
+            (px.area(data_frame=small_data, x="x", y="y"), 10, go.Scatter),
+            (px.scatter_polar(data_frame=small_polar_data, r="r", theta="t"), 10, go.Scatterpolargl),
+            # Custom charts are only changed if they opt in with a render_mode argument that is "auto".
+            (custom_scatter_chart(data_frame=small_data), 10, go.Scatter),
+            (custom_render_mode_chart(data_frame=small_data), 10, go.Scattergl),
+            (custom_render_mode_chart(data_frame=small_data), 100, go.Scatter),
+            (custom_render_mode_chart(data_frame=small_data), None, go.Scatter),
+            (custom_render_mode_chart(data_frame=small_data, render_mode="webgl"), 100, go.Scattergl),
+        ],
+    )
+    def test_call_webgl_threshold(self, figure, webgl_threshold, expected_trace_type, mocker):
+        mocker.patch("vizro.models._components.graph.set_props", side_effect=MissingCallbackContextException)
+        graph = vm.Graph(figure=figure)
+        graph._webgl_threshold = webgl_threshold
+        fig = graph.__call__()
+
+        [trace] = fig.data
+        assert type(trace) is expected_trace_type
+
+    def test_call_webgl_threshold_warns_about_dropped_properties(self, mocker, caplog):
+        mocker.patch("vizro.models._components.graph.set_props", side_effect=MissingCallbackContextException)
+
+        @capture("graph")
+        def custom_chart(data_frame, render_mode="auto"):
+            return go.Figure(go.Scatter(x=data_frame["x"], y=data_frame["y"], cliponaxis=False, hoveron="fills"))
+
+        graph = vm.Graph(figure=custom_chart(data_frame=small_data))
+        graph._webgl_threshold = 10
+        fig = graph.__call__()
+
+        assert type(fig.data[0]) is go.Scattergl
+        assert "drops properties that it does not support: cliponaxis, hoveron" in caplog.text
+
+    @pytest.mark.parametrize("webgl_threshold", [10, 100])
+    def test_set_render_mode_unchanged_traces(self, webgl_threshold, caplog):
+        trace_type = go.Scattergl if webgl_threshold == 10 else go.Scatter
+        fig = go.Figure(trace_type(x=small_data["x"], y=small_data["y"]))
+        trace = fig.data[0]
+        _set_render_mode(fig, webgl_threshold)
+
+        # Traces that keep their type are not rebuilt.
+        assert fig.data[0] is trace
+        assert not caplog.text
+
+    def test_set_render_mode_drops_stacking_properties_without_warning(self, caplog):
+        fig = go.Figure(go.Scatter(x=small_data["x"], y=small_data["y"], orientation="v", stackgaps="infer zero"))
+        _set_render_mode(fig, 10)
+
+        # plotly express sets orientation on every scatter trace, but Scattergl has no stacking properties.
+        assert type(fig.data[0]) is go.Scattergl
+        assert not caplog.text
+
+    @pytest.mark.parametrize("plotly_encodes_typed_arrays", [True, False])
+    def test_call_typed_arrays(self, plotly_encodes_typed_arrays, mocker):
+        mocker.patch("vizro.models._components.graph.set_props", side_effect=MissingCallbackContextException)
+        mocker.patch("vizro.models._components.graph._PLOTLY_ENCODES_TYPED_ARRAYS", new=plotly_encodes_typed_arrays)
+        graph = vm.Graph(figure=px.scatter(data_frame=small_data, x="x", y="y"))
+        fig = graph.__call__()
+
+        # With plotly < 6, the figure encodes its numerical arrays as typed arrays itself.
+        assert (type(fig) is _TypedArrayFigure) is not plotly_encodes_typed_arrays
+        assert fig.to_plotly_json()["data"][0]["y"]["dtype"] == "i1"
+
+    def test_call_webgl_threshold_keeps_custom_webgl(self, mocker):
+        mocker.patch("vizro.models._components.graph.set_props", side_effect=MissingCallbackContextException)
+
+        @capture("graph")
+        def custom_chart(data_frame):
+            return go.Figure(go.Scattergl(x=data_frame["x"], y=data_frame["y"], marker_color="red"))
+
+        fig = vm.Graph(figure=custom_chart(data_frame=small_data)).__call__()
+
+        [trace] = fig.data
+        assert type(trace) is go.Scattergl
+        assert trace.marker.color == "red"
+
     def test_graph_trigger(self, standard_px_chart, identity_action_function):
         graph = vm.Graph(id="graph-id", figure=standard_px_chart, actions=[Action(function=identity_action_function())])
         [action] = graph.actions
         assert action._trigger == "graph-id_action_trigger.data"
 
 
+class TestGraphReferencedColumns:
+    @pytest.mark.parametrize(
+        "figure, figure_kwargs, expected_columns",
+        [
+            (
+                px.scatter("gapminder", x="gdpPercap", y="lifeExp", size="pop", color="continent"),
+                {"x": "gdpPercap", "y": "lifeExp", "size": "pop", "color": "continent", "size_max": 60},
+                {"gdpPercap", "lifeExp", "pop", "continent"},
+            ),
+            (
+                px.scatter("gapminder", x="gdpPercap", y="lifeExp"),
+                {"x": "gdpPercap", "y": "lifeExp", "custom_data": ["country"], "hover_data": {"year": True}},
+                {"gdpPercap", "lifeExp", "country", "year"},
+            ),
+            (px.bar("gapminder", x=["pop", "gdpPercap"]), {"x": ["pop", "gdpPercap"]}, {"pop", "gdpPercap"}),
+            (px.histogram("gapminder", y="pop"), {"y": "pop", "x": None}, {"pop"}),
+            (px.pie("gapminder", names="continent"), {"names": "continent"}, {"continent"}),
+            (
+                px.parallel_coordinates("gapminder", dimensions=["pop"]),
+                {"dimensions": ["pop"], "color": "year"},
+                {"pop", "year"},
+            ),
+        ],
+    )
+    def test_plotly_express(self, figure, figure_kwargs, expected_columns):
+        graph = vm.Graph(figure=figure)
+        assert graph._get_referenced_columns(figure_kwargs) == expected_columns
+
+    @pytest.mark.parametrize(
+        "figure, figure_kwargs",
+        [
+            # Wide-form data uses every column.
+            (px.scatter("gapminder"), {}),
+            (px.scatter_matrix("gapminder"), {"color": "continent"}),
+            (px.parallel_coordinates("gapminder"), {}),
+        ],
+    )
+    def test_plotly_express_all_columns(self, figure, figure_kwargs):
+        graph = vm.Graph(figure=figure)
+        assert graph._get_referenced_columns(figure_kwargs) is None
+
+    def test_custom_chart(self, gapminder):
+        @capture("graph")
+        def custom_chart(data_frame, x):
+            return go.Figure(go.Scatter(x=data_frame[x], y=data_frame["lifeExp"]))
+
+        graph = vm.Graph(figure=custom_chart(gapminder, x="gdpPercap"))
+        assert graph._get_referenced_columns({"x": "gdpPercap"}) is None
+
+
 class TestAttributesGraph:
     # Testing at this low implementation level as mocking callback contexts skips checking for creation of these objects
     def test_graph_filter_interaction_attributes(self, standard_px_chart):
@@ -328,6 +517,18 @@ class TestBuildGraph:
         )
         assert_component_equal(graph, expected_graph, keys_to_strip={"id"})
 
+    def test_graph_build_resample_on_zoom(self, standard_px_chart):
+        graph = vm.Graph(id="graph_id", figure=standard_px_chart, max_points=100, resample_on_zoom=True).build()
+
+        assert_component_equal(
+            graph["graph_id_full_resolution_id"], dcc.Store(id="graph_id_full_resolution_id"), keys_to_strip={}
+        )
+        registered_callback = dash._callback.GLOBAL_CALLBACK_LIST[-1]
+        # Outputs that allow duplicates have a suffix after the "@".
+        assert registered_callback["output"].startswith("graph_id.figure@")
+        assert registered_callback["inputs"] == [{"id": "graph_id", "property": "relayoutData"}]
+        assert registered_callback["state"] == [{"id": "graph_id_full_resolution_id", "property": "data"}]
+
     def test_graph_build_title_header_footer(self, standard_px_chart):
         graph = vm.Graph(
             id="graph_id",
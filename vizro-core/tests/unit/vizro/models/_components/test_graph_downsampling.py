@@ -0,0 +1,245 @@
+"""Unit tests for the downsampling of vizro.models.Graph figures."""
+
+import base64
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import pytest
+from dash.exceptions import PreventUpdate
+
+from vizro.models._components._graph_downsampling import (
+    _downsample_figure,
+    _full_resolution_store,
+    _get_lttb_indices,
+    _get_min_max_indices,
+    _resample_on_zoom,
+    _to_typed_array,
+    _TypedArrayFigure,
+)
+
+
+@pytest.fixture
+def time_series():
+    rng = np.random.default_rng(0)
+    n = 10_000
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=n, freq="min"),
+            "value": np.cumsum(rng.normal(size=n)),
+            "category": rng.choice(["a", "b"], size=n),
+        }
+    )
+
+
+def decode_typed_array(value):
+    if not isinstance(value, dict):
+        return value
+    return np.frombuffer(base64.b64decode(value["bdata"]), dtype=np.dtype(value["dtype"]).newbyteorder("<"))
+
+
+def get_operations(patch):
+    operations = patch.to_plotly_json()["operations"]
+    return {tuple(operation["location"]): decode_typed_array(operation["params"]["value"]) for operation in operations}
+
+
+class TestDownsamplingIndices:
+    def test_lttb(self):
+        x = np.arange(1000, dtype=float)
+        y = np.zeros(1000)
+        y[500] = 10
+
+        indices = _get_lttb_indices(x, y, 10)
+
+        assert len(indices) == 10
+        assert indices[0] == 0 and indices[-1] == 999
+        assert 500 in indices
+        assert (np.diff(indices) > 0).all()
+
+    def test_min_max(self):
+        rng = np.random.default_rng(0)
+        x, y = rng.permutation(1000).astype(float), rng.normal(size=1000)
+
+        indices = _get_min_max_indices(x, y, 20)
+
+        assert len(indices) <= 20
+        assert y.argmin() in indices and y.argmax() in indices
+
+
+class TestDownsampleFigure:
+    def test_line(self, time_series):
+        fig = px.line(time_series, x="time", y="value", custom_data=["category"])
+
+        full_resolution = _downsample_figure(fig, 100)
+
+        [trace] = fig.data
+        assert len(trace.x) == len(trace.y) == len(trace.customdata) == 100
+        assert trace.x[0] == time_series["time"].iloc[0] and trace.x[-1] == time_series["time"].iloc[-1]
+        assert set(full_resolution[0]["properties"]) == {"x", "y", "customdata"}
+        assert full_resolution[0]["lines"]
+        np.testing.assert_array_equal(full_resolution[0]["properties"]["y"], time_series["value"])
+
+    def test_scatter(self, time_series):
+        fig = px.scatter(time_series, x="value", y="value", color="category")
+
+        full_resolution = _downsample_figure(fig, 100)
+
+        assert all(len(trace.x) <= 100 for trace in fig.data)
+        assert not full_resolution[0]["lines"]
+
+    @pytest.mark.parametrize(
+        "fig",
+        [
+            go.Figure(go.Scatter(x=list("abc") * 100, y=np.arange(300))),
+            go.Figure(go.Scatter(x=np.arange(300), y=np.arange(300), stackgroup="one")),
+            go.Figure(go.Scatter(x=np.arange(50), y=np.arange(50))),
+            go.Figure(go.Bar(x=np.arange(300), y=np.arange(300))),
+        ],
+    )
+    def test_not_downsampled(self, fig):
+        expected_fig = go.Figure(fig)
+        assert _downsample_figure(fig, 100) == {}
+        assert fig == expected_fig
+
+    @pytest.mark.parametrize("histnorm", [None, "percent"])
+    def test_histogram(self, time_series, histnorm):
+        fig = px.histogram(time_series, x="value", color="category", nbins=20, histnorm=histnorm)
+
+        assert _downsample_figure(fig, 100) == {}
+
+        assert [trace.histfunc for trace in fig.data] == ["sum", "sum"]
+        assert fig.data[0].xbins == fig.data[1].xbins
+        assert fig.data[0].xbins.start == time_series["value"].min()
+        assert fig.data[0].xbins.end == time_series["value"].max()
+        assert sum(trace.y.sum() for trace in fig.data) == len(time_series)
+        assert all(len(trace.x) <= 20 for trace in fig.data)
+
+    def test_density_heatmap(self, time_series):
+        fig = px.density_heatmap(time_series.assign(index=np.arange(10_000)), x="value", y="index", nbinsx=10)
+
+        _downsample_figure(fig, 100)
+
+        [trace] = fig.data
+        assert trace.histfunc == "sum"
+        assert trace.z.sum() == len(time_series)
+        assert len(trace.x) == len(trace.y) == len(trace.z) <= 10 * 100
+
+    def test_small_histogram(self, time_series):
+        fig = px.histogram(time_series.head(50), x="value")
+        _downsample_figure(fig, 100)
+        assert fig.data[0].histfunc is None
+
+
+class TestToTypedArray:
+    @pytest.mark.parametrize(
+        "values, expected_dtype",
+        [
+            (np.array([0.5, -1.5, np.nan]), "f8"),
+            (np.array([0.5, -1.5], dtype="float32"), "f4"),
+            (np.array([1, -100]), "i1"),
+            (np.array([1, 1000]), "i2"),
+            (np.array([1, 100_000]), "i4"),
+            (np.array([1, 200], dtype="uint64"), "u1"),
+            (np.array([1, 2], dtype=">f8"), "f8"),
+        ],
+    )
+    def test_numerical(self, values, expected_dtype):
+        typed_array = _to_typed_array(values)
+        assert typed_array["dtype"] == expected_dtype
+        np.testing.assert_array_equal(decode_typed_array(typed_array), values)
+
+    def test_shape(self):
+        typed_array = _to_typed_array(np.arange(6, dtype=float).reshape(3, 2))
+        assert typed_array["shape"] == "3, 2"
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            np.array([1, 2**40]),
+            np.array(["a", "b"], dtype=object),
+            pd.date_range("2024-01-01", periods=2).to_numpy(),
+            np.array([True, False]),
+            np.array([], dtype=float),
+        ],
+    )
+    def test_not_typed_array(self, values):
+        assert _to_typed_array(values) is values
+
+
+class TestTypedArrayFigure:
+    def test_numerical_arrays_encoded(self, mocker):
+        # With plotly < 6, the JSON of a figure contains numpy arrays rather than typed arrays.
+        trace = {
+            "type": "scatter",
+            "x": np.array([1, 2]),
+            "y": np.array([0.5, 1.5]),
+            "text": np.array(["a", "b"], dtype=object),
+            "marker": {"size": np.array([3, 4]), "color": "red"},
+        }
+        mocker.patch.object(
+            go.Figure, "to_plotly_json", return_value={"data": [trace], "layout": {}, "frames": [{"data": [trace]}]}
+        )
+        figure = _TypedArrayFigure().to_plotly_json()
+
+        for encoded_trace in [figure["data"][0], figure["frames"][0]["data"][0]]:
+            assert encoded_trace["x"]["dtype"] == "i1"
+            np.testing.assert_array_equal(decode_typed_array(encoded_trace["y"]), [0.5, 1.5])
+            np.testing.assert_array_equal(decode_typed_array(encoded_trace["marker"]["size"]), [3, 4])
+            assert encoded_trace["marker"]["color"] == "red"
+            assert encoded_trace["text"] is trace["text"]
+
+
+class TestResampleOnZoom:
+    @pytest.fixture
+    def full_resolution_id(self, time_series):
+        fig = px.line(time_series, x="time", y="value")
+        return _full_resolution_store.set({"max_points": 100, "traces": _downsample_figure(fig, 100)})
+
+    @pytest.mark.parametrize(
+        "relayout_data",
+        [
+            {"xaxis.range[0]": "2024-01-01 01:00:00", "xaxis.range[1]": "2024-01-01 01:30:00.5"},
+            {"xaxis.range": ["2024-01-01 01:00:00", "2024-01-01 01:30:00.5"]},
+        ],
+    )
+    def test_zoom_in(self, full_resolution_id, time_series, relayout_data):
+        operations = get_operations(_resample_on_zoom(relayout_data, full_resolution_id))
+
+        # All points in the range are drawn, together with the points next to it.
+        expected_x = time_series["time"].iloc[59:92].to_numpy()
+        np.testing.assert_array_equal(operations["data", 0, "x"], expected_x)
+        np.testing.assert_array_equal(operations["data", 0, "y"], time_series["value"].iloc[59:92])
+
+    def test_numerical_values_sent_as_typed_arrays(self, full_resolution_id):
+        operations = _resample_on_zoom({"xaxis.autorange": True}, full_resolution_id).to_plotly_json()["operations"]
+        values = {operation["location"][-1]: operation["params"]["value"] for operation in operations}
+        assert values["y"]["dtype"] == "f8"
+        # Dates are not numerical and so are sent as they are.
+        assert isinstance(values["x"], np.ndarray)
+
+    def test_zoom_in_downsampled_again(self, full_resolution_id):
+        relayout_data = {"xaxis.range[0]": "2024-01-02", "xaxis.range[1]": "2024-01-04"}
+        operations = get_operations(_resample_on_zoom(relayout_data, full_resolution_id))
+        assert len(operations["data", 0, "x"]) == 100
+
+    def test_zoom_out(self, full_resolution_id, time_series):
+        operations = get_operations(_resample_on_zoom({"xaxis.autorange": True}, full_resolution_id))
+        assert len(operations["data", 0, "x"]) == 100
+        assert operations["data", 0, "x"][-1] == time_series["time"].iloc[-1]
+
+    @pytest.mark.parametrize(
+        "relayout_data, full_resolution_id",
+        [
+            (None, "full_resolution_id"),
+            ({"xaxis.autorange": True}, None),
+            ({"xaxis.autorange": True}, "unknown"),
+            ({"autosize": True}, "full_resolution_id"),
+            ({"yaxis.range[0]": 0, "yaxis.range[1]": 1}, "full_resolution_id"),
+        ],
+    )
+    def test_no_update(self, relayout_data, full_resolution_id, request):
+        if full_resolution_id == "full_resolution_id":
+            full_resolution_id = request.getfixturevalue("full_resolution_id")
+        with pytest.raises(PreventUpdate):
+            _resample_on_zoom(relayout_data, full_resolution_id)
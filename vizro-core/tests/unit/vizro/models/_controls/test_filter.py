@@ -1,4 +1,5 @@
 import functools
+import uuid
 from datetime import date, datetime, time
 from typing import Literal
 
@@ -13,17 +14,27 @@ import vizro.plotly.express as px
 from vizro import Vizro
 from vizro.actions._update_targets import update_targets
 from vizro.managers import data_manager, model_manager
+from vizro.managers._data_manager import _set_data_version
 from vizro.models._controls.filter import (
     Filter,
     _coerce_temporal,
+    _combine_codes,
     _dataframe_path_to_cascader_options,
     _ensure_path_in_tree,
     _filter_between,
     _filter_hierarchical_isin,
     _filter_isin,
+    _get_series_column_type,
 )
 
 
+# Filter functions give the same result whether or not they're given a data version, which makes them use indexes that
+# are cached per data version. A new data version is used for each test since each test uses different data.
+@pytest.fixture(params=[False, True], ids=["without_data_version", "with_data_version"])
+def data_version(request):
+    return uuid.uuid4().hex if request.param else None
+
+
 @pytest.fixture
 def managers_column_different_type():
     """Instantiates the managers with a page and two graphs sharing the same column but of different data types."""
@@ -225,12 +236,14 @@ class TestFilterFunctions:
             ([1, 2, 3, 4, 5], [4, 2], [False, False, False, False, False]),  # Test for inverted values
             ([], [2, 4], pd.Series([], dtype=bool)),  # Test for empty series
             ([1.1, 2.2, 3.3, 4.4, 5.5], [2.1, 4.5], [False, True, True, True, False]),  # Test with float data
+            ([5, 1, 4, 2, 3], [2, 4], [False, False, True, True, True]),  # Test with unsorted data
+            ([1, None, 3, None, 5], [1, 5], [True, False, True, False, True]),  # Test with missing data
         ],
     )
-    def test_filter_between(self, data, value, expected):
+    def test_filter_between(self, data, value, expected, data_version):
         series = pd.Series(data)
         expected = pd.Series(expected)
-        result = _filter_between(series, value)
+        result = _filter_between(series, value, data_version)
         pd.testing.assert_series_equal(result, expected)
 
     @pytest.mark.parametrize(
@@ -300,10 +313,10 @@ class TestFilterFunctions:
             ),
         ],
     )
-    def test_filter_between_date(self, data, value, expected):
+    def test_filter_between_date(self, data, value, expected, data_version):
         series = pd.Series(data)
         expected = pd.Series(expected)
-        result = _filter_between(series, value)
+        result = _filter_between(series, value, data_version)
         pd.testing.assert_series_equal(result, expected)
 
     @pytest.mark.parametrize(
@@ -379,12 +392,24 @@ class TestFilterFunctions:
                 ["09:00", "11:00"],
                 [False, False, True],
             ),
+            # Midnight-crossing range on a datetime column with nulls
+            (
+                [datetime(2024, 1, 1, 23, 30), pd.NaT, datetime(2024, 1, 2, 12, 0)],
+                ["23:00", "01:00"],
+                [True, False, False],
+            ),
+            # Timezone-aware datetime column is filtered on local wall-clock time
+            (
+                pd.to_datetime(["2024-01-01 08:00", "2024-01-01 10:00"]).tz_localize("Europe/Paris"),
+                ["09:00", "11:00"],
+                [False, True],
+            ),
         ],
     )
-    def test_filter_between_time(self, data, value, expected):
+    def test_filter_between_time(self, data, value, expected, data_version):
         series = pd.Series(data)
         expected = pd.Series(expected)
-        result = _filter_between(series, value)
+        result = _filter_between(series, value, data_version)
         pd.testing.assert_series_equal(result, expected)
 
     @pytest.mark.parametrize(
@@ -409,10 +434,10 @@ class TestFilterFunctions:
             ([False, True, False, True], [1], [False, True, False, True]),  # True/False data filtered with 1
         ],
     )
-    def test_filter_isin(self, data, value, expected):
+    def test_filter_isin(self, data, value, expected, data_version):
         series = pd.Series(data)
         expected = pd.Series(expected)
-        result = _filter_isin(series, value)
+        result = _filter_isin(series, value, data_version)
         pd.testing.assert_series_equal(result, expected)
 
     @pytest.mark.parametrize(
@@ -480,10 +505,10 @@ class TestFilterFunctions:
             ),
         ],
     )
-    def test_filter_isin_date(self, data, value, expected):
+    def test_filter_isin_date(self, data, value, expected, data_version):
         series = pd.Series(data)
         expected = pd.Series(expected)
-        result = _filter_isin(series, value)
+        result = _filter_isin(series, value, data_version)
         pd.testing.assert_series_equal(result, expected)
 
     @pytest.mark.parametrize(
@@ -584,10 +609,10 @@ class TestFilterFunctions:
             ),
         ],
     )
-    def test_filter_isin_time(self, data, value, expected):
+    def test_filter_isin_time(self, data, value, expected, data_version):
         series = pd.Series(data)
         expected = pd.Series(expected)
-        result = _filter_isin(series, value)
+        result = _filter_isin(series, value, data_version)
         pd.testing.assert_series_equal(result, expected)
 
     @pytest.mark.parametrize(
@@ -1260,6 +1285,74 @@ class TestFilterCall:
                 current_value=["a", "b"],
             )
 
+    def test_filter_call_caches_targeted_data_per_data_version(self, target_to_data_frame, mocker):
+        filter = vm.Filter(
+            column="column_categorical",
+            targets=["column_categorical_exists_1", "column_categorical_exists_2"],
+            selector=vm.Checklist(id="test_selector_id"),
+        )
+        model_manager["test_page"].controls = [filter]
+        filter.pre_build()
+        spy = mocker.spy(filter, "_validate_targeted_data")
+        target_to_data_frame = {
+            target: _set_data_version(data_frame, uuid.uuid4().hex)
+            for target, data_frame in target_to_data_frame.items()
+        }
+
+        first_build = filter(target_to_data_frame=target_to_data_frame, current_value=["d"])["test_selector_id"]
+        second_build = filter(target_to_data_frame=target_to_data_frame, current_value=["e"])["test_selector_id"]
+
+        spy.assert_called_once()
+        assert [option["value"] for option in first_build.options] == ["a", "b", "c", "d"]
+        assert [option["value"] for option in second_build.options] == ["a", "b", "c", "e"]
+
+    def test_filter_call_numerical_selector_caches_min_max_per_data_version(self, target_to_data_frame, mocker):
+        filter = vm.Filter(
+            column="column_numerical",
+            targets=["column_numerical_exists_1", "column_numerical_exists_2"],
+            selector=vm.RangeSlider(id="test_selector_id"),
+        )
+        model_manager["test_page"].controls = [filter]
+        filter.pre_build()
+        spy = mocker.spy(filter, "_validate_targeted_data")
+        target_to_data_frame = {
+            target: _set_data_version(data_frame, uuid.uuid4().hex)
+            for target, data_frame in target_to_data_frame.items()
+        }
+
+        first_build = filter(target_to_data_frame=target_to_data_frame, current_value=[3, 4])["test_selector_id"]
+        second_build = filter(target_to_data_frame=target_to_data_frame, current_value=[0, 2])["test_selector_id"]
+
+        spy.assert_called_once()
+        assert (first_build.min, first_build.max) == (1, 4)
+        assert (second_build.min, second_build.max) == (0, 3)
+
+    def test_filter_call_selectors_on_same_column_do_not_share_targeted_data(self):
+        target_to_data_frame = {
+            "column_numerical_exists_1": _set_data_version(
+                pd.DataFrame({"column_numerical": [1, 2, 3, 4]}), uuid.uuid4().hex
+            )
+        }
+        range_slider_filter = vm.Filter(
+            column="column_numerical",
+            targets=["column_numerical_exists_1"],
+            selector=vm.RangeSlider(id="range_slider_id"),
+        )
+        dropdown_filter = vm.Filter(
+            column="column_numerical",
+            targets=["column_numerical_exists_1"],
+            selector=vm.Dropdown(id="dropdown_id"),
+        )
+        model_manager["test_page"].controls = [range_slider_filter, dropdown_filter]
+        range_slider_filter.pre_build()
+        dropdown_filter.pre_build()
+
+        range_slider = range_slider_filter(target_to_data_frame=target_to_data_frame, current_value=[1, 4])
+        dropdown = dropdown_filter(target_to_data_frame=target_to_data_frame, current_value=[1])
+
+        assert (range_slider["range_slider_id"].min, range_slider["range_slider_id"].max) == (1, 4)
+        assert [option["value"] for option in dropdown["dropdown_id"].options] == [1, 2, 3, 4]
+
 
 class TestFilterPreBuildMethod:
     def test_filter_not_in_page(self):
@@ -1500,6 +1593,57 @@ class TestFilterPreBuildMethod:
         ):
             filter.pre_build()
 
+    @pytest.mark.parametrize(
+        "series, expected",
+        [
+            (pd.Series([True, False]), "boolean"),
+            (pd.Series([1, 2], dtype="Int64"), "numerical"),
+            (pd.Series(["a", None], dtype="string"), "categorical"),
+            (pd.Series(pd.to_datetime(["2024-01-01", None])), "date"),
+            (pd.Series(pd.to_datetime(["2024-01-01"] * 2000 + ["2024-01-01 10:00"], format="mixed")), "datetime"),
+            (pd.Series(pd.to_datetime(["2024-01-01 23:00"]).tz_localize("UTC").tz_convert("Asia/Tokyo")), "datetime"),
+            (pd.Series(pd.to_datetime(["2024-01-01"]).tz_localize("Asia/Tokyo")), "date"),
+            (pd.Series([None] * 2000 + [time(10, 0)]), "time"),
+            (pd.Series([time(10, 0)] * 2000 + ["10:00"]), "categorical"),
+            (pd.Series([None, None], dtype=object), "categorical"),
+        ],
+    )
+    def test_get_series_column_type(self, series, expected):
+        # Values after the first _COLUMN_TYPE_SAMPLE_SIZE still count when the sample doesn't decide the type.
+        assert _get_series_column_type(series) == expected
+
+    def test_validate_column_type_cached_per_data_version(self, mocker):
+        filter = vm.Filter(column="column_date")
+        spy = mocker.patch("vizro.models._controls.filter._get_series_column_type", wraps=_get_series_column_type)
+        targeted_data = pd.DataFrame({"target": pd.to_datetime(["2024-01-01", "2024-01-02"])})
+        data_versions = {"target": uuid.uuid4().hex}
+
+        for _ in range(2):
+            assert filter._validate_column_type(targeted_data, data_versions) == "date"
+
+        spy.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "target, selector, value, expected",
+        [
+            ("column_categorical", vm.Checklist(), ["a", "b"], [("shared_column", "in", ["a", "b"])]),
+            ("column_categorical", vm.RadioItems(), "a", [("shared_column", "==", "a")]),
+            ("column_numerical", vm.RangeSlider(), [0, 1], [("shared_column", ">=", 0), ("shared_column", "<=", 1)]),
+            ("column_numerical", vm.Slider(), 1, [("shared_column", "==", 1)]),
+            # A missing value means there's no filtering to do.
+            ("column_categorical", vm.Checklist(), ["a", None], None),
+            ("column_numerical", vm.RangeSlider(), [None, 1], None),
+            # Filters on other types of column aren't given as predicates.
+            ("column_date", vm.DatePicker(), ["2024-01-01", "2024-01-02"], None),
+            ("column_boolean", vm.Switch(), True, None),
+        ],
+    )
+    def test_get_filter_predicates(self, target, selector, value, expected, managers_column_different_type):
+        filter = vm.Filter(column="shared_column", targets=[target], selector=selector)
+        model_manager["test_page"].controls = [filter]
+        filter.pre_build()
+        assert filter._get_filter_predicates(value) == expected
+
     @pytest.mark.usefixtures("managers_one_page_two_graphs")
     def test_filter_is_not_dynamic(self):
         filter = vm.Filter(column="continent")
@@ -1935,6 +2079,35 @@ class TestFilterHierarchicalColumn:
         df = pd.DataFrame({"code": [1, 2], "leaf": ["a", "b"]})
         assert _dataframe_path_to_cascader_options(df, ["code", "leaf"]) == {"1": ["a"], "2": ["b"]}
 
+    def test_dataframe_path_to_cascader_options_nulls(self):
+        # A null branch label drops the row; a branch whose leaves are all null is kept with no leaves.
+        df = pd.DataFrame({"a": ["X", None, "Y", "Y"], "b": ["p", "q", None, "r"], "c": [1, 2, 3, None]})
+        assert _dataframe_path_to_cascader_options(df, ["a", "b", "c"]) == {"X": {"p": [1.0]}, "Y": {"r": []}}
+
+    def test_dataframe_path_to_cascader_options_categorical_leaves_sorted_by_value(self):
+        df = pd.DataFrame({"a": ["X", "X"], "b": pd.Categorical(["p", "q"], categories=["q", "p"])})
+        assert list(_dataframe_path_to_cascader_options(df, ["a", "b"])["X"]) == ["p", "q"]
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            # Leaves of different types in different branches are never sorted together.
+            ({"a": ["c", "a", "a"], "b": [1, "x", "y"]}, {"a": ["x", "y"], "c": [1]}),
+            # Branch labels of different types.
+            ({"a": [2, "x", 1, "x"], "b": ["p", "q", "r", "s"]}, {"1": ["r"], "2": ["p"], "x": ["q", "s"]}),
+            # Leaves that are equal but not identical keep their own value in each branch.
+            ({"a": ["a", "b", "c"], "b": [1.0, 1, True]}, {"a": [1.0], "b": [1], "c": [True]}),
+        ],
+    )
+    def test_dataframe_path_to_cascader_options_mixed_types(self, data, expected):
+        df = pd.DataFrame({column: pd.Series(values, dtype=object) for column, values in data.items()})
+        options = _dataframe_path_to_cascader_options(df, ["a", "b"])
+        assert options == expected
+        assert list(options) == list(expected)
+        assert [type(leaf) for leaves in options.values() for leaf in leaves] == [
+            type(leaf) for leaves in expected.values() for leaf in leaves
+        ]
+
     @pytest.mark.parametrize(
         "tree, path, expected",
         [
@@ -1962,6 +2135,13 @@ class TestFilterHierarchicalColumn:
         _ensure_path_in_tree(tree, path)
         assert tree == expected
 
+    def test_ensure_path_in_tree_does_not_change_nested_nodes(self):
+        tree = {"As": {"East": ["JP"]}}
+        shallow_copy = dict(tree)
+        _ensure_path_in_tree(shallow_copy, ["As", "East", "KR"])
+        assert shallow_copy == {"As": {"East": ["JP", "KR"]}}
+        assert tree == {"As": {"East": ["JP"]}}
+
     @pytest.mark.parametrize(
         "value, multi, expected",
         [
@@ -1994,7 +2174,7 @@ class TestFilterHierarchicalColumn:
             "multi_skips_empty_entry",
         ],
     )
-    def test_filter_hierarchical_isin(self, value, multi, expected):
+    def test_filter_hierarchical_isin(self, value, multi, expected, data_version):
         # "Portland" appears under both North and South, so only the full path disambiguates the two.
         df = pd.DataFrame(
             {
@@ -2002,9 +2182,37 @@ class TestFilterHierarchicalColumn:
                 "city": ["Portland", "Salem", "Portland", "Austin"],
             }
         )
-        result = _filter_hierarchical_isin(df[["region", "city"]], value, multi=multi)
+        result = _filter_hierarchical_isin(df[["region", "city"]], value, data_version, multi=multi)
+        assert result.tolist() == expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ([["2", "2024"]], [True, False, False, False]),
+            ([["2.0", "2024"]], [False, True, False, False]),
+            ([["nan", "2024"], ["None", "2024"]], [False, False, False, False]),
+            ([["2", "2024"], ["2.0", "2024"], ["2", "2025"]], [True, True, False, True]),
+            ([["2", "2024", "extra"]], [True, False, False, False]),
+        ],
+    )
+    def test_filter_hierarchical_isin_branch_compared_as_str(self, value, expected, data_version):
+        # Branch values are compared as strings, so 2 and 2.0 are different branches and nulls match no branch.
+        df = pd.DataFrame(
+            {"branch": pd.Series([2, 2.0, None, 2], dtype=object), "leaf": ["2024", "2024", "2024", "2025"]}
+        )
+        result = _filter_hierarchical_isin(df, value, data_version, multi=True)
         assert result.tolist() == expected
 
+    def test_filter_hierarchical_isin_reuses_derived_data(self, mocker):
+        df = pd.DataFrame({"region": ["North", "South"], "city": ["Portland", "Portland"]})
+        spy = mocker.patch("vizro.models._controls.filter._combine_codes", wraps=_combine_codes)
+        data_version = uuid.uuid4().hex
+
+        for value in [[["North", "Portland"]], [["South", "Portland"]]]:
+            _filter_hierarchical_isin(df, value, data_version, multi=True)
+
+        spy.assert_called_once()
+
     def test_hierarchical_pre_build_populates_options_and_action_path_mode(self, managers_hierarchical_page):
         f = vm.Filter(
             column=["continent", "country"],
@@ -2199,6 +2407,32 @@ class TestFilterHierarchicalColumn:
         selector_build = f(target_to_data_frame={"hier_graph": new_df}, current_value=["FR"])["test_selector_id"]
         assert selector_build.options == {"As": ["JP"], "Eu": ["DE", "FR"]}
 
+    def test_hierarchical_call_caches_options_per_data_version(self, managers_hierarchical_page, mocker):
+        f = vm.Filter(
+            column=["continent", "country"],
+            targets=["hier_graph"],
+            selector=vm.Cascader(
+                id="test_selector_id", multi=True, full_path=True, options={"Eu": ["DE", "FR"], "As": ["JP"]}
+            ),
+        )
+        model_manager["test_page"].controls = [f]
+        f.pre_build()
+        spy = mocker.patch(
+            "vizro.models._controls.filter._dataframe_path_to_cascader_options",
+            wraps=_dataframe_path_to_cascader_options,
+        )
+
+        new_df = _set_data_version(
+            pd.DataFrame({"continent": ["Eu", "As"], "country": ["DE", "JP"], "gdp": [1.0, 2.0]}), uuid.uuid4().hex
+        )
+        stale_build = f(target_to_data_frame={"hier_graph": new_df}, current_value=[["Eu", "FR"]])
+        build = f(target_to_data_frame={"hier_graph": new_df}, current_value=None)
+
+        spy.assert_called_once()
+        # Re-inserting the stale path must not change the cached options.
+        assert stale_build["test_selector_id"].options == {"As": ["JP"], "Eu": ["DE", "FR"]}
+        assert build["test_selector_id"].options == {"As": ["JP"], "Eu": ["DE"]}
+
 
 class TestFilterBuild:
     """Tests filter build method."""
@@ -24,6 +24,7 @@ class TestDashboardInstantiation:
         assert dashboard.pages == [page_1, page_2]
         assert dashboard.theme == "vizro_dark"
         assert dashboard.title == ""
+        assert dashboard.webgl_threshold == 1000
         assert isinstance(dashboard.navigation, vm.Navigation)
         assert dashboard.navigation.pages == [page_1.id, page_2.id]
 
@@ -284,6 +285,12 @@ class TestDashboardPreBuild:
         Vizro(assets_folder=tmp_path)
         vm.Dashboard(pages=[page_1]).pre_build()
 
+    @pytest.mark.parametrize("webgl_threshold", [5000, None])
+    def test_webgl_threshold(self, vizro_app, standard_px_chart, webgl_threshold):
+        graph = vm.Graph(figure=standard_px_chart)
+        vm.Dashboard(pages=[vm.Page(title="Page", components=[graph])], webgl_threshold=webgl_threshold).pre_build()
+        assert graph._webgl_threshold == webgl_threshold
+
     def test_make_page_404_layout(self, page_1, vizro_app):
         # vizro_app fixture is needed to avoid mocking out get_relative_path.
         expected = html.Div(
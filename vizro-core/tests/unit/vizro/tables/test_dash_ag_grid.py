@@ -3,6 +3,7 @@ import pandas as pd
 from asserts import assert_component_equal
 from pandas import Timestamp
 
+import vizro.tables._dash_ag_grid
 from vizro.models.types import capture
 from vizro.tables import dash_ag_grid
 
@@ -53,6 +54,13 @@ class TestDashAgGrid:
         )
         # skipping only dashGridOptions as this is mostly our defaults for data formats, and would crowd the tests
 
+    def test_dash_ag_grid_infinite_row_model(self, mocker):
+        to_records = mocker.spy(vizro.tables._dash_ag_grid, "_to_records")
+        grid = dash_ag_grid(data_frame=data, rowModelType="infinite")()
+        assert grid.rowModelType == "infinite"
+        assert not hasattr(grid, "rowData")
+        to_records.assert_not_called()
+
     def test_custom_dash_ag_grid(self):
         @capture("ag_grid")
         def custom_dash_ag_grid(data_frame):
@@ -1,6 +1,9 @@
+import numpy as np
+import pandas as pd
 import pytest
+from plotly.io.json import to_json_plotly
 
-from vizro._vizro_utils import _set_defaults_nested
+from vizro._vizro_utils import _set_defaults_nested, _to_records
 
 
 @pytest.fixture
@@ -20,3 +23,26 @@ def default_dictionary():
 )
 def test_set_defaults_nested(default_dictionary, input, expected):
     assert _set_defaults_nested(input, default_dictionary) == expected
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([1, 2], [1, 2]),
+        ([True, False], [True, False]),
+        ([1.5, np.nan, np.inf], [1.5, None, None]),
+        (["a", None], ["a", None]),
+        (pd.array([1, None], dtype="Int64"), [1, None]),
+        (pd.Categorical(["a", None]), ["a", None]),
+        (
+            pd.to_datetime(["2021-01-01 00:00:00", "2021-01-01 10:00:00.5", None], format="mixed"),
+            ["2021-01-01T00:00:00", "2021-01-01T10:00:00.500000", None],
+        ),
+        (pd.to_datetime(["2021-01-01"]).tz_localize("UTC"), [pd.Timestamp("2021-01-01", tz="UTC")]),
+    ],
+)
+def test_to_records(values, expected):
+    data_frame = pd.DataFrame({"column": values})
+    records = _to_records(data_frame)
+    assert records == [{"column": value} for value in expected]
+    assert to_json_plotly(records) == to_json_plotly(data_frame.to_dict(orient="records"))